@@ -0,0 +1,111 @@
+# adapters/cache_memory.py
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional, Tuple
+import sys
+import threading
+import time
+
+from adapters.cache_sqlite import Key
+
+# Rough per-entry bookkeeping cost (Key object, OrderedDict node, tuple)
+_ENTRY_OVERHEAD = 200
+
+
+class MemoryCache:
+    """
+    In-process LRU for translations with a per-entry TTL and an
+    approximate memory cap (string sizes + fixed per-entry overhead).
+    Least recently used entries are evicted once max_bytes is exceeded.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 16 * 1024 * 1024,
+        ttl_seconds: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        # key -> (translated_text, expires_at, size)
+        self._entries: "OrderedDict[Key, Tuple[str, float, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def _size(key: Key, value: str) -> int:
+        return sys.getsizeof(key.source_text) + sys.getsizeof(value) + _ENTRY_OVERHEAD
+
+    def _get_locked(self, key: Key, now: float) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        value, expires_at, size = entry
+        if expires_at <= now:
+            del self._entries[key]
+            self.bytes -= size
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def _put_locked(self, key: Key, value: str, now: float) -> None:
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes -= old[2]
+
+        size = self._size(key, value)
+        self._entries[key] = (value, now + self.ttl_seconds, size)
+        self.bytes += size
+
+        while self.bytes > self.max_bytes and self._entries:
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self.bytes -= evicted_size
+            self.evictions += 1
+
+    def get(self, key: Key) -> Optional[str]:
+        with self._lock:
+            return self._get_locked(key, self._clock())
+
+    def put(self, key: Key, translated_text: str) -> None:
+        with self._lock:
+            self._put_locked(key, translated_text, self._clock())
+
+    def get_many(self, keys: Iterable[Key]) -> Dict[Key, str]:
+        found: Dict[Key, str] = {}
+        with self._lock:
+            now = self._clock()
+            for key in keys:
+                value = self._get_locked(key, now)
+                if value is not None:
+                    found[key] = value
+        return found
+
+    def put_many(self, items: Iterable[Tuple[Key, str]]) -> None:
+        with self._lock:
+            now = self._clock()
+            for key, translated_text in items:
+                self._put_locked(key, translated_text, now)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
@@ -0,0 +1,94 @@
+# adapters/cache_response.py
+from collections import OrderedDict
+from typing import Dict, Optional
+import hashlib
+import threading
+
+
+def response_key(text: str, study_lang: str, native_lang: str, version: str, **options) -> str:
+    """
+    Hash of the text plus everything else the response depends on.
+    `version` should change whenever the model or dictionaries do; request
+    options that change the output (omit_none=..., aggregate=...) go in
+    `options`.
+
+    The text is hashed exactly as given (callers strip it). It is not
+    whitespace- or Unicode-normalized, because cards quote it back in
+    example_sentence: a differently formatted submission must not get
+    another submission's sentences.
+    """
+    h = hashlib.sha256()
+    parts = [version, study_lang, native_lang]
+    parts.extend(f"{name}={value!r}" for name, value in sorted(options.items()))
+    parts.append(text)
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\x1f")
+    return h.hexdigest()
+
+
+class ResponseCache:
+    """
+    In-process LRU of serialized API responses (bytes), bounded by both
+    entry count and total size.
+    """
+
+    def __init__(self, max_entries: int = 1000, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def peek(self, key: str) -> Optional[bytes]:
+        """get() without counting a hit or miss or refreshing the entry."""
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key: str, body: bytes) -> None:
+        # A single response bigger than the whole budget isn't worth keeping
+        if len(body) > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= len(old)
+            self._entries[key] = body
+            self.bytes += len(body)
+
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.bytes -= len(evicted)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+            }
@@ -1,7 +1,45 @@
 # adapters/cache_sqlite.py
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+import json
+import os
 import sqlite3
+import threading
+
+# SQL is kept in constants so every call sends the exact same text and
+# sqlite3's per-connection statement cache reuses the prepared statement.
+_SELECT_ONE = """
+    SELECT translated_text
+    FROM translations
+    WHERE source_text = ?
+      AND study_lang  = ?
+      AND native_lang = ?
+    LIMIT 1
+"""
+
+# The word list is passed as one JSON array parameter, so this is a single
+# fixed statement no matter how many words are looked up.
+_SELECT_MANY = """
+    SELECT source_text, translated_text
+    FROM translations
+    WHERE study_lang  = ?
+      AND native_lang = ?
+      AND source_text IN (SELECT value FROM json_each(?))
+"""
+
+_UPSERT = """
+    INSERT OR REPLACE INTO translations
+        (source_text, study_lang, native_lang, translated_text, created_at, last_accessed)
+    VALUES (?, ?, ?, ?, datetime('now'), datetime('now'))
+"""
+
+_TOUCH_MANY = """
+    UPDATE translations
+    SET last_accessed = datetime('now')
+    WHERE study_lang  = ?
+      AND native_lang = ?
+      AND source_text IN (SELECT value FROM json_each(?))
+"""
 
 @dataclass(frozen=True)
 class Key:
@@ -10,15 +48,60 @@ class Key:
     native_lang: str        # e.g., "en"
 
 class TranslationCache:
-    def __init__(self, db_path: str = "translations.db"):
+    """
+    SQLite-backed translation cache.
+
+    Each thread gets its own long-lived connection (FastAPI runs sync
+    handlers in a threadpool), and the database runs in WAL mode so readers
+    don't block behind a writer.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "translations.db",
+        cache_size_kb: int = 8192,
+        busy_timeout: float = 5.0,
+    ):
         self.db_path = db_path
+        self.cache_size_kb = cache_size_kb
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._all_connections: List[sqlite3.Connection] = []
+        self._all_lock = threading.Lock()
         self._ensure_schema()
 
-    def _connection(self):
-        return sqlite3.connect(self.db_path)
+    def _connection(self) -> sqlite3.Connection:
+        """
+        This thread's connection, opened on first use. Used as a context
+        manager it commits (or rolls back) a transaction without closing.
+        """
+        conn = getattr(self._local, "conn", None)
+        # Connections never cross a fork: a forked worker opens its own
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        # check_same_thread=False only so close() can run from any thread;
+        # otherwise each connection is used by the thread that opened it.
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout,
+            cached_statements=128,
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA synchronous = NORMAL")   # safe with WAL, no fsync per commit
+        conn.execute(f"PRAGMA cache_size = -{self.cache_size_kb}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        with self._all_lock:
+            self._all_connections.append(conn)
+        return conn
 
     def _ensure_schema(self):
         with self._connection() as conn:
+            # journal_mode is persistent, so setting it once per file is enough
+            conn.execute("PRAGMA journal_mode = WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS translations (
                     source_text   TEXT NOT NULL,
@@ -26,25 +109,39 @@ class TranslationCache:
                     native_lang   TEXT NOT NULL,
                     translated_text TEXT NOT NULL,
                     created_at    TEXT DEFAULT (datetime('now')),
+                    last_accessed TEXT DEFAULT (datetime('now')),
                     PRIMARY KEY (source_text, study_lang, native_lang)
                 )
             """)
+
+            # Databases created before last_accessed existed: add it, seeded
+            # from created_at (ALTER TABLE can't use a datetime() default)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(translations)")}
+            if "last_accessed" not in columns:
+                conn.execute("ALTER TABLE translations ADD COLUMN last_accessed TEXT")
+                conn.execute("UPDATE translations SET last_accessed = created_at")
+
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS translations_last_accessed
+                ON translations (last_accessed)
+            """)
             conn.commit()
 
+    def close(self) -> None:
+        """Close every connection this cache has opened, in any thread."""
+        with self._all_lock:
+            for conn in self._all_connections:
+                conn.close()
+            self._all_connections.clear()
+        self._local = threading.local()
+
     def get(self, key: Key) -> Optional[str]:
         """
         Return cached translation if present; else None.
         """
         with self._connection() as conn:
             cur = conn.execute(
-                """
-                SELECT translated_text
-                FROM translations
-                WHERE source_text = ?
-                  AND study_lang  = ?
-                  AND native_lang = ?
-                LIMIT 1
-                """,
+                _SELECT_ONE,
                 (key.source_text, key.study_lang, key.native_lang)
             )
             row = cur.fetchone()
@@ -56,11 +153,100 @@ class TranslationCache:
         """
         with self._connection() as conn:
             conn.execute(
-                """
-                INSERT OR REPLACE INTO translations
-                    (source_text, study_lang, native_lang, translated_text, created_at)
-                VALUES (?, ?, ?, ?, datetime('now'))
-                """,
+                _UPSERT,
                 (key.source_text, key.study_lang, key.native_lang, translated_text)
             )
-            conn.commit()
+
+    @staticmethod
+    def _group_by_pair(keys: Iterable[Key]) -> Dict[Tuple[str, str], List[str]]:
+        by_pair: Dict[Tuple[str, str], List[str]] = {}
+        for key in keys:
+            by_pair.setdefault((key.study_lang, key.native_lang), []).append(key.source_text)
+        return by_pair
+
+    def get_many(self, keys: Iterable[Key]) -> Dict[Key, str]:
+        """
+        Return cached translations for many keys in one connection.
+        Keys that aren't cached are simply missing from the result.
+        """
+        # Group by language pair so each pair is a single lookup
+        by_pair = self._group_by_pair(keys)
+
+        found: Dict[Key, str] = {}
+        if not by_pair:
+            return found
+
+        with self._connection() as conn:
+            for (study_lang, native_lang), texts in by_pair.items():
+                cur = conn.execute(
+                    _SELECT_MANY,
+                    (study_lang, native_lang, json.dumps(texts, ensure_ascii=False))
+                )
+                for source_text, translated_text in cur:
+                    found[Key(source_text, study_lang, native_lang)] = translated_text
+        return found
+
+    def put_many(self, items: Iterable[Tuple[Key, str]]) -> None:
+        """
+        Upsert many translations in a single transaction.
+        """
+        rows = [
+            (key.source_text, key.study_lang, key.native_lang, translated_text)
+            for key, translated_text in items
+        ]
+        if not rows:
+            return
+
+        with self._connection() as conn:
+            conn.executemany(_UPSERT, rows)
+
+    def touch_many(self, keys: Iterable[Key]) -> None:
+        """
+        Mark entries as recently used, so evict() keeps them.
+        Reads don't do this themselves; callers batch it up (see TieredTranslationCache).
+        """
+        by_pair = self._group_by_pair(keys)
+        if not by_pair:
+            return
+
+        with self._connection() as conn:
+            for (study_lang, native_lang), texts in by_pair.items():
+                conn.execute(
+                    _TOUCH_MANY,
+                    (study_lang, native_lang, json.dumps(texts, ensure_ascii=False))
+                )
+
+    def count(self) -> int:
+        with self._connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+    def evict(self, max_rows: Optional[int] = None, max_age_days: Optional[float] = None) -> int:
+        """
+        Delete entries not accessed in max_age_days, then the least recently
+        accessed ones until at most max_rows remain. Returns rows deleted.
+        """
+        deleted = 0
+        with self._connection() as conn:
+            if max_age_days is not None:
+                cur = conn.execute(
+                    "DELETE FROM translations WHERE last_accessed < datetime('now', ?)",
+                    (f"-{max_age_days} days",)
+                )
+                deleted += cur.rowcount
+
+            if max_rows is not None:
+                excess = conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0] - max_rows
+                if excess > 0:
+                    cur = conn.execute(
+                        """
+                        DELETE FROM translations
+                        WHERE rowid IN (
+                            SELECT rowid FROM translations
+                            ORDER BY last_accessed
+                            LIMIT ?
+                        )
+                        """,
+                        (excess,)
+                    )
+                    deleted += cur.rowcount
+        return deleted
@@ -0,0 +1,122 @@
+# adapters/cache_tiered.py
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+import threading
+import time
+
+from adapters.cache_sqlite import TranslationCache, Key
+from adapters.cache_memory import MemoryCache
+
+
+class TieredTranslationCache:
+    """
+    Two-tier translation cache with the same get/put/get_many/put_many
+    interface as TranslationCache:
+
+      1. MemoryCache   in-process LRU with TTL and a memory cap
+      2. SQLite        persistent, pruned by last access time and a row budget
+
+    Memory misses fall through to SQLite and are promoted on the way back.
+    Access times for hits are buffered and written to SQLite in batches,
+    and SQLite eviction runs every `evict_every` writes.
+    """
+
+    def __init__(
+        self,
+        sqlite: TranslationCache,
+        memory: Optional[MemoryCache] = None,
+        sqlite_max_rows: Optional[int] = None,
+        sqlite_max_age_days: Optional[float] = None,
+        evict_every: int = 1000,
+        touch_interval: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.sqlite = sqlite
+        self.memory = memory or MemoryCache()
+        self.sqlite_max_rows = sqlite_max_rows
+        self.sqlite_max_age_days = sqlite_max_age_days
+        self.evict_every = evict_every
+        self.touch_interval = touch_interval
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._pending_touch: Set[Key] = set()
+        self._last_touch = clock()
+        self._writes_since_evict = 0
+        self.sqlite_hits = 0
+        self.sqlite_misses = 0
+        self.sqlite_evicted = 0
+
+    def get(self, key: Key) -> Optional[str]:
+        return self.get_many([key]).get(key)
+
+    def put(self, key: Key, translated_text: str) -> None:
+        self.put_many([(key, translated_text)])
+
+    def get_many(self, keys: Iterable[Key]) -> Dict[Key, str]:
+        keys = list(keys)
+        found = self.memory.get_many(keys)
+
+        missing = [key for key in keys if key not in found]
+        if missing:
+            from_sqlite = self.sqlite.get_many(missing)
+            self.memory.put_many(from_sqlite.items())
+            found.update(from_sqlite)
+            with self._lock:
+                self.sqlite_hits += len(from_sqlite)
+                self.sqlite_misses += len(missing) - len(from_sqlite)
+
+        self._record_access(found.keys())
+        return found
+
+    def put_many(self, items: Iterable[Tuple[Key, str]]) -> None:
+        items = list(items)
+        self.memory.put_many(items)
+        self.sqlite.put_many(items)
+
+        with self._lock:
+            self._writes_since_evict += len(items)
+            due = self._writes_since_evict >= self.evict_every
+            if due:
+                self._writes_since_evict = 0
+        if due:
+            self.evict()
+
+    def _record_access(self, keys: Iterable[Key]) -> None:
+        with self._lock:
+            self._pending_touch.update(keys)
+            now = self._clock()
+            if now - self._last_touch < self.touch_interval:
+                return
+            pending, self._pending_touch = self._pending_touch, set()
+            self._last_touch = now
+        self.sqlite.touch_many(pending)
+
+    def flush(self) -> None:
+        """Write buffered access times to SQLite now."""
+        with self._lock:
+            pending, self._pending_touch = self._pending_touch, set()
+            self._last_touch = self._clock()
+        self.sqlite.touch_many(pending)
+
+    def evict(self) -> int:
+        """Prune the SQLite tier to its age and size budget."""
+        if self.sqlite_max_rows is None and self.sqlite_max_age_days is None:
+            return 0
+        # Record recent hits first so hot entries aren't evicted as stale
+        self.flush()
+        deleted = self.sqlite.evict(self.sqlite_max_rows, self.sqlite_max_age_days)
+        with self._lock:
+            self.sqlite_evicted += deleted
+        return deleted
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            lookups = self.sqlite_hits + self.sqlite_misses
+            sqlite_stats = {
+                "hits": self.sqlite_hits,
+                "misses": self.sqlite_misses,
+                "hit_rate": self.sqlite_hits / lookups if lookups else 0.0,
+                "evicted": self.sqlite_evicted,
+                "max_rows": self.sqlite_max_rows,
+            }
+        return {"memory": self.memory.stats(), "sqlite": sqlite_stats}
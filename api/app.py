@@ -1,22 +1,39 @@
 from pathlib import Path
-from dataclasses import asdict
-from typing import Any, Dict, List
+from contextlib import nullcontext
+from typing import Dict, List, Optional
+import asyncio
+import logging
 import os
+import time
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from starlette.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
-from core.pipeline import german_nlp
-from core.flashcard_generator import generate_flashcards
-from core.cefr_loader import load_cefr_files
+from core.pipeline import get_nlp, model_version, PIPELINE_PROFILES
+from core.nlp_pool import NLPPool
+from core.incremental_pipeline import IncrementalPipeline
+from core.resources import ResourceRegistry
+from core.flashcard_generator import generate_flashcards, generate_lemma_flashcards
+from core import flashcard_json
+from core.metrics import REGISTRY, REQUESTS_TOTAL, STAGE_SECONDS
+from core.cefr_index import load_cefr_index
 from adapters.cache_sqlite import TranslationCache
-from services.translator_google import GoogleTranslator
+from adapters.cache_memory import MemoryCache
+from adapters.cache_tiered import TieredTranslationCache
+from adapters.cache_response import ResponseCache, response_key
+from services.translator_google_async import AsyncGoogleTranslator
+from services.translator_offline import OfflineDictionaryTranslator
+from services.article_pool import ArticlePool
+from services.translator_chain import ChainTranslator, CachedTranslator
 from core.wiktionary_loader import load_nouns_and_verbs_from_url
-import requests
+from core.wiktionary_index import WiktionaryIndex
+from core.lemma_lookup import LazyLemmaLookup
+import httpx
 
 
 # ---------------------------
@@ -24,36 +41,35 @@ import requests
 # ---------------------------
 load_dotenv()
 
+# Token dumps and per-word cache hits are logged at DEBUG; set LOG_LEVEL=DEBUG to see them
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "WARNING").upper())
+logger = logging.getLogger(__name__)
+
 # ---------------------------
 # Create FastAPI app
 # ---------------------------
 app = FastAPI(title="German Flashcard App")
 
-@app.get("/api/random-german")
-def random_german():
-    url = "https://de.wikipedia.org/api/rest_v1/page/random/summary"
-    headers = {
-        "User-Agent": "GermanFlashcardApp/1.0 (local dev)"
-    }
-
-    try:
-        r = requests.get(url, headers=headers, timeout=8)
-
-        # If Wikipedia blocks us, don't crash the app
-        if r.status_code != 200:
-            return {"text": "Ich lerne gerade Deutsch. Das ist ein Beispielsatz. Heute ist das Wetter schön."}
+RANDOM_ARTICLE_URL = os.getenv("RANDOM_ARTICLE_URL", "https://de.wikipedia.org/api/rest_v1/page/random/summary")
+FALLBACK_TEXT = "Ich lerne gerade Deutsch. Das ist ein Beispielsatz. Heute ist das Wetter schön."
 
-        data = r.json()
-        text = (data.get("extract") or "").strip()
+# Prefetched extracts kept ready; RANDOM_PREPARE=1 also builds their
+# flashcards ahead of time (uses translation quota for unused articles).
+RANDOM_POOL_SIZE = int(os.getenv("RANDOM_POOL_SIZE", "10"))
+RANDOM_PREPARE = os.getenv("RANDOM_PREPARE") == "1"
 
-        if not text:
-            text = "Ich lerne gerade Deutsch. Das ist ein Beispielsatz. Heute ist das Wetter schön."
-
-        return {"text": text}
+# Pooled async HTTP client and article pool, created per worker on startup
+http_client: Optional[httpx.AsyncClient] = None
+article_pool: Optional[ArticlePool] = None
 
+@app.get("/api/random-german")
+async def random_german():
+    try:
+        text = await article_pool.get()
     except Exception:
-        # Any network/JSON issue: still return something usable
-        return {"text": "Ich lerne gerade Deutsch. Das ist ein Beispielsatz. Heute ist das Wetter schön."}
+        # Wikipedia blocking us or any network/JSON issue: still return something usable
+        text = None
+    return {"text": text or FALLBACK_TEXT}
 
 # ---------------------------
 # CORS (safe for local dev)
@@ -82,66 +98,495 @@ def serve_ui():
     return FileResponse(UI_DIR / "index.html")
 
 # ---------------------------
-# Load CEFR files
+# Heavy resources
 # ---------------------------
-cefr_lookup = load_cefr_files([
+# Everything below is loaded lazily through the registry: imports stay
+# fast, /health answers immediately, and /ready reports load progress.
+WIKTIONARY_URL = os.getenv("WIKTIONARY_URL")
+WIKTIONARY_INDEX = Path(os.getenv("WIKTIONARY_INDEX", BASE_DIR / "data/wiktionary/lemmas.sqlite"))
+WIKTIONARY_LRU_SIZE = int(os.getenv("WIKTIONARY_LRU_SIZE", "4096"))
+logger.debug("WIKTIONARY_URL = %s", WIKTIONARY_URL)
+logger.debug("WIKTIONARY_INDEX = %s", WIKTIONARY_INDEX)
+logger.debug("GOOGLE_APPLICATION_CREDENTIALS = %s", os.getenv("GOOGLE_APPLICATION_CREDENTIALS"))
+
+
+CEFR_FILES = [
     BASE_DIR / "data/cefr/GermanCEFRVocabA1.csv",
     BASE_DIR / "data/cefr/GermanCEFRVocabA2.csv",
     BASE_DIR / "data/cefr/GermanCEFRVocabB1.csv",
-])
+]
 
-# ---------------------------
-# Load Wiktionary data
-# ---------------------------
-WIKTIONARY_URL = os.getenv("WIKTIONARY_URL")
-print("WIKTIONARY_URL =", WIKTIONARY_URL)
-print("GOOGLE_APPLICATION_CREDENTIALS =", os.getenv("GOOGLE_APPLICATION_CREDENTIALS"))
 
-noun_info, verb_info = load_nouns_and_verbs_from_url(WIKTIONARY_URL)
+# Compiled CEFR index (with compound decomposition), rebuilt when a CSV changes
+CEFR_SNAPSHOT = Path(os.getenv("CEFR_SNAPSHOT", BASE_DIR / "data/cefr/cefr_index.pickle"))
 
-# ---------------------------
-# Translator + cache
-# ---------------------------
-cache = TranslationCache(str(BASE_DIR / "translations.db"))
-translator = GoogleTranslator(cache)
+
+def _load_cefr():
+    return load_cefr_index(CEFR_FILES, CEFR_SNAPSHOT)
+
+
+def _load_wiktionary():
+    # Prefer the prebuilt index (python -m core.wiktionary_index ...);
+    # only stream the full dump when no index has been built.
+    if WIKTIONARY_INDEX.exists():
+        wiktionary_index = WiktionaryIndex(WIKTIONARY_INDEX)
+        # Only the lemmas requests actually touch stay in memory
+        noun_info = LazyLemmaLookup(wiktionary_index.nouns.get, maxsize=WIKTIONARY_LRU_SIZE)
+        verb_info = LazyLemmaLookup(wiktionary_index.verbs.get, maxsize=WIKTIONARY_LRU_SIZE)
+        return noun_info, verb_info
+    return load_nouns_and_verbs_from_url(WIKTIONARY_URL)
+
+
+def _load_translation_cache():
+    # Hot lemmas are served from memory; SQLite is pruned by last access
+    return TieredTranslationCache(
+        TranslationCache(str(BASE_DIR / "translations.db")),
+        MemoryCache(
+            max_bytes=int(float(os.getenv("TRANSLATION_MEMORY_MB", "16")) * 1024 * 1024),
+            ttl_seconds=float(os.getenv("TRANSLATION_MEMORY_TTL", "3600")),
+        ),
+        sqlite_max_rows=int(os.getenv("TRANSLATION_DB_MAX_ROWS", "500000")),
+        sqlite_max_age_days=float(os.getenv("TRANSLATION_DB_MAX_AGE_DAYS", "180")),
+    )
+
+
+def _load_translator():
+    # cache -> offline Wiktionary glosses -> Google; only residual misses go upstream
+    cache = resources.get("translation_cache")
+    tiers = [("cache", CachedTranslator(cache))]
+    if os.getenv("OFFLINE_TRANSLATIONS", "1") == "1":
+        noun_info, verb_info = resources.get("wiktionary")
+        tiers.append(("offline", OfflineDictionaryTranslator(noun_info, verb_info)))
+    tiers.append(("google", AsyncGoogleTranslator(
+        cache,
+        max_concurrency=int(os.getenv("TRANSLATE_MAX_CONCURRENCY", "4")),
+        # The cache tier already looked these words up; don't do it twice
+        check_cache=False,
+    )))
+    return ChainTranslator(tiers)
+
+
+# spaCy runs in a pool of worker processes, each with its own model.
+# NLP_POOL_WORKERS=0 parses in this process's threadpool instead.
+NLP_POOL_WORKERS = int(os.getenv("NLP_POOL_WORKERS", "2"))
+# Per-sentence parse cache size; in pool mode each worker has its own
+SENTENCE_CACHE_SIZE = int(os.getenv("SENTENCE_CACHE_SIZE", "20000"))
+
+
+def _load_nlp_pool():
+    return NLPPool(
+        workers=NLP_POOL_WORKERS,
+        start_method=os.getenv("NLP_POOL_START_METHOD", "forkserver"),
+        max_sentences=SENTENCE_CACHE_SIZE,
+    ).start()
+
+
+def _data_version() -> str:
+    """
+    Fingerprint of the dictionaries responses are built from (file sizes and
+    mtimes), plus DATA_VERSION for manual invalidation. The spaCy model
+    version is added per request, since it depends on the profile.
+    """
+    parts = [os.getenv("DATA_VERSION", ""), os.getenv("OFFLINE_TRANSLATIONS", "1")]
+    for path in CEFR_FILES + [WIKTIONARY_INDEX]:
+        if path.exists():
+            st = path.stat()
+            parts.append(f"{path.name}:{st.st_size}:{st.st_mtime_ns}")
+    if not WIKTIONARY_INDEX.exists():
+        parts.append(WIKTIONARY_URL or "")
+    return "|".join(parts)
+
+
+DATA_VERSION = _data_version()
+
+# Whole-response cache for /api/flashcards, per worker
+response_cache = ResponseCache(
+    max_entries=int(os.getenv("RESPONSE_CACHE_ENTRIES", "1000")),
+    max_bytes=int(float(os.getenv("RESPONSE_CACHE_MB", "64")) * 1024 * 1024),
+)
+
+resources = ResourceRegistry()
+if NLP_POOL_WORKERS > 0:
+    # A process pool must be started inside each worker, after any fork
+    resources.register("nlp_pool", _load_nlp_pool, fork_safe=False)
+else:
+    resources.register("nlp", get_nlp)
+# Per-sentence parse cache: edited resubmissions only re-parse changed sentences
+resources.register("incremental_nlp", lambda: IncrementalPipeline(max_sentences=SENTENCE_CACHE_SIZE))
+resources.register("cefr", _load_cefr)
+resources.register("wiktionary", _load_wiktionary)
+# API clients hold sockets/threads: build them per worker, never before fork
+resources.register("translation_cache", _load_translation_cache, fork_safe=False)
+resources.register("translator", _load_translator, fork_safe=False)
+
+# With gunicorn --preload, load the shareable resources once in the master
+# so forked workers share them copy-on-write.
+if os.getenv("PRELOAD_RESOURCES") == "1":
+    resources.preload_shared()
+
+
+@app.on_event("startup")
+async def start_up():
+    global http_client, article_pool
+    http_client = httpx.AsyncClient(
+        headers={"User-Agent": "GermanFlashcardApp/1.0 (local dev)"},
+        timeout=8,
+    )
+    resources.warm_up_in_background()
+    article_pool = ArticlePool(
+        http_client,
+        RANDOM_ARTICLE_URL,
+        size=RANDOM_POOL_SIZE,
+        prepare=_prepare_article if RANDOM_PREPARE else None,
+    ).start()
+
+async def _prepare_article(text: str) -> None:
+    # Same request the UI sends next, so it is answered from the response cache.
+    # No client asked for it yet: leave the request and stage metrics alone.
+    await _flashcards_response(FlashcardRequest(text=text), record_metrics=False)
+
+@app.on_event("shutdown")
+async def shut_down():
+    if article_pool is not None:
+        await article_pool.stop()
+    if http_client is not None:
+        await http_client.aclose()
+    if NLP_POOL_WORKERS > 0 and resources.is_loaded("nlp_pool"):
+        resources.get("nlp_pool").shutdown()
+
+
+async def parse_text(text: str, profile: Optional[str] = None):
+    """
+    Run the NLP pipeline without blocking the event loop: in the process
+    pool when enabled, otherwise in the threadpool. Returns a TokenTable.
+    """
+    if NLP_POOL_WORKERS > 0:
+        pool = await resources.aget("nlp_pool")
+        return await pool.process_table(text, profile)
+    incremental = await resources.aget("incremental_nlp")
+    return await run_in_threadpool(incremental.process_table, text, profile)
 
 # ---------------------------
 # Request model
 # ---------------------------
 class FlashcardRequest(BaseModel):
     text: str
+    profile: Optional[str] = None   # NLP profile ("fast" / "accurate"); defaults to NLP_PROFILE
+    omit_none: bool = False         # leave null card fields out of the response
+    aggregate: bool = False         # one card per lemma+POS with occurrence counts
+
+class FlashcardBatchRequest(BaseModel):
+    texts: List[str]
+    profile: Optional[str] = None
+    omit_none: bool = False
+    aggregate: bool = False
+
+# Request size limits for /api/flashcards/batch
+BATCH_MAX_DOCUMENTS = int(os.getenv("BATCH_MAX_DOCUMENTS", "100"))
+BATCH_MAX_CHARS = int(os.getenv("BATCH_MAX_CHARS", "500000"))
 
 # ---------------------------
 # API Routes
 # ---------------------------
 @app.post("/api/flashcards")
-def create_flashcards(payload: FlashcardRequest) -> Dict[str, List[Dict[str, Any]]]:
+async def create_flashcards(payload: FlashcardRequest):
+    REQUESTS_TOTAL.inc(endpoint="flashcards")
+    return await _flashcards_response(payload)
+
+def _stage_timer(stage: str, record_metrics: bool):
+    return STAGE_SECONDS.time(stage=stage) if record_metrics else nullcontext()
+
+async def _flashcards_response(payload: FlashcardRequest, record_metrics: bool = True):
+    """
+    Parse, translate, generate and serialize for /api/flashcards, through
+    the response cache. With record_metrics=False (background work) the
+    stage latencies and response cache hit/miss counts are not touched.
+    """
     text = payload.text.strip()
     if not text:
         return {"flashcards": []}
 
-    # 1. NLP pipeline
-    word_data, vocab_list = german_nlp(text)
+    if payload.profile is not None and payload.profile not in PIPELINE_PROFILES:
+        raise HTTPException(status_code=400, detail=f"Unknown profile: {payload.profile}")
 
-    # 2. Translate
-    translations = translator.translate(
-        vocab_list,
-        study_lang="de",
-        native_lang="en",
+    # 0. Identical text with the same model, data and options: serve cached bytes
+    cache_key = response_key(
+        text, "de", "en", f"{DATA_VERSION}|{model_version()}",
+        profile=payload.profile, omit_none=payload.omit_none, aggregate=payload.aggregate,
     )
+    cached = response_cache.get(cache_key) if record_metrics else response_cache.peek(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json", headers={"X-Cache": "HIT"})
+
+    # 1. NLP pipeline (columnar token table, consumed directly below);
+    #    runs off the event loop, only new sentences go through spaCy
+    with _stage_timer("nlp", record_metrics):
+        word_data = await parse_text(text, payload.profile)
+    vocab_list = word_data.vocab
+
+    # 2. Translate
+    translator = await resources.aget("translator")
+    with _stage_timer("translation", record_metrics):
+        translations = await translator.atranslate(
+            vocab_list,
+            study_lang="de",
+            native_lang="en",
+        )
 
     # 3. Generate flashcards
-    flashcards = generate_flashcards(
-        word_data=word_data,
-        translations=translations,
-        cefr_lookup=cefr_lookup,
-        noun_info=noun_info,
-        verb_info=verb_info,
-    )
+    noun_info, verb_info = await resources.aget("wiktionary")
+    cefr_lookup = await resources.aget("cefr")
+    generate = generate_lemma_flashcards if payload.aggregate else generate_flashcards
+    with _stage_timer("generation", record_metrics):
+        flashcards = await run_in_threadpool(
+            generate,
+            word_data=word_data,
+            translations=translations,
+            cefr_lookup=cefr_lookup,
+            noun_info=noun_info,
+            verb_info=verb_info,
+        )
+
+    # 4. Convert to JSON and remember the serialized response
+    with _stage_timer("serialization", record_metrics):
+        body = flashcard_json.dumps({"flashcards": flashcards}, omit_none=payload.omit_none)
+    response_cache.put(cache_key, body)
+    return Response(content=body, media_type="application/json", headers={"X-Cache": "MISS"})
+
+async def _parse_batch(texts: List[str], profile: Optional[str]):
+    """
+    One TokenTable per document. With the process pool, documents are
+    spread across workers; in-process, all documents go through a single
+    nlp.pipe pass (sentence by sentence for profiles with a sentence cache).
+    """
+    if NLP_POOL_WORKERS > 0:
+        return await asyncio.gather(*(parse_text(t.strip(), profile) for t in texts))
+
+    incremental = await resources.aget("incremental_nlp")
+    return await run_in_threadpool(incremental.process_tables, [t.strip() for t in texts], profile)
+
+@app.post("/api/flashcards/batch")
+async def create_flashcards_batch(payload: FlashcardBatchRequest):
+    """
+    Flashcards for many documents in one call: all documents are parsed
+    together, lemmas are deduplicated across the batch into a single
+    translation pass, and cards come back per document, in input order.
+    """
+    REQUESTS_TOTAL.inc(endpoint="batch")
+    if len(payload.texts) > BATCH_MAX_DOCUMENTS:
+        raise HTTPException(status_code=413, detail=f"At most {BATCH_MAX_DOCUMENTS} texts per batch")
+    if sum(len(t) for t in payload.texts) > BATCH_MAX_CHARS:
+        raise HTTPException(status_code=413, detail=f"At most {BATCH_MAX_CHARS} characters per batch")
+    if payload.profile is not None and payload.profile not in PIPELINE_PROFILES:
+        raise HTTPException(status_code=400, detail=f"Unknown profile: {payload.profile}")
 
-    # 4. Convert to JSON-safe dicts
-    return {"flashcards": [asdict(card) for card in flashcards]}
+    # 1. Parse every document
+    with STAGE_SECONDS.time(stage="nlp"):
+        doc_tables = await _parse_batch(payload.texts, payload.profile)
+
+    # 2. One translation pass for the union of all documents' lemmas
+    vocab = list(dict.fromkeys(lemma for table in doc_tables for lemma in table.vocab))
+    translator = await resources.aget("translator")
+    with STAGE_SECONDS.time(stage="translation"):
+        translations = await translator.atranslate(vocab, study_lang="de", native_lang="en")
+
+    # 3. Cards per document
+    cefr_lookup = await resources.aget("cefr")
+    noun_info, verb_info = await resources.aget("wiktionary")
+
+    generate = generate_lemma_flashcards if payload.aggregate else generate_flashcards
+
+    def build_results():
+        return [
+            {"flashcards": generate(
+                word_data=table,
+                translations=translations,
+                cefr_lookup=cefr_lookup,
+                noun_info=noun_info,
+                verb_info=verb_info,
+            )}
+            for table in doc_tables
+        ]
+
+    with STAGE_SECONDS.time(stage="generation"):
+        results = await run_in_threadpool(build_results)
+    with STAGE_SECONDS.time(stage="serialization"):
+        body = await run_in_threadpool(flashcard_json.dumps, {"results": results}, payload.omit_none)
+    return Response(content=body, media_type="application/json")
+
+def _encode_event(event: Dict, fmt: str, omit_none: bool = False) -> bytes:
+    data = flashcard_json.dumps(event, omit_none=omit_none)
+    if fmt == "sse":
+        return f"event: {event['event']}\ndata: ".encode("utf-8") + data + b"\n\n"
+    return data + b"\n"
+
+
+@app.post("/api/flashcards/stream")
+async def stream_flashcards(payload: FlashcardRequest, request: Request, format: str = "ndjson"):
+    """
+    Same cards as /api/flashcards, emitted sentence by sentence as soon as
+    each sentence's lemmas are translated.
+
+    format=ndjson (default): one JSON object per line.
+    format=sse: Server-Sent Events.
+    Events: {"event": "flashcards", "sentence_index": i, "flashcards": [...]}
+    per sentence, then one {"event": "summary", ...}.
+    """
+    REQUESTS_TOTAL.inc(endpoint="stream")
+    if format not in ("ndjson", "sse"):
+        raise HTTPException(status_code=400, detail=f"Unknown format: {format}")
+    if payload.aggregate:
+        # Counts and examples span the whole text, so cards can't be final per sentence
+        raise HTTPException(status_code=400, detail="aggregate is not supported when streaming")
+    if payload.profile is not None and payload.profile not in PIPELINE_PROFILES:
+        raise HTTPException(status_code=400, detail=f"Unknown profile: {payload.profile}")
+
+    text = payload.text.strip()
+    incremental = await resources.aget("incremental_nlp")
+    sentences = await run_in_threadpool(incremental.split_sentences, text) if text else []
+
+    async def events():
+        start = time.perf_counter()
+        translator = await resources.aget("translator")
+        cefr_lookup = await resources.aget("cefr")
+        noun_info, verb_info = await resources.aget("wiktionary")
+
+        translations: Dict[str, str] = {}
+        # Lemmas already sent to the translator, resolved or not
+        seen = set()
+        total_cards = 0
+
+        # StreamingResponse only pulls the next event once the previous one
+        # has been sent, so a slow client naturally slows the work down.
+        for i, sentence in enumerate(sentences):
+            # Stop doing work for a client that has gone away
+            if await request.is_disconnected():
+                return
+
+            with STAGE_SECONDS.time(stage="nlp"):
+                table = await parse_text(sentence, payload.profile)
+
+            # Only lemmas not seen earlier in this text need translating
+            new_lemmas = [lemma for lemma in table.vocab if lemma not in seen]
+            seen.update(new_lemmas)
+            if new_lemmas:
+                with STAGE_SECONDS.time(stage="translation"):
+                    translations.update(await translator.atranslate(new_lemmas, "de", "en"))
+
+            with STAGE_SECONDS.time(stage="generation"):
+                cards = await run_in_threadpool(
+                    generate_flashcards,
+                    word_data=table,
+                    translations=translations,
+                    cefr_lookup=cefr_lookup,
+                    noun_info=noun_info,
+                    verb_info=verb_info,
+                )
+            total_cards += len(cards)
+            with STAGE_SECONDS.time(stage="serialization"):
+                event = await run_in_threadpool(_encode_event, {
+                    "event": "flashcards",
+                    "sentence_index": i,
+                    "flashcards": cards,
+                }, format, payload.omit_none)
+            yield event
+
+        yield _encode_event({
+            "event": "summary",
+            "sentences": len(sentences),
+            "flashcards": total_cards,
+            "lemmas": len(translations),
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+        }, format)
+
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(events(), media_type=media_type, headers={"Cache-Control": "no-cache"})
+
+def _collect_metrics():
+    """
+    Counters the caches, translators and pools already keep, read at scrape
+    time. Resources that haven't loaded yet are skipped rather than loaded.
+    """
+    caches = {"response": response_cache.stats()}
+    if resources.is_loaded("translation_cache"):
+        tiered = resources.get("translation_cache").stats()
+        caches["translation_memory"] = tiered["memory"]
+        caches["translation_sqlite"] = tiered["sqlite"]
+    if NLP_POOL_WORKERS > 0:
+        # Parsing (and its sentence cache) lives in the pool workers; the
+        # local incremental_nlp only splits sentences there
+        if resources.is_loaded("nlp_pool"):
+            st = resources.get("nlp_pool").stats()
+            caches["sentence"] = {"hits": st["sentence_hits"], "misses": st["sentence_misses"]}
+    elif resources.is_loaded("incremental_nlp"):
+        caches["sentence"] = resources.get("incremental_nlp").stats()
+    yield ("cache_hits_total", "counter", "Cache lookups answered from the cache.",
+           [({"cache": name}, st["hits"]) for name, st in caches.items()])
+    yield ("cache_misses_total", "counter", "Cache lookups that missed.",
+           [({"cache": name}, st["misses"]) for name, st in caches.items()])
+
+    if resources.is_loaded("translator"):
+        chain = resources.get("translator")
+        yield ("translation_words_total", "counter", "Words resolved per translator tier.",
+               [({"tier": tier}, n) for tier, n in chain.stats().items()])
+        for name, tier in chain.tiers:
+            st = tier.stats() if hasattr(tier, "stats") else {}
+            if "api_words" in st:
+                yield ("translation_api_words_total", "counter", "Words sent to the translation API.",
+                       [({"tier": name}, st["api_words"])])
+                yield ("translation_api_batches_total", "counter", "Translation API batch calls.",
+                       [({"tier": name}, st["api_batches"])])
+                yield ("translation_coalesced_total", "counter", "Lookups answered by another request's API call.",
+                       [({"tier": name}, st["coalesced"])])
+
+    if NLP_POOL_WORKERS > 0 and resources.is_loaded("nlp_pool"):
+        st = resources.get("nlp_pool").stats()
+        yield ("nlp_pool_queued", "gauge", "Parse tasks waiting for a worker.", [({}, st["queued"])])
+        yield ("nlp_pool_running", "gauge", "Parse tasks being processed.", [({}, st["running"])])
+        yield ("nlp_pool_utilization", "gauge", "Worker busy time over pool uptime.", [({}, st["utilization"])])
+
+    if article_pool is not None:
+        yield ("article_pool_ready", "gauge", "Prefetched random articles ready to serve.",
+               [({}, article_pool.stats()["ready"])])
+
+
+REGISTRY.add_collector(_collect_metrics)
+
+@app.get("/metrics")
+def metrics():
+    return Response(content=REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
 
 @app.get("/health")
 def health_check() -> Dict[str, str]:
     return {"status": "ok"}
+
+@app.get("/api/cache-stats")
+def cache_stats():
+    return {
+        "translations": resources.get("translation_cache").stats(),
+        "responses": response_cache.stats(),
+    }
+
+@app.get("/api/translator-stats")
+def translator_stats():
+    # Words resolved per tier (cache / offline / google)
+    return resources.get("translator").stats()
+
+@app.get("/api/article-pool-stats")
+def article_pool_stats():
+    return article_pool.stats()
+
+@app.get("/api/nlp-pool-stats")
+def nlp_pool_stats():
+    # Queue depth and worker utilization of the NLP process pool
+    if NLP_POOL_WORKERS == 0 or not resources.is_loaded("nlp_pool"):
+        return {"workers": NLP_POOL_WORKERS, "started": False}
+    return {"started": True, **resources.get("nlp_pool").stats()}
+
+@app.get("/ready")
+def readiness_check():
+    ready = resources.is_ready()
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"ready": ready, "resources": resources.status()},
+    )
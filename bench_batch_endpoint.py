@@ -0,0 +1,95 @@
+"""
+Throughput of /api/flashcards/batch versus N separate /api/flashcards calls.
+Translation goes to the local fake translation server, so no API quota is used,
+and translations are cached in a temporary database, not translations.db.
+
+Both arms get the same documents, with every cache (responses, sentences,
+translations) reset in between, so neither arm benefits from the other.
+
+    python bench_batch_endpoint.py [n_docs] [api_delay_seconds]
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("OFFLINE_TRANSLATIONS", "0")
+
+from fastapi.testclient import TestClient
+
+from api import app as api_app
+from bench_load import make_sentence
+from adapters.cache_sqlite import TranslationCache
+from core.incremental_pipeline import IncrementalPipeline
+from services.fake_translation_server import FakeTranslationServer
+from services.translator_chain import ChainTranslator
+from services.translator_google_async import AsyncGoogleTranslator
+
+
+def make_docs(n_docs):
+    # Distinct sentences and content words in every document
+    return [" ".join(make_sentence(i * 5 + j) for j in range(5)) for i in range(n_docs)]
+
+
+def reset_caches(server, db_path):
+    """Fresh response, sentence and translation caches; the translations go to db_path."""
+    api_app.response_cache.clear()
+    api_app.resources.register("incremental_nlp", IncrementalPipeline)
+    if api_app.NLP_POOL_WORKERS > 0:
+        # Pool workers keep their own sentence caches: restart them
+        if api_app.resources.is_loaded("nlp_pool"):
+            api_app.resources.get("nlp_pool").shutdown()
+        api_app.resources.register("nlp_pool", api_app._load_nlp_pool, fork_safe=False)
+
+    cache = TranslationCache(str(db_path))
+    api_app.resources.register("translation_cache", lambda: cache, fork_safe=False)
+    api_app.resources.register(
+        "translator",
+        lambda: ChainTranslator([
+            ("google", AsyncGoogleTranslator(cache, client=server.client())),
+        ]),
+        fork_safe=False,
+    )
+    return cache
+
+
+def main():
+    n_docs = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    delay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+
+    server = FakeTranslationServer(delay=delay).start()
+    docs = make_docs(n_docs)
+
+    with tempfile.TemporaryDirectory() as tmp, TestClient(api_app.app) as client:
+        # Warm up models and connections, then start the arm from empty caches
+        cache = reset_caches(server, Path(tmp) / "single.db")
+        client.post("/api/flashcards", json={"text": "Warm-up."})
+        requests_before = server.requests
+        start = time.perf_counter()
+        for doc in docs:
+            assert client.post("/api/flashcards", json={"text": doc}).status_code == 200
+        single_time = time.perf_counter() - start
+        single_requests = server.requests - requests_before
+        cache.close()
+
+        cache = reset_caches(server, Path(tmp) / "batch.db")
+        client.post("/api/flashcards", json={"text": "Warm-up."})
+        requests_before = server.requests
+        start = time.perf_counter()
+        response = client.post("/api/flashcards/batch", json={"texts": docs})
+        batch_time = time.perf_counter() - start
+        assert response.status_code == 200 and len(response.json()["results"]) == n_docs
+        batch_requests = server.requests - requests_before
+        cache.close()
+
+    print(f"{n_docs} single calls: {n_docs / single_time:8.1f} docs/sec  "
+          f"({single_requests} translation API calls)")
+    print(f"1 batch call:    {n_docs / batch_time:8.1f} docs/sec  "
+          f"({batch_requests} translation API calls)  "
+          f"{single_time / batch_time:.1f}x")
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
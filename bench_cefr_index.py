@@ -0,0 +1,68 @@
+"""
+CEFR lookups per second on a large lemma list: the plain load_cefr_files
+dict versus CEFRIndex (without and with its derived-level memo), plus
+how many lemmas each resolves, and load time from CSVs versus snapshot.
+
+    python bench_cefr_index.py [n_lemmas] [n_distinct]
+"""
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+
+from core.cefr_index import CEFRIndex, load_cefr_index
+from core.cefr_loader import load_cefr_files
+
+CEFR_FILES = sorted(Path("data/cefr").glob("GermanCEFRVocab*.csv"))
+
+
+def make_lemmas(listed, n_lemmas, n_distinct, seed=0):
+    # A mix of listed lemmas, two-part compounds of them and unknown words,
+    # drawn with repetition like the lemmas of real texts
+    rng = random.Random(seed)
+    nouns = [lemma for lemma in listed if len(lemma) >= 4]
+    lemmas = []
+    for i in range(n_distinct):
+        kind = i % 3
+        if kind == 0:
+            lemmas.append(rng.choice(listed))
+        elif kind == 1:
+            lemmas.append(rng.choice(nouns) + rng.choice(("", "s", "en")) + rng.choice(nouns))
+        else:
+            lemmas.append("".join(rng.choice("abcdefghijklmnopqrstuvwxyzäöüß") for _ in range(rng.randint(5, 14))))
+    return [rng.choice(lemmas) for _ in range(n_lemmas)]
+
+
+def run(name, lookup, lemmas):
+    start = time.perf_counter()
+    found = sum(1 for lemma in lemmas if lookup.get(lemma) is not None)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<22} {len(lemmas) / elapsed:12,.0f} lookups/sec   resolved {found / len(lemmas):6.1%}")
+
+
+def main():
+    n_lemmas = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    n_distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 30_000
+
+    start = time.perf_counter()
+    levels = load_cefr_files(CEFR_FILES)
+    CEFRIndex(levels)
+    csv_time = time.perf_counter() - start
+
+    snapshot = Path(tempfile.mkdtemp()) / "cefr_index.pickle"
+    load_cefr_index(CEFR_FILES, snapshot)   # writes the snapshot
+    start = time.perf_counter()
+    index = load_cefr_index(CEFR_FILES, snapshot)
+    snapshot_time = time.perf_counter() - start
+    print(f"load: CSVs + trie build {csv_time * 1000:.1f} ms, snapshot {snapshot_time * 1000:.1f} ms")
+
+    lemmas = make_lemmas(list(levels), n_lemmas, n_distinct)
+    run("dict", levels, lemmas)
+    run("CEFRIndex, no memo", CEFRIndex(levels, cache_size=0), lemmas)
+    run("CEFRIndex", index, lemmas)
+    run("CEFRIndex, 2nd pass", index, lemmas)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Latency of re-processing a ~5,000-word text after a one-sentence edit:
+full german_nlp-style parse versus IncrementalPipeline, with the "fast"
+profile (the only one that uses the sentence cache).
+
+    python bench_incremental.py [n_words]
+"""
+import sys
+import time
+
+from core.pipeline import get_nlp, _doc_to_vocab
+from core.incremental_pipeline import IncrementalPipeline
+
+SENTENCES = [
+    "Ich habe vor einem Jahr angefangen, regelmäßig zu reisen, um neue Kulturen kennenzulernen.",
+    "Besonders beeindruckt hat mich Japan, weil die Menschen dort unglaublich höflich sind.",
+    "Während meiner Reise habe ich viele traditionelle Gerichte probiert.",
+    "Das Haus ist groß und der Hund läuft schnell durch den Garten.",
+    "Reisen hat mir gezeigt, wie wichtig Offenheit und Neugier im Leben sind.",
+]
+
+
+def make_text(n_words):
+    # Numbered so every sentence is distinct (no accidental cache hits)
+    sentences, words, i = [], 0, 0
+    while words < n_words:
+        sentence = f"Im Kapitel {i} gilt: {SENTENCES[i % len(SENTENCES)]}"
+        sentences.append(sentence)
+        words += len(sentence.split())
+        i += 1
+    return sentences
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    n_words = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    sentences = make_text(n_words)
+    original = " ".join(sentences)
+
+    edited_sentences = list(sentences)
+    middle = len(sentences) // 2
+    edited_sentences[middle] = "Heute ist das Wetter schön und wir gehen spazieren."
+    edited = " ".join(edited_sentences)
+
+    nlp = get_nlp("fast")
+    pipeline = IncrementalPipeline()
+
+    _, full_ms = timed(lambda: _doc_to_vocab(nlp(edited)))
+    _, cold_ms = timed(lambda: pipeline.process(original, "fast"))
+    (_, vocab), edit_ms = timed(lambda: pipeline.process(edited, "fast"))
+
+    print(f"{len(sentences)} sentences, ~{n_words} words")
+    print(f"full re-parse:             {full_ms:8.1f} ms")
+    print(f"incremental, cold cache:   {cold_ms:8.1f} ms")
+    print(f"incremental, one edit:     {edit_ms:8.1f} ms  ({full_ms / edit_ms:.0f}x faster)")
+    print("sentence cache:", pipeline.stats())
+    assert "wetter" in vocab
+
+
+if __name__ == "__main__":
+    main()
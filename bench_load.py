@@ -0,0 +1,91 @@
+"""
+Latency under concurrent load: many clients posting distinct texts to
+/api/flashcards at once against a running server.
+
+    uvicorn api.app:app --port 8000            # NLP_POOL_WORKERS=0 to compare
+    python bench_load.py [url] [clients] [requests_per_client]
+"""
+import asyncio
+import statistics
+import sys
+import time
+
+import httpx
+
+# Content words are compounds of three of these, so every sentence (and
+# nearly every noun lemma) is new to the sentence and translation caches
+PARTS = [
+    "Haus", "Garten", "Hund", "Reise", "Stadt", "Fluss", "Tür", "Zug", "Buch", "Wasser",
+    "Schule", "Berg", "Sommer", "Winter", "Brief", "Kaffee", "Markt", "Straße", "Wald", "Bahn",
+    "Kirche", "Karte", "Tisch", "Licht", "Feld", "Hafen", "Stein", "Wolke", "Apfel", "Brücke",
+]
+TEMPLATES = [
+    "Gestern habe ich lange über {0} und {1} nachgedacht.",
+    "Im Sommer interessieren sich viele Menschen für {0} und {1}.",
+    "Ohne {0} wäre die Reise zum {1} langweilig gewesen.",
+    "Meine Freundin erzählt oft von {0}, aber nie von {1}.",
+    "Niemand weiß, warum {0} teurer als {1} ist.",
+]
+
+
+def compound(n):
+    k = len(PARTS)
+    a, b, c = PARTS[n % k], PARTS[(n // k) % k], PARTS[(n // k // k) % k]
+    return a + b.lower() + c.lower()
+
+
+def make_sentence(n):
+    """The n-th benchmark sentence; they only repeat every len(PARTS) ** 3 // 2."""
+    return TEMPLATES[n % len(TEMPLATES)].format(compound(2 * n), compound(2 * n + 1))
+
+
+def make_text(client_id, i, offset, n_requests):
+    # Distinct per sentence; offset varies per run, since a live server
+    # keeps its translation cache between runs
+    first = offset + ((client_id + 1) * n_requests + i) * 3
+    return " ".join(make_sentence(first + j) for j in range(3))
+
+
+async def run_client(http, url, client_id, n_requests, offset, latencies):
+    for i in range(n_requests):
+        start = time.perf_counter()
+        text = make_text(client_id, i, offset, n_requests)
+        r = await http.post(f"{url}/api/flashcards", json={"text": text})
+        r.raise_for_status()
+        latencies.append(time.perf_counter() - start)
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+async def main():
+    url = sys.argv[1] if len(sys.argv) > 1 else "http://127.0.0.1:8000"
+    clients = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    n_requests = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+    offset = int(time.time()) % (len(PARTS) ** 3 // 2)
+
+    latencies = []
+    async with httpx.AsyncClient(timeout=120) as http:
+        # Warm up models and connections before measuring
+        await run_client(http, url, -1, 1, offset, [])
+
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            run_client(http, url, c, n_requests, offset, latencies) for c in range(clients)
+        ))
+        elapsed = time.perf_counter() - start
+
+        pool = (await http.get(f"{url}/api/nlp-pool-stats")).json()
+
+    print(f"{len(latencies)} requests from {clients} clients in {elapsed:.1f}s "
+          f"({len(latencies) / elapsed:.1f} req/s)")
+    print(f"p50 {percentile(latencies, 0.50) * 1000:8.1f} ms   "
+          f"p99 {percentile(latencies, 0.99) * 1000:8.1f} ms   "
+          f"mean {statistics.mean(latencies) * 1000:8.1f} ms")
+    print(f"nlp pool: {pool}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
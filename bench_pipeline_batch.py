@@ -0,0 +1,47 @@
+"""
+Docs/sec for one-nlp()-call-per-text versus german_nlp_batch (nlp.pipe).
+
+    python bench_pipeline_batch.py [n_docs] [n_process]
+"""
+import sys
+import time
+
+from core.pipeline import get_nlp, german_nlp_batch, _doc_to_vocab
+
+SENTENCES = [
+    "Ich habe vor einem Jahr angefangen, regelmäßig zu reisen, um neue Kulturen kennenzulernen.",
+    "Besonders beeindruckt hat mich Japan, weil die Menschen dort unglaublich höflich sind.",
+    "Während meiner Reise habe ich viele traditionelle Gerichte probiert.",
+    "Das Haus ist groß und der Hund läuft schnell durch den Garten.",
+    "Reisen hat mir gezeigt, wie wichtig Offenheit und Neugier im Leben sind.",
+]
+
+
+def make_corpus(n_docs):
+    # Each "article" is a rotation of the sample sentences
+    return [" ".join(SENTENCES[i % 5:] + SENTENCES[:i % 5]) for i in range(n_docs)]
+
+
+def main():
+    n_docs = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    n_process = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    corpus = make_corpus(n_docs)
+    nlp = get_nlp()
+
+    # Current approach: one nlp() call per text (german_nlp minus console output)
+    start = time.perf_counter()
+    loop_results = [_doc_to_vocab(nlp(text)) for text in corpus]
+    loop_time = time.perf_counter() - start
+    print(f"loop:  {n_docs / loop_time:8.1f} docs/sec")
+
+    for batch_size in (16, 64, 256):
+        start = time.perf_counter()
+        batch_results = list(german_nlp_batch(corpus, batch_size=batch_size, n_process=n_process))
+        batch_time = time.perf_counter() - start
+        print(f"batch: {n_docs / batch_time:8.1f} docs/sec  "
+              f"(batch_size={batch_size}, n_process={n_process}, {loop_time / batch_time:.2f}x)")
+        assert [v for _, v in batch_results] == [v for _, v in loop_results]
+
+
+if __name__ == "__main__":
+    main()
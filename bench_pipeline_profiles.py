@@ -0,0 +1,63 @@
+"""
+Tokens/sec per NLP profile, and how closely "fast" agrees with "accurate"
+on lemmas and on the kept vocab.
+
+    python bench_pipeline_profiles.py [repeat]
+"""
+import sys
+import time
+
+from core.pipeline import PIPELINE_PROFILES, get_nlp, _doc_to_table
+
+CORPUS = [
+    "Ich habe vor einem Jahr angefangen, regelmäßig zu reisen, um neue Kulturen kennenzulernen. "
+    "Besonders beeindruckt hat mich Japan, weil die Menschen dort unglaublich höflich und respektvoll sind. "
+    "Während meiner Reise habe ich viele traditionelle Gerichte probiert und versucht, ein paar japanische "
+    "Wörter zu lernen. Seitdem interessiere ich mich noch mehr für Sprachen.",
+    # Franz Kafka, Die Verwandlung (1915), public domain
+    "Als Gregor Samsa eines Morgens aus unruhigen Träumen erwachte, fand er sich in seinem Bett zu einem "
+    "ungeheueren Ungeziefer verwandelt. Er lag auf seinem panzerartig harten Rücken und sah, wenn er den Kopf "
+    "ein wenig hob, seinen gewölbten, braunen, von bogenförmigen Versteifungen geteilten Bauch.",
+    "Der Stadtrat hat am Dienstag beschlossen, die alte Brücke über den Fluss bis zum Herbst zu sanieren. "
+    "Während der Bauarbeiten fahren die Busse eine Umleitung über den Bahnhof.",
+    "Das Haus ist groß und der Hund läuft schnell. Heute ist das Wetter schön. Ich lerne gerade Deutsch.",
+]
+
+
+def run(profile, texts):
+    model = get_nlp(profile)
+    start = time.perf_counter()
+    docs = list(model.pipe(texts))
+    elapsed = time.perf_counter() - start
+    return docs, elapsed
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    texts = CORPUS * repeat
+
+    results = {}
+    for profile in PIPELINE_PROFILES:
+        get_nlp(profile)  # load outside the timed section
+        docs, elapsed = run(profile, texts)
+        n_tokens = sum(len(doc) for doc in docs)
+        results[profile] = docs
+        print(f"{profile:>9}: {n_tokens / elapsed:10,.0f} tokens/sec  ({len(docs)} docs, {elapsed:.2f}s)")
+
+    # Agreement on the fixed corpus (tokenization is identical across profiles)
+    accurate, fast = results["accurate"][:len(CORPUS)], results["fast"][:len(CORPUS)]
+    same = total = 0
+    vocab_a, vocab_f = set(), set()
+    for doc_a, doc_f in zip(accurate, fast):
+        for tok_a, tok_f in zip(doc_a, doc_f):
+            total += 1
+            same += tok_a.lemma_ == tok_f.lemma_
+        vocab_a.update(_doc_to_table(doc_a).vocab)
+        vocab_f.update(_doc_to_table(doc_f).vocab)
+
+    print(f"lemma agreement: {same / total:.2%} of {total} tokens")
+    print(f"vocab overlap:   {len(vocab_a & vocab_f) / len(vocab_a | vocab_f):.2%} (Jaccard)")
+
+
+if __name__ == "__main__":
+    main()
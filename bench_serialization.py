@@ -0,0 +1,75 @@
+"""
+Serializing a large flashcard response: dataclasses.asdict + json.dumps
+(the previous path) versus flashcard_json.dumps, with and without null
+fields. Reports time per response and peak allocated memory.
+
+    python bench_serialization.py [n_cards] [repeats]
+"""
+from dataclasses import asdict
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+
+from core import flashcard_json
+from core.flashcard_model import Flashcard
+
+
+def make_cards(n_cards):
+    cards = []
+    for i in range(n_cards):
+        kind = i % 3
+        card = Flashcard(
+            word=f"Wort{i}", lemma=f"wort{i}", pos=("NOUN", "VERB", "ADJ")[kind],
+            translation=f"word {i}", cefr="A2",
+            example_sentence="Das Haus ist groß und der Hund läuft schnell durch den Garten.",
+        )
+        if kind == 0:
+            card.article, card.plural = "das", f"wörter{i}"
+            card.display_word, card.display_details = f"das Wort{i}", f"die Wörter{i}"
+        elif kind == 1:
+            card.conjugations = {"3sg": "läuft", "preterite": "lief", "participle": "gelaufen"}
+            card.display_word, card.display_details = f"wort{i}", "3sg: läuft\nPräteritum: lief"
+        cards.append(card)
+    return cards
+
+
+def asdict_json(cards):
+    return json.dumps({"flashcards": [asdict(c) for c in cards]}, ensure_ascii=False).encode("utf-8")
+
+
+def measure(name, fn, cards, repeats):
+    fn(cards)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        body = fn(cards)
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn(cards)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:<22} {statistics.median(times) * 1000:8.2f} ms   "
+          f"peak {peak / 1024 / 1024:7.2f} MB   {len(body) / 1024:8.1f} KB")
+    return body
+
+
+def main():
+    n_cards = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    cards = make_cards(n_cards)
+
+    backend = "orjson" if flashcard_json.orjson is not None else "stdlib json"
+    print(f"{n_cards} cards, flashcard_json backend: {backend}")
+    baseline = measure("asdict + json.dumps", asdict_json, cards, repeats)
+    fast = measure("flashcard_json", lambda c: flashcard_json.dumps({"flashcards": c}), cards, repeats)
+    measure("flashcard_json omit", lambda c: flashcard_json.dumps({"flashcards": c}, omit_none=True), cards, repeats)
+
+    assert json.loads(baseline) == json.loads(fast)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Per-request cache latency for a 300-lemma text: one get/put per word
+versus get_many/put_many.
+
+    python bench_translation_cache.py [n_lemmas] [requests]
+"""
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+import time
+
+from adapters.cache_sqlite import TranslationCache, Key
+
+
+def per_word(cache, keys, new_entries):
+    hits = {key: cache.get(key) for key in keys}
+    for key, text in new_entries:
+        cache.put(key, text)
+    return hits
+
+
+def bulk(cache, keys, new_entries):
+    hits = cache.get_many(keys)
+    cache.put_many(new_entries)
+    return hits
+
+
+def run(name, fn, n_lemmas, n_requests):
+    cache = TranslationCache(str(Path(tempfile.mkdtemp()) / "translations.db"))
+    timings = []
+    for r in range(n_requests):
+        # Half of each request's lemmas were seen before, half are new
+        keys = [Key(f"wort{r * n_lemmas // 2 + i}", "de", "en") for i in range(n_lemmas)]
+        new_entries = [(key, f"word {key.source_text}") for key in keys[n_lemmas // 2:]]
+
+        start = time.perf_counter()
+        fn(cache, keys, new_entries)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    print(f"{name:>9}: median {statistics.median(timings):8.2f} ms/request  "
+          f"max {max(timings):8.2f} ms")
+    return statistics.median(timings)
+
+
+def main():
+    n_lemmas = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    n_requests = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    before = run("per-word", per_word, n_lemmas, n_requests)
+    after = run("bulk", bulk, n_lemmas, n_requests)
+    print(f"speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
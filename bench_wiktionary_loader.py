@@ -0,0 +1,70 @@
+"""
+Compare the single-threaded line-by-line loader with the parallel
+byte-range loader on a local kaikki JSONL file.
+
+    python bench_wiktionary_loader.py [path/to/kaikki.jsonl]
+
+Without a path, a synthetic dump is generated in a temp directory.
+"""
+from pathlib import Path
+import json
+import sys
+import tempfile
+import time
+
+from core.wiktionary_loader import iter_entries_from_path, load_nouns_and_verbs
+
+
+def make_synthetic_dump(path: Path, lines: int = 500_000) -> None:
+    with path.open("w", encoding="utf-8") as f:
+        for i in range(lines):
+            if i % 2:
+                entry = {"word": f"Wort{i}", "pos": "noun", "gender": "n",
+                         "plural": f"Wörter{i}", "definition": "word", "example": "Ein Wort."}
+            else:
+                entry = {"word": f"gehen{i}", "pos": "verb",
+                         "definition": "to go", "example": "Ich gehe."}
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def count_lines(path: Path) -> int:
+    with path.open("rb") as f:
+        return sum(1 for _ in f)
+
+
+def sequential(path: Path):
+    # Same per-line json.loads loop as load_nouns_and_verbs_from_url
+    noun_info, verb_info = {}, {}
+    for pos, lemma, info in iter_entries_from_path(path):
+        (noun_info if pos == "noun" else verb_info)[lemma] = info
+    return noun_info, verb_info
+
+
+def main():
+    if len(sys.argv) > 1:
+        path = Path(sys.argv[1])
+    else:
+        path = Path(tempfile.mkdtemp()) / "synthetic.jsonl"
+        make_synthetic_dump(path)
+
+    lines = count_lines(path)
+    print(f"{path}: {lines} lines, {path.stat().st_size / 1e6:.1f} MB")
+
+    start = time.perf_counter()
+    seq_nouns, seq_verbs = sequential(path)
+    seq_time = time.perf_counter() - start
+    print(f"sequential: {seq_time:.2f}s  {lines / seq_time:,.0f} lines/sec")
+
+    def progress(done, total, lines_done):
+        print(f"  {done / total:6.1%}  {lines_done:,} lines", end="\r")
+
+    start = time.perf_counter()
+    par_nouns, par_verbs = load_nouns_and_verbs(path, chunk_bytes=8 * 1024 * 1024, progress=progress)
+    par_time = time.perf_counter() - start
+    print(f"\nparallel:   {par_time:.2f}s  {lines / par_time:,.0f} lines/sec  ({seq_time / par_time:.1f}x)")
+
+    assert par_nouns == seq_nouns and par_verbs == seq_verbs, "loaders disagree"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""
+CEFR level index with compound-word decomposition.
+
+load_cefr_files only knows lemmas listed verbatim in data/cefr, so most
+German compounds (haustür, hundebett) fall through to "B2+ / Unknown".
+CEFRIndex answers those by splitting the lemma into listed components,
+longest match first, optionally joined by a linking element (Fugenelement),
+and derives the level as the hardest component's level:
+
+    haustür     -> haus (A1) + tür (A1)          -> A1
+    wohnungstür -> wohnung (A1) + s + tür (A1)   -> A1
+    reiseflug   -> reise (A1) + flug (B1)        -> B1
+
+The index is compiled once and cached as a pickle snapshot next to the CSVs,
+so workers don't re-parse them:
+
+    python -m core.cefr_index data/cefr/*.csv
+"""
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+import logging
+import os
+import pickle
+import sys
+import tempfile
+
+from core.cefr_loader import load_cefr_files
+from core.lemma_lookup import LazyLemmaLookup
+
+logger = logging.getLogger(__name__)
+
+# Bump this whenever the pickled layout changes.
+SNAPSHOT_VERSION = "1"
+
+# Easiest to hardest; a compound is as hard as its hardest part
+LEVEL_ORDER = ("A1", "A2", "B1", "B2", "C1", "C2")
+_LEVEL_RANK = {level: rank for rank, level in enumerate(LEVEL_ORDER)}
+
+# Linking elements allowed between compound components, longest first
+LINKING_ELEMENTS = ("ens", "es", "en", "er", "s", "n", "e")
+
+# Shorter components produce too many false splits (e.g. "ei", "er")
+MIN_COMPONENT = 3
+
+# Key in the trie dicts marking "a listed lemma ends here"
+_END = ""
+
+
+class CEFRIndex(Mapping):
+    """
+    Drop-in replacement for the load_cefr_files dict: .get(lemma, default)
+    returns the listed level, or a level derived from the lemma's compound
+    components, or default.
+
+    Iteration and len() cover the listed lemmas only. Derived levels
+    (including misses) are memoized in a bounded LRU.
+    """
+
+    def __init__(self, levels: Dict[str, str], min_component: int = MIN_COMPONENT, cache_size: int = 65536):
+        self.levels = levels
+        self.min_component = min_component
+        self._trie: Dict = {}
+        for lemma in levels:
+            if len(lemma) >= min_component:
+                node = self._trie
+                for ch in lemma:
+                    node = node.setdefault(ch, {})
+                node[_END] = True
+        self._derived = LazyLemmaLookup(self._derive_level, maxsize=cache_size)
+
+    # ---------------------------
+    # Compound decomposition
+    # ---------------------------
+    def _prefix_ends(self, word: str, start: int) -> List[int]:
+        """End offsets of listed lemmas that start at word[start], longest first."""
+        ends = []
+        node = self._trie
+        for i in range(start, len(word)):
+            node = node.get(word[i])
+            if node is None:
+                break
+            if _END in node:
+                ends.append(i + 1)
+        ends.reverse()
+        return ends
+
+    def decompose(self, lemma: str) -> Optional[List[str]]:
+        """
+        Split lemma into listed components (linking elements dropped),
+        preferring the longest first component. None if no split covers
+        the whole word; a listed lemma is never split.
+        """
+        word = lemma.lower()
+        if word in self.levels:
+            return None
+        failed = set()   # start offsets already known not to split
+
+        def split(start: int) -> Optional[List[str]]:
+            if start in failed:
+                return None
+            for end in self._prefix_ends(word, start):
+                # A compound needs at least two parts
+                if end == len(word):
+                    if start > 0:
+                        return [word[start:end]]
+                    continue
+                rest = split(end)
+                if rest is None:
+                    for link in LINKING_ELEMENTS:
+                        if word.startswith(link, end) and end + len(link) < len(word):
+                            rest = split(end + len(link))
+                            if rest is not None:
+                                break
+                if rest is not None:
+                    return [word[start:end]] + rest
+            failed.add(start)
+            return None
+
+        return split(0)
+
+    def _derive_level(self, lemma: str) -> Optional[str]:
+        parts = self.decompose(lemma)
+        if parts is None:
+            return None
+        return max((self.levels[p] for p in parts), key=lambda level: _LEVEL_RANK.get(level, len(LEVEL_ORDER)))
+
+    # ---------------------------
+    # Mapping interface
+    # ---------------------------
+    def get(self, lemma, default=None):
+        level = self.levels.get(lemma)
+        if level is not None:
+            return level
+        return self._derived.get(lemma, default)
+
+    def __getitem__(self, lemma) -> str:
+        level = self.get(lemma)
+        if level is None:
+            raise KeyError(lemma)
+        return level
+
+    def __contains__(self, lemma) -> bool:
+        return self.get(lemma) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.levels)
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def stats(self) -> Dict[str, int]:
+        return {"listed": len(self.levels), "derived_cache": self._derived.stats()}
+
+    # ---------------------------
+    # Snapshots
+    # ---------------------------
+    def save(self, path: Path) -> None:
+        """
+        Pickle the compiled index. Each writer uses its own temp file next
+        to path and moves it into place, so workers rebuilding at the same
+        time never interleave their writes.
+        """
+        path = Path(path)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(
+                    {
+                        "version": SNAPSHOT_VERSION,
+                        "levels": self.levels,
+                        "min_component": self.min_component,
+                        "trie": self._trie,
+                    },
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    @classmethod
+    def load(cls, path: Path, cache_size: int = 65536) -> "CEFRIndex":
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        if data.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(
+                f"CEFR snapshot {path} has version {data.get('version')!r}, expected {SNAPSHOT_VERSION!r}"
+            )
+        index = cls.__new__(cls)
+        index.levels = data["levels"]
+        index.min_component = data["min_component"]
+        index._trie = data["trie"]
+        index._derived = LazyLemmaLookup(index._derive_level, maxsize=cache_size)
+        return index
+
+
+def load_cefr_index(paths: Iterable[Path], snapshot_path: Optional[Path] = None) -> CEFRIndex:
+    """
+    Load the CEFR index from snapshot_path if it is newer than every CSV,
+    otherwise build it from the CSVs and (re)write the snapshot.
+    """
+    paths = [Path(p) for p in paths]
+    if snapshot_path is not None:
+        snapshot_path = Path(snapshot_path)
+        if snapshot_path.exists():
+            snapshot_mtime = snapshot_path.stat().st_mtime_ns
+            if all(p.stat().st_mtime_ns <= snapshot_mtime for p in paths if p.exists()):
+                try:
+                    return CEFRIndex.load(snapshot_path)
+                except Exception as e:
+                    # Stale, truncated or otherwise unreadable: the CSVs are the source of truth
+                    logger.warning("Rebuilding CEFR snapshot: %s", e)
+
+    index = CEFRIndex(load_cefr_files(paths))
+    if snapshot_path is not None:
+        try:
+            index.save(snapshot_path)
+        except OSError as e:
+            # Read-only deployments still work, they just rebuild per worker
+            logger.warning("Could not write CEFR snapshot %s: %s", snapshot_path, e)
+    return index
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("usage: python -m core.cefr_index <csv> [<csv> ...]")
+        sys.exit(2)
+
+    csv_paths = [Path(p) for p in sys.argv[1:]]
+    target = csv_paths[0].parent / "cefr_index.pickle"
+    cefr_index = CEFRIndex(load_cefr_files(csv_paths))
+    cefr_index.save(target)
+    print(f"Wrote {target}: {len(cefr_index)} lemmas")
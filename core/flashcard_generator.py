@@ -1,71 +1,138 @@
-from typing import List, Dict
-from core.flashcard_model import Flashcard
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple, Type, Union
+from core.flashcard_model import Flashcard, LemmaFlashcard
+from core.token_table import TokenTable
 from core.display_formatters import format_noun, format_verb
 
+# Example sentences kept per card in lemma-aggregated mode
+MAX_EXAMPLES = 3
+
+def _rows(word_data: Union[List[dict], TokenTable]) -> Iterator[Tuple[str, str, str, Optional[str]]]:
+    # Accept both the classic list of token dicts and the columnar TokenTable
+    if isinstance(word_data, TokenTable):
+        return word_data.rows()
+    return ((e["word"], e["lemma"], e["pos_tag"], e.get("sentence")) for e in word_data)
+
+def _set_display(card: Flashcard, info: Mapping, formatter, *args, **kwargs) -> None:
+    # Display strings are precomputed by core.wiktionary_loader; only
+    # entries without them (older indexes, hand-made dicts) are formatted here.
+    if "display_word" in info:
+        card.display_word = info["display_word"]
+        card.display_details = info.get("display_details")
+    else:
+        formatted = formatter(*args, **kwargs)
+        card.display_word = formatted["display_word"]
+        card.display_details = formatted["display_details"]
+
+def _build_card(
+    word: str,
+    lemma: str,
+    pos: str,
+    example_sentence: Optional[str],
+    translation: str,
+    cefr_lookup: Mapping[str, str],
+    noun_info: Mapping[str, Dict[str, str]],
+    verb_info: Mapping[str, Dict[str, str]],
+    card_cls: Type[Flashcard] = Flashcard,
+) -> Flashcard:
+    # CEFR fallback = B2+ / Unknown
+    cefr = cefr_lookup.get(lemma, "B2+ / Unknown")
+
+    # Base flashcard
+    card = card_cls(
+        word=word,
+        lemma=lemma,
+        pos=pos,
+        translation=translation,
+        cefr=cefr,
+        example_sentence=example_sentence,
+    )
+
+    # ---------------------
+    # NOUN FEATURES
+    # ---------------------
+    # One .get() per lemma: noun_info / verb_info may be plain dicts or
+    # lazy lookups backed by the Wiktionary index.
+    info = noun_info.get(lemma) if pos == "NOUN" else None
+    if info is not None:
+        card.article = info.get("article")
+        card.plural = info.get("plural")
+        _set_display(card, info, format_noun, article=card.article, lemma=lemma, plural=card.plural)
+
+    # ---------------------
+    # VERB FEATURES
+    # ---------------------
+    info = verb_info.get(lemma) if pos == "VERB" else None
+    if info is not None:
+        # Entries from older loaders are the conjugation dict themselves
+        card.conjugations = info.get("conjugations", info)
+        _set_display(card, info, format_verb, lemma, card.conjugations)
+
+    return card
+
 def generate_flashcards(
-    word_data: List[dict],
+    word_data: Union[List[dict], TokenTable],
     translations: Dict[str, str],
-    cefr_lookup: Dict[str, str],
-    noun_info: Dict[str, Dict[str, str]],
-    verb_info: Dict[str, Dict[str, str]],
+    cefr_lookup: Mapping[str, str],
+    noun_info: Mapping[str, Dict[str, str]],
+    verb_info: Mapping[str, Dict[str, str]],
 ) -> List[Flashcard]:
 
     flashcards: List[Flashcard] = []
 
-    for entry in word_data:
-        lemma = entry["lemma"].lower()
-        pos = entry["pos_tag"]
+    for word, lemma, pos, example_sentence in _rows(word_data):
+        lemma = lemma.lower()
 
         # Skip words without a translation
         if lemma not in translations:
             continue
 
-        # CEFR fallback = B2+ / Unknown
-        cefr = cefr_lookup.get(lemma, "B2+ / Unknown")
-
-        # Example sentence from the pipeline
-        example_sentence = entry.get("sentence")
-
-        # Base flashcard
-        card = Flashcard(
-            word=entry["word"],
-            lemma=lemma,
-            pos=pos,
-            translation=translations[lemma],
-            cefr=cefr,
-            example_sentence=example_sentence,
-        )
-
-        # ---------------------
-        # NOUN FEATURES
-        # ---------------------
-        if pos == "NOUN" and lemma in noun_info:
-            info = noun_info[lemma]
-            card.article = info.get("article")
-            card.plural = info.get("plural")
-
-            # Display formatting for nouns
-            formatted = format_noun(
-                article=card.article,
-                lemma=card.lemma,
-                plural=card.plural,
-            )
-            card.display_word = formatted["display_word"]
-            card.display_details = formatted["display_details"]
+        flashcards.append(_build_card(
+            word, lemma, pos, example_sentence, translations[lemma],
+            cefr_lookup, noun_info, verb_info,
+        ))
 
-        # ---------------------
-        # VERB FEATURES
-        # ---------------------
-        if pos == "VERB" and lemma in verb_info:
-            conj = verb_info[lemma]
-            card.conjugations = conj
+    return flashcards
 
-            # Display formatting for verbs
-            formatted = format_verb(lemma, conj)
-            card.display_word = formatted["display_word"]
-            card.display_details = formatted["display_details"]
+def generate_lemma_flashcards(
+    word_data: Union[List[dict], TokenTable],
+    translations: Dict[str, str],
+    cefr_lookup: Mapping[str, str],
+    noun_info: Mapping[str, Dict[str, str]],
+    verb_info: Mapping[str, Dict[str, str]],
+    max_examples: int = MAX_EXAMPLES,
+) -> List[LemmaFlashcard]:
+    """
+    One card per (lemma, POS) instead of one per token, in order of first
+    appearance. Each card carries the occurrence count, the distinct
+    surface forms and up to max_examples distinct example sentences.
+    Lookups and formatting happen once per card, in a single pass.
+    """
+    cards: Dict[Tuple[str, str], LemmaFlashcard] = {}
 
-        flashcards.append(card)
+    for word, lemma, pos, example_sentence in _rows(word_data):
+        lemma = lemma.lower()
 
-    return flashcards
+        # Skip words without a translation
+        if lemma not in translations:
+            continue
+
+        card = cards.get((lemma, pos))
+        if card is None:
+            card = _build_card(
+                word, lemma, pos, example_sentence, translations[lemma],
+                cefr_lookup, noun_info, verb_info, LemmaFlashcard,
+            )
+            card.occurrences = 1
+            card.forms = [word]
+            card.examples = [example_sentence] if example_sentence and max_examples > 0 else []
+            cards[(lemma, pos)] = card
+            continue
+
+        card.occurrences += 1
+        if word not in card.forms:
+            card.forms.append(word)
+        if (example_sentence and len(card.examples) < max_examples
+                and example_sentence not in card.examples):
+            card.examples.append(example_sentence)
 
+    return list(cards.values())
@@ -0,0 +1,48 @@
+"""
+Direct JSON encoding of API payloads containing Flashcards.
+
+Cards are written straight to UTF-8 bytes: with orjson, dataclass instances
+are serialized natively without building an intermediate dict per card;
+without it, the stdlib encoder falls back to Flashcard.to_dict().
+"""
+from typing import Any
+import json
+
+from core.flashcard_model import Flashcard
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+def _omit_none(obj: Any) -> Any:
+    if isinstance(obj, Flashcard):
+        return obj.to_dict(omit_none=True)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _stdlib_default(obj: Any) -> Any:
+    if isinstance(obj, Flashcard):
+        return obj.to_dict()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(obj: Any, omit_none: bool = False) -> bytes:
+    """
+    Encode obj (dicts/lists that may contain Flashcards) as JSON bytes.
+    omit_none drops card fields that are None, which is most of them
+    for words that are neither nouns nor verbs.
+    """
+    if orjson is not None:
+        if omit_none:
+            # Hand dataclasses to default= instead of the native encoder
+            return orjson.dumps(obj, default=_omit_none, option=orjson.OPT_PASSTHROUGH_DATACLASS)
+        return orjson.dumps(obj)
+
+    return json.dumps(
+        obj,
+        default=_omit_none if omit_none else _stdlib_default,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
@@ -1,7 +1,7 @@
-from dataclasses import dataclass
-from typing import Optional, Dict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
-@dataclass
+@dataclass(slots=True)
 class Flashcard:
     word: str                    # surface form from text
     lemma: str                   # dictionary form
@@ -20,3 +20,26 @@ class Flashcard:
     # --- Display formatting ---
     display_word: Optional[str] = None
     display_details: Optional[str] = None
+
+    def to_dict(self, omit_none: bool = False) -> Dict[str, Any]:
+        """
+        Shallow dict of the card's fields. Unlike dataclasses.asdict, nested
+        values (conjugations) are shared, not deep-copied.
+        """
+        if omit_none:
+            return {
+                name: value for name in self.__dataclass_fields__
+                if (value := getattr(self, name)) is not None
+            }
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
+
+@dataclass(slots=True)
+class LemmaFlashcard(Flashcard):
+    """
+    Card for lemma-aggregated mode. The extra fields live on a subclass so
+    that token-mode cards keep their original JSON shape.
+    """
+    occurrences: int = 0                                    # tokens of this lemma+POS in the text
+    forms: List[str] = field(default_factory=list)          # distinct surface forms, in order of appearance
+    examples: List[str] = field(default_factory=list)       # first few distinct example sentences
@@ -0,0 +1,132 @@
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import threading
+
+import spacy
+
+from core.pipeline import DEFAULT_PROFILE, PIPELINE_PROFILES, get_nlp, _doc_to_table
+from core.token_table import TokenTable
+
+
+class IncrementalPipeline:
+    """
+    Sentence-level cache in front of the spaCy pipeline.
+
+    Input is split into sentences with a cheap rule-based sentencizer, each
+    sentence is looked up by hash, and only new or edited sentences go
+    through the full model. Results are stitched back into one TokenTable
+    (or the classic word_data / vocab_list pair), so editing one sentence of
+    a long text only costs one sentence of parsing.
+
+    Sentences are parsed on their own, so results can differ slightly from
+    parsing the whole document at once. Only profiles with sentence_cache
+    set ("fast") go through the cache; the others are parsed as whole
+    documents, exactly like german_nlp_table.
+    """
+
+    def __init__(self, max_sentences: int = 20000):
+        self.max_sentences = max_sentences
+        self._tables: "OrderedDict[str, TokenTable]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._splitter = None
+        self.hits = 0
+        self.misses = 0
+
+    def split_sentences(self, text: str) -> List[str]:
+        if self._splitter is None:
+            splitter = spacy.blank("de")
+            splitter.add_pipe("sentencizer")
+            self._splitter = splitter
+        return [s.text for s in self._splitter(text).sents if s.text.strip()]
+
+    @staticmethod
+    def _key(sentence: str, profile: str) -> str:
+        return hashlib.sha1(f"{profile}\x1f{sentence}".encode("utf-8")).hexdigest()
+
+    def sentence_tables(self, sentences: List[str], profile: Optional[str] = None) -> List[TokenTable]:
+        """One TokenTable per sentence, parsing only the ones not cached yet."""
+        profile = profile or DEFAULT_PROFILE
+        keys = [self._key(s, profile) for s in sentences]
+
+        tables: Dict[str, TokenTable] = {}
+        with self._lock:
+            for key in keys:
+                table = self._tables.get(key)
+                if table is not None:
+                    self._tables.move_to_end(key)
+                    tables[key] = table
+
+        # Parse what's missing in one nlp.pipe call (repeated sentences once)
+        todo = {key: s for key, s in zip(keys, sentences) if key not in tables}
+        with self._lock:
+            self.hits += len(keys) - len(todo)
+            self.misses += len(todo)
+        if todo:
+            docs = get_nlp(profile).pipe(todo.values())
+            parsed = {key: _doc_to_table(doc) for key, doc in zip(todo, docs)}
+            tables.update(parsed)
+
+            with self._lock:
+                self._tables.update(parsed)
+                while len(self._tables) > self.max_sentences:
+                    self._tables.popitem(last=False)
+
+        return [tables[key] for key in keys]
+
+    @staticmethod
+    def uses_cache(profile: Optional[str] = None) -> bool:
+        return PIPELINE_PROFILES[profile or DEFAULT_PROFILE].get("sentence_cache", False)
+
+    def process_table(self, text: str, profile: Optional[str] = None) -> TokenTable:
+        if not self.uses_cache(profile):
+            return _doc_to_table(get_nlp(profile)(text))
+        return stitch_tables(self.sentence_tables(self.split_sentences(text), profile))
+
+    def process_tables(self, texts: List[str], profile: Optional[str] = None) -> List[TokenTable]:
+        """
+        One TokenTable per text. Cached profiles send every new sentence of
+        every text through a single nlp.pipe pass; the others pipe whole texts.
+        """
+        if not self.uses_cache(profile):
+            return [_doc_to_table(doc) for doc in get_nlp(profile).pipe(texts)]
+
+        doc_sentences = [self.split_sentences(text) for text in texts]
+        all_tables = self.sentence_tables([s for sentences in doc_sentences for s in sentences], profile)
+        doc_tables = []
+        start = 0
+        for sentences in doc_sentences:
+            doc_tables.append(stitch_tables(all_tables[start:start + len(sentences)]))
+            start += len(sentences)
+        return doc_tables
+
+    def process(self, text: str, profile: Optional[str] = None) -> Tuple[List[Dict], List[str]]:
+        """Drop-in for german_nlp: returns (word_data, vocab_list)."""
+        table = self.process_table(text, profile)
+        return table.to_dicts(), table.vocab
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "sentences": len(self._tables)}
+
+
+def stitch_tables(tables: List[TokenTable]) -> TokenTable:
+    """
+    Concatenate per-sentence tables into one document table, renumbering
+    sentence indices and deduplicating the vocab across sentences.
+    """
+    out = TokenTable()
+    seen = set()
+    for table in tables:
+        offset = len(out.sentences)
+        out.sentences.extend(table.sentences)
+        out.words.extend(table.words)
+        out.lemmas.extend(table.lemmas)
+        out.pos.extend(table.pos)
+        out.flags.extend(table.flags)
+        out.sent_idx.extend(i + offset for i in table.sent_idx)
+        for lemma in table.vocab:
+            if lemma not in seen:
+                seen.add(lemma)
+                out.vocab.append(lemma)
+    return out
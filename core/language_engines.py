@@ -0,0 +1,231 @@
+"""
+spaCy pipelines for several study languages in one process.
+
+Models are loaded on first use per (study_lang, profile) and kept in LRU
+order. When a memory budget is set and the loaded models exceed it, the
+least recently used ones are dropped, so a worker can serve several
+languages without holding every model resident.
+"""
+from collections import OrderedDict
+from concurrent.futures import Future
+from importlib import metadata
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import gc
+import os
+import threading
+import time
+
+# Default spaCy model per study language (ISO 639-1 code)
+LANGUAGE_MODELS: Dict[str, str] = {
+    "de": "de_core_news_md",
+    "fr": "fr_core_news_md",
+    "es": "es_core_news_md",
+    "ko": "ko_core_news_md",
+    "zh": "zh_core_web_md",
+}
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def _rss_bytes() -> Optional[int]:
+    """Current resident set size, or None where /proc isn't available."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _package_bytes(model_name: str) -> int:
+    """Installed size of a model package; the fallback size estimate."""
+    try:
+        files = metadata.files(model_name) or []
+    except metadata.PackageNotFoundError:
+        return 0
+    total = 0
+    for f in files:
+        try:
+            total += os.path.getsize(f.locate())
+        except OSError:
+            pass
+    return total
+
+
+def _load_spacy(model_name: str, exclude: List[str]):
+    import spacy
+    return spacy.load(model_name, exclude=exclude)
+
+
+class _Engine:
+    __slots__ = ("model", "model_name", "size_bytes", "load_seconds", "uses")
+
+    def __init__(self, model, model_name: str, size_bytes: int, load_seconds: float):
+        self.model = model
+        self.model_name = model_name
+        self.size_bytes = size_bytes
+        self.load_seconds = load_seconds
+        self.uses = 0
+
+
+class LanguageEngineRegistry:
+    """
+    Lazily loaded spaCy pipelines keyed by (study_lang, profile).
+
+    Each model's memory is measured as the growth in resident memory while
+    loading it (falling back to its installed package size). After a load
+    pushes the total over memory_budget_bytes, least recently used models
+    are evicted until the total fits again; the model just loaded is never
+    evicted. memory_budget_bytes=None means no limit.
+
+    Callers that still hold an evicted model can keep using it; it is freed
+    once the last reference goes away.
+
+    Loads happen outside the lookup lock, so requests for models that are
+    already loaded never wait behind one that is loading. Concurrent
+    requests for the same model share its load.
+    """
+
+    def __init__(
+        self,
+        profiles: Dict[str, Dict],
+        models: Optional[Dict[str, str]] = None,
+        memory_budget_bytes: Optional[int] = None,
+        loader: Callable[[str, List[str]], Any] = _load_spacy,
+        size_of: Optional[Callable[[Any, str], int]] = None,
+    ):
+        self.profiles = profiles
+        self.models = dict(LANGUAGE_MODELS if models is None else models)
+        self.memory_budget_bytes = memory_budget_bytes
+        self._loader = loader
+        self._size_of = size_of
+        self._engines: "OrderedDict[Tuple[str, str], _Engine]" = OrderedDict()
+        # Held only briefly, for lookups and bookkeeping
+        self._lock = threading.RLock()
+        # Models being loaded, so concurrent callers share one load
+        self._loading: Dict[Tuple[str, str], Future] = {}
+        # Loads are rare; running one at a time keeps the resident-memory
+        # deltas attributable to one model
+        self._load_lock = threading.Lock()
+        self.loads = 0
+        self.evictions = 0
+
+    def model_name(self, study_lang: str) -> str:
+        try:
+            return self.models[study_lang]
+        except KeyError:
+            raise ValueError(
+                f"No NLP model for study language {study_lang!r}; expected one of {sorted(self.models)}"
+            ) from None
+
+    def get(self, study_lang: str, profile: str):
+        """The pipeline for study_lang and profile, loading it on first use."""
+        if profile not in self.profiles:
+            raise ValueError(
+                f"Unknown NLP profile {profile!r}; expected one of {sorted(self.profiles)}"
+            )
+        key = (study_lang, profile)
+
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is not None:
+                self._engines.move_to_end(key)
+                engine.uses += 1
+                return engine.model
+            future = self._loading.get(key)
+            loading = future is None
+            if loading:
+                future = self._loading[key] = Future()
+
+        if not loading:
+            # Someone else is loading it; raises if their load failed
+            model = future.result()
+            with self._lock:
+                engine = self._engines.get(key)
+                if engine is not None:
+                    engine.uses += 1
+            return model
+
+        try:
+            with self._load_lock:
+                engine = self._load(study_lang, profile)
+        except BaseException as e:
+            with self._lock:
+                del self._loading[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._engines[key] = engine
+            engine.uses += 1
+            self.loads += 1
+            evicted = self._evict_over_budget(keep=key)
+            del self._loading[key]
+        future.set_result(engine.model)
+        if evicted:
+            # spaCy models are full of reference cycles; free them now
+            gc.collect()
+        return engine.model
+
+    def _load(self, study_lang: str, profile: str) -> _Engine:
+        model_name = self.model_name(study_lang)
+        config = self.profiles[profile]
+
+        rss_before = _rss_bytes()
+        start = time.perf_counter()
+        model = self._loader(model_name, config["exclude"])
+        if config["sentencizer"]:
+            model.add_pipe("sentencizer", first=True)
+        load_seconds = time.perf_counter() - start
+        rss_after = _rss_bytes()
+
+        if self._size_of is not None:
+            size = self._size_of(model, model_name)
+        elif rss_before is not None and rss_after is not None and rss_after > rss_before:
+            size = rss_after - rss_before
+        else:
+            size = _package_bytes(model_name)
+
+        return _Engine(model, model_name, size, load_seconds)
+
+    def _evict_over_budget(self, keep: Tuple[str, str]) -> bool:
+        """Evict LRU engines until the budget fits; True if any were. Caller holds _lock."""
+        if self.memory_budget_bytes is None:
+            return False
+        evicted = False
+        for key in list(self._engines):
+            if self.resident_bytes() <= self.memory_budget_bytes:
+                break
+            if key != keep:
+                self._engines.pop(key)
+                self.evictions += 1
+                evicted = True
+        return evicted
+
+    def evict(self, study_lang: str, profile: str) -> bool:
+        with self._lock:
+            return self._engines.pop((study_lang, profile), None) is not None
+
+    def resident_bytes(self) -> int:
+        with self._lock:
+            return sum(engine.size_bytes for engine in self._engines.values())
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "memory_budget_bytes": self.memory_budget_bytes,
+                "resident_bytes": self.resident_bytes(),
+                "loads": self.loads,
+                "evictions": self.evictions,
+                # Least recently used first
+                "engines": [
+                    {
+                        "study_lang": lang,
+                        "profile": profile,
+                        "model": engine.model_name,
+                        "size_bytes": engine.size_bytes,
+                        "load_seconds": round(engine.load_seconds, 3),
+                        "uses": engine.uses,
+                    }
+                    for (lang, profile), engine in self._engines.items()
+                ],
+            }
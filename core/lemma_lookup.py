@@ -0,0 +1,79 @@
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterator, Optional
+import threading
+
+# Marks "looked up, not in the store" so misses are cached too
+_MISSING = object()
+
+
+class LazyLemmaLookup(Mapping):
+    """
+    Dict-like noun_info / verb_info replacement that fetches entries from a
+    backing store (e.g. WiktionaryIndex.nouns.get) on first access and keeps
+    the most recently used ones in a size-bounded LRU.
+
+    Iteration and len() only cover what is currently cached, not the store.
+    """
+
+    def __init__(self, fetch: Callable[[str], Optional[Dict]], maxsize: int = 4096):
+        self._fetch = fetch
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, object]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, lemma, default=None):
+        with self._lock:
+            value = self._entries.get(lemma, None)
+            if value is not None:
+                self._entries.move_to_end(lemma)
+                self.hits += 1
+                return default if value is _MISSING else value
+            self.misses += 1
+
+        # Fetch outside the lock; two threads racing on the same lemma
+        # just both read it from the store.
+        fetched = self._fetch(lemma)
+        value = _MISSING if fetched is None else fetched
+
+        with self._lock:
+            self._entries[lemma] = value
+            self._entries.move_to_end(lemma)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return default if fetched is None else fetched
+
+    def __getitem__(self, lemma) -> Dict:
+        value = self.get(lemma)
+        if value is None:
+            raise KeyError(lemma)
+        return value
+
+    def __contains__(self, lemma) -> bool:
+        return self.get(lemma) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter([k for k, v in self._entries.items() if v is not _MISSING])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(1 for v in self._entries.values() if v is not _MISSING)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
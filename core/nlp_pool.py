@@ -0,0 +1,162 @@
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import logging
+import multiprocessing
+import threading
+import time
+
+from core.token_table import TokenTable
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------
+# Worker side
+# ---------------------------
+# Each worker process holds its own loaded model and sentence cache.
+_worker_pipeline = None
+
+
+def _init_worker(profiles: List[Optional[str]], max_sentences: int) -> None:
+    global _worker_pipeline
+    from core.pipeline import get_nlp
+    from core.incremental_pipeline import IncrementalPipeline
+
+    for profile in profiles:
+        get_nlp(profile)
+    _worker_pipeline = IncrementalPipeline(max_sentences=max_sentences)
+    _worker_pipeline.split_sentences("Warm.")
+
+
+def _ping() -> bool:
+    return True
+
+
+def _process_table(text: str, profile: Optional[str]) -> Tuple[TokenTable, float, int, int]:
+    """The table, busy seconds, and this call's sentence cache hits and misses."""
+    start = time.perf_counter()
+    before = _worker_pipeline.stats()
+    table = _worker_pipeline.process_table(text, profile)
+    after = _worker_pipeline.stats()
+    return (
+        table,
+        time.perf_counter() - start,
+        after["hits"] - before["hits"],
+        after["misses"] - before["misses"],
+    )
+
+
+# ---------------------------
+# Parent side
+# ---------------------------
+class NLPPool:
+    """
+    Pre-warmed pool of worker processes running the NLP pipeline, so spaCy
+    parsing neither holds the GIL of the API process nor ties up its threadpool.
+
+    stats() exposes queue depth (submitted but not yet picked up), running
+    tasks, utilization (worker busy time over pool uptime) and the sentence
+    cache hits and misses summed over all workers. Each worker keeps its
+    own sentence cache of max_sentences entries.
+
+    If a worker dies, the executor is broken for good; the pool is then
+    restarted and the task retried once.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        profiles: Optional[List[Optional[str]]] = None,
+        start_method: str = "forkserver",
+        max_sentences: int = 20000,
+    ):
+        self.workers = workers
+        self.profiles = profiles or [None]
+        self.start_method = start_method
+        self.max_sentences = max_sentences
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        # Serializes restarts, so concurrent failures rebuild the pool once
+        self._restart_lock = threading.Lock()
+        self._started_at: Optional[float] = None
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.restarts = 0
+        self.busy_seconds = 0.0
+        self.sentence_hits = 0
+        self.sentence_misses = 0
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context(self.start_method),
+            initializer=_init_worker,
+            initargs=(self.profiles, self.max_sentences),
+        )
+        # One task per worker forces all of them to start (and initialize) now
+        for future in [executor.submit(_ping) for _ in range(self.workers)]:
+            future.result()
+        return executor
+
+    def start(self) -> "NLPPool":
+        """Start the workers and block until every one has loaded its model."""
+        self._executor = self._new_executor()
+        self._started_at = time.monotonic()
+        return self
+
+    def _restart(self, broken: ProcessPoolExecutor) -> None:
+        with self._restart_lock:
+            # Another task may already have replaced it
+            if self._executor is not broken:
+                return
+            logger.warning("NLP pool worker died, restarting the pool")
+            broken.shutdown(wait=False, cancel_futures=True)
+            self._executor = self._new_executor()
+            with self._lock:
+                self.restarts += 1
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def process_table(self, text: str, profile: Optional[str] = None) -> TokenTable:
+        with self._lock:
+            self.submitted += 1
+        loop = asyncio.get_running_loop()
+        try:
+            executor = self._executor
+            try:
+                result = await loop.run_in_executor(executor, _process_table, text, profile)
+            except BrokenProcessPool:
+                await asyncio.to_thread(self._restart, executor)
+                result = await loop.run_in_executor(self._executor, _process_table, text, profile)
+        except BaseException:
+            with self._lock:
+                self.failed += 1
+            raise
+        table, busy, hits, misses = result
+        with self._lock:
+            self.completed += 1
+            self.busy_seconds += busy
+            self.sentence_hits += hits
+            self.sentence_misses += misses
+        return table
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            in_flight = self.submitted - self.completed - self.failed
+            uptime = time.monotonic() - self._started_at if self._started_at else 0.0
+            return {
+                "workers": self.workers,
+                "queued": max(0, in_flight - self.workers),
+                "running": min(in_flight, self.workers),
+                "completed": self.completed,
+                "failed": self.failed,
+                "restarts": self.restarts,
+                "sentence_hits": self.sentence_hits,
+                "sentence_misses": self.sentence_misses,
+                "utilization": self.busy_seconds / (uptime * self.workers) if uptime else 0.0,
+            }
@@ -1,72 +1,165 @@
-import spacy
-from typing import List, Dict, Tuple
+from functools import lru_cache
+from importlib import metadata
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
+import logging
+import os
+
+from core.language_engines import LANGUAGE_MODELS, LanguageEngineRegistry
+from core.token_table import TokenTable, IS_STOP, IS_PUNCT, IS_SPACE, IS_ALPHA, KEPT
+
+logger = logging.getLogger(__name__)
+
+MODEL_NAME = LANGUAGE_MODELS["de"]
+DEFAULT_STUDY_LANG = "de"
+
+# Named pipeline profiles. We only use POS, lemma, stop-word flags and
+# sentence boundaries, so "fast" drops NER and the dependency parser and
+# gets sentence boundaries from the rule-based sentencizer instead.
+# sentence_cache: parse sentence by sentence through IncrementalPipeline's
+# cache. "accurate" parses whole documents, so its lemmas, POS and sentence
+# boundaries stay those of the full model.
+PIPELINE_PROFILES = {
+    "accurate": {"exclude": [], "sentencizer": False, "sentence_cache": False},
+    "fast": {"exclude": ["ner", "parser", "senter"], "sentencizer": True, "sentence_cache": True},
+}
+DEFAULT_PROFILE = os.getenv("NLP_PROFILE", "accurate")
+
+# Models for every study language are loaded on first use. With
+# NLP_MEMORY_BUDGET_MB set, least recently used ones are unloaded when the
+# loaded models together exceed it.
+_budget_mb = int(os.getenv("NLP_MEMORY_BUDGET_MB", "0"))
+engines = LanguageEngineRegistry(
+    PIPELINE_PROFILES,
+    memory_budget_bytes=_budget_mb * 1024 * 1024 if _budget_mb > 0 else None,
+)
+
+
+def get_nlp(profile: Optional[str] = None, study_lang: str = DEFAULT_STUDY_LANG):
+    """
+    Return the spaCy pipeline for a study language and profile, loading it
+    on first use. Defaults to German and the NLP_PROFILE env var
+    ("accurate" if unset).
+    """
+    return engines.get(study_lang, profile or DEFAULT_PROFILE)
+
+
+@lru_cache(maxsize=None)
+def model_version(study_lang: str = DEFAULT_STUDY_LANG) -> str:
+    """
+    Installed model name and version (e.g. for cache keys), read from package
+    metadata so it doesn't require loading the model.
+    """
+    model_name = engines.model_name(study_lang)
+    try:
+        return f"{model_name}-{metadata.version(model_name)}"
+    except metadata.PackageNotFoundError:
+        return model_name
+
 
-nlp = spacy.load('de_core_news_md')
 POS_WHITELIST = {"NOUN", "VERB", "ADJ", "ADV", "NUM"}
 
-def german_nlp(text: str) -> Tuple[List[Dict], List[str]]:
+def german_nlp(text: str, profile: Optional[str] = None) -> Tuple[List[Dict], List[str]]:
     # Load Spacy's German model
-    doc = nlp(text)
-
-    # 🔹 Pre-calculate all sentence boundaries once
-    sentences = list(doc.sents)
-
-    # Initialize a list
-    word_data: List[Dict] = []
-
-    # append token, pos, and lemma to the list
-    for token in doc:
-        # 🔹 Find the sentence this token belongs to
-        sentence_text = token.sent.text
-
-        entry = {
-            "word": token.text,
-            "pos_tag": token.pos_,
-            "lemma": token.lemma_,
-            "is_stop": token.is_stop,
-            "is_punct": token.is_punct,
-            "is_space": token.is_space,
-            "lemma_lower": token.lemma_.lower(),
-            "is_alpha": token.is_alpha,
-
-            # 🔹 New field: the full example sentence
-            "sentence": sentence_text
-        }
-        word_data.append(entry)
-
-    filtered: List[Dict] = []
-    for w in word_data:
-        if w["pos_tag"] not in POS_WHITELIST:
-            continue
-        if w["is_stop"] or w["is_punct"] or w["is_space"]:
-            continue
-        if not w["is_alpha"]:
-            continue
-        if w["pos_tag"] == "PROPN":
-            continue
-        filtered.append(w)
-
-    # Deduplicate by lemma (case-insensitive)
-    seen = set()
-    vocab_list: List[str] = []
-    for w in filtered:
-        lemma_norm = w["lemma"].lower().strip()
-        if lemma_norm and lemma_norm not in seen:
-            seen.add(lemma_norm)
-            vocab_list.append(lemma_norm)
-
-    # Optional: quick console preview for sanity
-    print("Original words:")
-    for w in word_data:
-        print(
-            f"{w['word']:>15}  stop={w['is_stop']} punct={w['is_punct']} space={w['is_space']} pos={w['pos_tag']}")
-
-    print("\nFiltered (kept) lemmas:")
-    for l in vocab_list:
-        print(f"  {l}")
+    doc = get_nlp(profile)(text)
+    word_data, vocab_list = _doc_to_vocab(doc)
+
+    # Optional token dump for sanity checks (LOG_LEVEL=DEBUG)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Original words:\n%s", "\n".join(
+            f"{w['word']:>15}  stop={w['is_stop']} punct={w['is_punct']} space={w['is_space']} pos={w['pos_tag']}"
+            for w in word_data
+        ))
+        logger.debug("Filtered (kept) lemmas:\n%s", "\n".join(f"  {l}" for l in vocab_list))
 
     return word_data, vocab_list
 
+
+def german_nlp_batch(
+    texts: Iterable[str],
+    batch_size: int = 64,
+    n_process: int = 1,
+    profile: Optional[str] = None,
+) -> Iterator[Tuple[List[Dict], List[str]]]:
+    """
+    Batch version of german_nlp for bulk jobs.
+    Runs the texts through nlp.pipe and yields one (word_data, vocab_list)
+    per input text, in input order. n_process > 1 forks spaCy worker processes.
+    """
+    for doc in get_nlp(profile).pipe(texts, batch_size=batch_size, n_process=n_process):
+        yield _doc_to_vocab(doc)
+
+
+def german_nlp_table(text: str, profile: Optional[str] = None) -> TokenTable:
+    """
+    Same analysis as german_nlp, returned as a columnar TokenTable
+    (table.vocab is the vocab_list). Cheaper for long inputs.
+    """
+    return nlp_table(text, DEFAULT_STUDY_LANG, profile)
+
+
+def nlp_table(text: str, study_lang: str, profile: Optional[str] = None) -> TokenTable:
+    """
+    german_nlp_table for any language in LANGUAGE_MODELS: same filtering
+    and dedupe, with that language's model.
+    """
+    return _doc_to_table(get_nlp(profile, study_lang)(text))
+
+
+def _doc_to_vocab(doc) -> Tuple[List[Dict], List[str]]:
+    """
+    Shared per-document logic, in the classic (word_data, vocab_list) shape.
+    """
+    table = _doc_to_table(doc)
+    return table.to_dicts(), table.vocab
+
+
+def _doc_to_table(doc) -> TokenTable:
+    """
+    Single pass over the doc: token columns, POS/stop-word filtering and
+    case-insensitive lemma dedupe.
+    """
+    table = TokenTable()
+    seen = set()
+
+    # Walking sentence by sentence stores each sentence text once,
+    # instead of looking up token.sent for every token.
+    for sent_index, sent in enumerate(doc.sents):
+        table.sentences.append(sent.text)
+
+        for token in sent:
+            pos_tag = token.pos_
+            # Models without a lemmatizer (e.g. Chinese) leave lemma_ empty
+            lemma = token.lemma_ or token.text
+
+            flags = 0
+            if token.is_stop:
+                flags |= IS_STOP
+            if token.is_punct:
+                flags |= IS_PUNCT
+            if token.is_space:
+                flags |= IS_SPACE
+            if token.is_alpha:
+                flags |= IS_ALPHA
+
+            # Keep content words only (PROPN is never in the whitelist)
+            if (
+                pos_tag in POS_WHITELIST
+                and not flags & (IS_STOP | IS_PUNCT | IS_SPACE)
+                and flags & IS_ALPHA
+            ):
+                flags |= KEPT
+
+                # Deduplicate by lemma (case-insensitive)
+                lemma_norm = lemma.lower().strip()
+                if lemma_norm and lemma_norm not in seen:
+                    seen.add(lemma_norm)
+                    table.vocab.append(lemma_norm)
+
+            table.append(token.text, lemma, pos_tag, flags, sent_index)
+
+    return table
+
+
 if __name__ == "__main__":
     sample = (
         "Ich habe vor einem Jahr angefangen, regelmäßig zu reisen, um neue Kulturen kennenzulernen. Besonders beeindruckt hat mich Japan, weil die Menschen dort unglaublich höflich und respektvoll sind. Während meiner Reise habe ich viele traditionelle Gerichte probiert und versucht, ein paar japanische Wörter zu lernen. Seitdem interessiere ich mich noch mehr für Sprachen und möchte eines Tages fließend Japanisch sprechen. Reisen hat mir gezeigt, wie wichtig Offenheit und Neugier im Leben sind."
@@ -74,15 +167,6 @@ if __name__ == "__main__":
     _, vocab = german_nlp(sample)
     print("\nUnique vocab lemmas:", vocab)
 
- #def french_nlp(text):
-
-#def spanish_nlp(text):
-
-#def korean_nlp(text):
-
-#def chinese_nlp(text):
-
-
 
 # def generate_flash_cards(text):
 #     # Load Spacy's German model
@@ -0,0 +1,153 @@
+from types import TracebackType
+from typing import Any, Callable, Dict, Iterable, Optional
+import asyncio
+import gc
+import logging
+import threading
+import time
+
+PENDING = "pending"
+LOADING = "loading"
+READY = "ready"
+FAILED = "failed"
+
+logger = logging.getLogger(__name__)
+
+
+class _Resource:
+    def __init__(self, name: str, loader: Callable[[], Any], fork_safe: bool):
+        self.name = name
+        self.loader = loader
+        self.fork_safe = fork_safe
+        self.value: Any = None
+        self.state = PENDING
+        self.load_seconds: Optional[float] = None
+        self.error: Optional[str] = None
+        self.exception: Optional[BaseException] = None
+        self.traceback: Optional[TracebackType] = None
+        self.failures = 0
+        self.retry_at = 0.0
+        self.lock = threading.Lock()
+
+
+class ResourceRegistry:
+    """
+    Lazily loaded, thread-safe home for heavy resources (spaCy models,
+    CEFR tables, Wiktionary data, API clients).
+
+    Nothing is loaded at import. A resource is loaded the first time get()
+    asks for it, or ahead of time by warm_up(); concurrent callers wait on
+    the same load instead of loading twice.
+
+    fork_safe marks resources that can be loaded once in a master process
+    (gunicorn --preload) and shared copy-on-write with forked workers.
+    Network clients and anything holding sockets should not be fork_safe.
+
+    A failed load is not retried on every call: until retry_after seconds
+    have passed, get() re-raises the stored error. The wait doubles with
+    each further failure, up to max_retry_after.
+    """
+
+    def __init__(
+        self,
+        retry_after: float = 5.0,
+        max_retry_after: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._resources: Dict[str, _Resource] = {}
+        self.retry_after = retry_after
+        self.max_retry_after = max_retry_after
+        self._clock = clock
+
+    def register(self, name: str, loader: Callable[[], Any], fork_safe: bool = True) -> None:
+        self._resources[name] = _Resource(name, loader, fork_safe)
+
+    def get(self, name: str) -> Any:
+        res = self._resources[name]
+        if res.state == READY:
+            return res.value
+
+        self._raise_if_cooling_down(res)
+
+        with res.lock:
+            # Someone else may have finished (or failed) loading while we waited
+            if res.state != READY:
+                self._raise_if_cooling_down(res)
+                res.state = LOADING
+                start = time.perf_counter()
+                try:
+                    res.value = res.loader()
+                except Exception as e:
+                    res.failures += 1
+                    delay = min(self.retry_after * 2 ** (res.failures - 1), self.max_retry_after)
+                    res.retry_at = self._clock() + delay
+                    res.exception, res.traceback = e, e.__traceback__
+                    res.error = f"{type(e).__name__}: {e}"
+                    res.state = FAILED
+                    raise
+                res.load_seconds = time.perf_counter() - start
+                res.error = None
+                res.exception = res.traceback = None
+                res.failures = 0
+                res.state = READY
+        return res.value
+
+    def _raise_if_cooling_down(self, res: _Resource) -> None:
+        if res.state == FAILED and self._clock() < res.retry_at:
+            # Reset to the original traceback so repeated raises don't grow it
+            raise res.exception.with_traceback(res.traceback)
+
+    async def aget(self, name: str) -> Any:
+        """
+        get() for async code: returns immediately once loaded, otherwise
+        waits for the load in a worker thread instead of blocking the loop.
+        """
+        res = self._resources[name]
+        if res.state == READY:
+            return res.value
+        self._raise_if_cooling_down(res)
+        return await asyncio.to_thread(self.get, name)
+
+    def warm_up(self, names: Optional[Iterable[str]] = None) -> None:
+        """
+        Load resources now (all of them by default). Failures are recorded
+        in status() rather than raised, so one bad resource doesn't stop the rest.
+        """
+        for name in names if names is not None else list(self._resources):
+            try:
+                self.get(name)
+            except Exception as e:
+                logger.warning("Failed to load resource %s: %s", name, e)
+
+    def warm_up_in_background(self, names: Optional[Iterable[str]] = None) -> threading.Thread:
+        thread = threading.Thread(target=self.warm_up, args=(names,), name="resource-warm-up", daemon=True)
+        thread.start()
+        return thread
+
+    def preload_shared(self) -> None:
+        """
+        Load every fork-safe resource in the current (master) process, then
+        freeze the GC so forked workers don't dirty the shared pages just by
+        running a collection over them.
+        """
+        self.warm_up([r.name for r in self._resources.values() if r.fork_safe])
+        gc.freeze()
+
+    def is_loaded(self, name: str) -> bool:
+        return self._resources[name].state == READY
+
+    def is_ready(self) -> bool:
+        return all(r.state == READY for r in self._resources.values())
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            r.name: {
+                "state": r.state,
+                "load_seconds": round(r.load_seconds, 3) if r.load_seconds is not None else None,
+                "error": r.error,
+                "retry_in": (
+                    round(max(r.retry_at - self._clock(), 0.0), 3) if r.state == FAILED else None
+                ),
+            }
+            for r in self._resources.values()
+        }
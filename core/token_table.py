@@ -0,0 +1,89 @@
+from array import array
+from typing import Dict, Iterator, List, Tuple
+import sys
+
+# Universal POS tags as produced by spaCy's token.pos_
+POS_TAGS: Tuple[str, ...] = (
+    "", "ADJ", "ADP", "ADV", "AUX", "CCONJ", "DET", "INTJ", "NOUN", "NUM",
+    "PART", "PRON", "PROPN", "PUNCT", "SCONJ", "SPACE", "SYM", "VERB", "X",
+)
+POS_CODES: Dict[str, int] = {tag: code for code, tag in enumerate(POS_TAGS)}
+
+# Bit flags stored per token in TokenTable.flags
+IS_STOP = 1
+IS_PUNCT = 2
+IS_SPACE = 4
+IS_ALPHA = 8
+KEPT = 16        # passed the POS/stop-word filter (lemma is in vocab)
+
+
+class TokenTable:
+    """
+    Columnar alternative to german_nlp's list of per-token dicts.
+
+    One entry per token in each column:
+      words, lemmas  interned strings (repeated tokens share one object)
+      pos            integer codes into POS_TAGS
+      flags          IS_STOP | IS_PUNCT | IS_SPACE | IS_ALPHA | KEPT bits
+      sent_idx       index into sentences, which holds each sentence text once
+    vocab is the deduplicated, lower-cased list of kept lemmas.
+    """
+
+    __slots__ = ("words", "lemmas", "pos", "flags", "sent_idx", "sentences", "vocab")
+
+    def __init__(self):
+        self.words: List[str] = []
+        self.lemmas: List[str] = []
+        self.pos = array("B")
+        self.flags = array("B")
+        self.sent_idx = array("I")
+        self.sentences: List[str] = []
+        self.vocab: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def append(self, word: str, lemma: str, pos_tag: str, flags: int, sent_index: int) -> None:
+        self.words.append(sys.intern(word))
+        self.lemmas.append(sys.intern(lemma))
+        self.pos.append(POS_CODES.get(pos_tag, POS_CODES["X"]))
+        self.flags.append(flags)
+        self.sent_idx.append(sent_index)
+
+    def pos_tag(self, i: int) -> str:
+        return POS_TAGS[self.pos[i]]
+
+    def rows(self) -> Iterator[Tuple[str, str, str, str]]:
+        """
+        Yield (word, lemma, pos_tag, sentence) for every token,
+        which is all generate_flashcards needs.
+        """
+        sentences = self.sentences
+        for word, lemma, code, s in zip(self.words, self.lemmas, self.pos, self.sent_idx):
+            yield word, lemma, POS_TAGS[code], sentences[s]
+
+    def kept(self) -> List[int]:
+        """Indices of tokens that passed the vocab filter."""
+        return [i for i, f in enumerate(self.flags) if f & KEPT]
+
+    def to_dicts(self) -> List[Dict]:
+        """
+        Compatibility shim: the old german_nlp word_data list of dicts.
+        """
+        sentences = self.sentences
+        return [
+            {
+                "word": word,
+                "pos_tag": POS_TAGS[code],
+                "lemma": lemma,
+                "is_stop": bool(f & IS_STOP),
+                "is_punct": bool(f & IS_PUNCT),
+                "is_space": bool(f & IS_SPACE),
+                "lemma_lower": lemma.lower(),
+                "is_alpha": bool(f & IS_ALPHA),
+                "sentence": sentences[s],
+            }
+            for word, lemma, code, f, s in zip(
+                self.words, self.lemmas, self.pos, self.flags, self.sent_idx
+            )
+        ]
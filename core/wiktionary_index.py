@@ -0,0 +1,199 @@
+"""
+Compiled, on-disk Wiktionary lemma index.
+
+The kaikki dump is several GB of JSONL. Instead of streaming and parsing it
+on every startup, compile it once into a small SQLite file:
+
+    python -m core.wiktionary_index <jsonl path or URL> data/wiktionary/lemmas.sqlite
+
+and open it at runtime with WiktionaryIndex, which answers noun_info /
+verb_info lookups straight from disk.
+"""
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+import json
+import os
+import sqlite3
+import sys
+import threading
+
+from core.wiktionary_loader import iter_entries_from_url, load_nouns_and_verbs
+
+# Bump this whenever the table layout or the info dicts change shape.
+INDEX_SCHEMA_VERSION = "2"
+
+_TABLES = {"noun": "nouns", "verb": "verbs"}
+
+
+def build_wiktionary_index(
+    entries: Iterable[Tuple[str, str, Dict]],
+    index_path: Path,
+    batch_size: int = 5000,
+) -> Dict[str, int]:
+    """
+    Write (pos, lemma, info) entries into a fresh SQLite index at index_path.
+    The file is built next to the target and moved into place at the end,
+    so running workers never see a half-written index.
+    Returns row counts per table.
+    """
+    index_path = Path(index_path)
+    tmp_path = index_path.with_suffix(index_path.suffix + ".tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    conn = sqlite3.connect(tmp_path)
+    counts = {"nouns": 0, "verbs": 0}
+    try:
+        # Build-only pragmas: nothing reads this file until it is renamed.
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+
+        conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        for table in _TABLES.values():
+            conn.execute(f"""
+                CREATE TABLE {table} (
+                    lemma TEXT PRIMARY KEY,
+                    info  TEXT NOT NULL
+                ) WITHOUT ROWID
+            """)
+
+        pending = {table: [] for table in _TABLES.values()}
+
+        def flush(table):
+            # INSERT OR REPLACE keeps "last entry wins", like the dict loaders
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {table} (lemma, info) VALUES (?, ?)",
+                pending[table],
+            )
+            pending[table].clear()
+
+        for pos, lemma, info in entries:
+            table = _TABLES[pos]
+            pending[table].append((lemma, json.dumps(info, ensure_ascii=False, separators=(",", ":"))))
+            if len(pending[table]) >= batch_size:
+                flush(table)
+
+        for table in _TABLES.values():
+            flush(table)
+            counts[table] = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+        conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?)",
+            ("schema_version", INDEX_SCHEMA_VERSION),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, index_path)
+    return counts
+
+
+class LemmaTable(Mapping):
+    """
+    Read-only dict-like view over one table of a WiktionaryIndex,
+    so it can be passed wherever noun_info / verb_info dicts are expected.
+    """
+
+    def __init__(self, index: "WiktionaryIndex", table: str):
+        self._index = index
+        self._table = table
+
+    def get(self, lemma, default=None):
+        info = self._index.lookup(self._table, lemma)
+        return default if info is None else info
+
+    def __getitem__(self, lemma) -> Dict:
+        info = self._index.lookup(self._table, lemma)
+        if info is None:
+            raise KeyError(lemma)
+        return info
+
+    def __contains__(self, lemma) -> bool:
+        return self._index.lookup(self._table, lemma) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index.lemmas(self._table))
+
+    def __len__(self) -> int:
+        return self._index.count(self._table)
+
+
+class WiktionaryIndex:
+    """
+    Opens a prebuilt index read-only. Opening is a single file open plus
+    a schema check; lookups are primary-key reads served from the OS page cache.
+    """
+
+    def __init__(self, index_path: Path):
+        self.path = str(index_path)
+        if not Path(self.path).exists():
+            raise FileNotFoundError(f"Wiktionary index not found: {self.path}")
+
+        self._lock = threading.Lock()
+        self._connect()
+
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE key = 'schema_version'"
+        ).fetchone()
+        version = row[0] if row else None
+        if version != INDEX_SCHEMA_VERSION:
+            self._conn.close()
+            raise ValueError(
+                f"Wiktionary index {self.path} has schema version {version!r}, "
+                f"expected {INDEX_SCHEMA_VERSION!r}; rebuild it with python -m core.wiktionary_index"
+            )
+
+        self.nouns = LemmaTable(self, "nouns")
+        self.verbs = LemmaTable(self, "verbs")
+
+    def _connect(self) -> None:
+        # immutable=1: the file is never written after build, so skip locking
+        uri = Path(self.path).resolve().as_uri() + "?mode=ro&immutable=1"
+        self._conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        self._pid = os.getpid()
+
+    def _connection(self) -> sqlite3.Connection:
+        # SQLite connections must not cross a fork; if this index was opened
+        # in a preloading master, each worker reopens its own.
+        if self._pid != os.getpid():
+            self._connect()
+        return self._conn
+
+    def lookup(self, table: str, lemma: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._connection().execute(
+                f"SELECT info FROM {table} WHERE lemma = ?", (lemma,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def lemmas(self, table: str) -> list:
+        with self._lock:
+            return [r[0] for r in self._connection().execute(f"SELECT lemma FROM {table}")]
+
+    def count(self, table: str) -> int:
+        with self._lock:
+            return self._connection().execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("usage: python -m core.wiktionary_index <jsonl path or URL> <index path>")
+        sys.exit(2)
+
+    source, target = sys.argv[1], Path(sys.argv[2])
+    if source.startswith(("http://", "https://")):
+        entries = iter_entries_from_url(source)
+    else:
+        # Local dumps are parsed in parallel, then written in one pass
+        noun_info, verb_info = load_nouns_and_verbs(source)
+        entries = [("noun", lemma, info) for lemma, info in noun_info.items()]
+        entries += [("verb", lemma, info) for lemma, info in verb_info.items()]
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    counts = build_wiktionary_index(entries, target)
+    print(f"Wrote {target}: {counts['nouns']} nouns, {counts['verbs']} verbs")
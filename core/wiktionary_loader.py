@@ -1,15 +1,177 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import json
+import os
 import requests
 
+from core.display_formatters import format_noun, format_verb
 
-def load_nouns_and_verbs_from_url(url):
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json also accepts bytes
+    _loads = json.loads
+
+# Target size of one byte-range chunk handed to a worker process
+CHUNK_BYTES = 64 * 1024 * 1024
+
+
+# Definite article (nominative singular) per grammatical gender
+GENDER_ARTICLES = {"masculine": "der", "feminine": "die", "neuter": "das"}
+_GENDER_CODES = {"m": "masculine", "f": "feminine", "n": "neuter"}
+
+# Form tags that rule a form out as "the" plural / 3sg / preterite
+_OTHER_CASES = {"genitive", "dative", "accusative", "diminutive"}
+_OTHER_MOODS = {"subjunctive", "subjunctive-i", "subjunctive-ii", "imperative", "subordinate-clause"}
+_OTHER_PERSONS = {"first-person", "second-person", "plural"}
+_NOT_FORMS = {"table-tags", "inflection-template", "class"}
+
+
+def _forms(entry):
     """
-    Stream Wiktionary JSONL from a remote URL (HuggingFace)
-    and extract noun and verb info just like the local loader.
+    (form, tags) pairs of an entry, head-line forms before conjugation /
+    declension table rows, so the summary forms win when both exist.
     """
-    noun_info = {}
-    verb_info = {}
+    forms = [f for f in entry.get("forms") or () if isinstance(f, dict) and f.get("form")]
+    forms.sort(key=lambda f: "source" in f)
+    for f in forms:
+        tags = set(f.get("tags") or ())
+        if tags & _NOT_FORMS or f["form"] in ("-", "no-table-tags"):
+            continue
+        yield f["form"], tags
+
+
+def _gender(entry):
+    gender = entry.get("gender")
+    if gender:
+        return _GENDER_CODES.get(gender, gender)
+
+    for tags in [entry.get("tags") or ()] + [f.get("tags") or () for f in entry.get("forms") or ()
+                                             if "canonical" in (f.get("tags") or ())]:
+        for tag in tags:
+            if tag in GENDER_ARTICLES:
+                return tag
+
+    # {{de-noun|n,es,^er}}: gender is the first letter of the first argument
+    for template in entry.get("head_templates") or ():
+        args = template.get("args") or {}
+        code = (args.get("g") or args.get("1") or "")[:1]
+        if code in _GENDER_CODES:
+            return _GENDER_CODES[code]
+    return None
+
+
+def _noun_plural(entry):
+    plural = entry.get("plural")
+    if plural:
+        return plural
+    for form, tags in _forms(entry):
+        if "plural" in tags and not tags & _OTHER_CASES:
+            return form.removeprefix("die ")
+    return None
+
+
+def _verb_conjugations(entry):
+    """3sg present, preterite (3sg past) and past participle, e.g. for
+    mitteilen: teilt mit / teilte mit / mitgeteilt, plus the auxiliary."""
+    conjugations = {"3sg": None, "preterite": None, "participle": None, "auxiliary": None}
+
+    for form, tags in _forms(entry):
+        if tags & _OTHER_MOODS:
+            continue
+        if "auxiliary" in tags:
+            key = "auxiliary"
+        elif {"participle", "past"} <= tags:
+            key = "participle"
+        elif "participle" in tags:
+            continue
+        elif {"present", "singular", "third-person"} <= tags:
+            key = "3sg"
+        elif "past" in tags and not tags & _OTHER_PERSONS:
+            key = "preterite"
+        else:
+            continue
+        if conjugations[key] is None:
+            conjugations[key] = form
+    return conjugations
+
+
+def _definition(entry):
+    definition = entry.get("definition")
+    if definition:
+        return definition
+    for sense in entry.get("senses") or ():
+        # "plural of Haus" and the like describe a form, not a meaning
+        if sense.get("form_of") or "form-of" in (sense.get("tags") or ()):
+            continue
+        glosses = sense.get("glosses")
+        if glosses:
+            return glosses[0]
+    return None
 
+
+def _example(entry):
+    example = entry.get("example")
+    if example:
+        return example
+    for sense in entry.get("senses") or ():
+        for ex in sense.get("examples") or ():
+            if ex.get("text"):
+                return ex["text"]
+    return None
+
+
+def extract_entry(entry):
+    """
+    Pull the noun/verb info we care about out of one Wiktionary JSON entry.
+    Returns (pos, lemma, info) with pos in {"noun", "verb"}, or None if the
+    entry is not a noun/verb. Lemmas are lower-cased so they match the
+    lemma_lower lookups done in generate_flashcards.
+
+    display_word / display_details are formatted here, once per lemma, so
+    building a flashcard at request time is a plain lookup.
+    """
+    pos = entry.get("pos", "").lower()
+    lemma = entry.get("word")
+
+    if not lemma or not pos:
+        return None
+
+    # --------------------
+    # NOUN EXTRACTION LOGIC
+    # --------------------
+    if pos == "noun":
+        gender = _gender(entry)
+        info = {
+            "gender": gender,
+            "article": GENDER_ARTICLES.get(gender),
+            "plural": _noun_plural(entry),
+            "definition": _definition(entry),
+            "example": _example(entry),
+        }
+        info.update(format_noun(article=info["article"], lemma=lemma.lower(), plural=info["plural"]))
+        return "noun", lemma.lower(), info
+
+    # --------------------
+    # VERB EXTRACTION LOGIC
+    # --------------------
+    if pos == "verb":
+        conjugations = _verb_conjugations(entry)
+        info = {
+            "conjugations": conjugations,
+            "definition": _definition(entry),
+            "example": _example(entry),
+        }
+        info.update(format_verb(lemma.lower(), conjugations))
+        return "verb", lemma.lower(), info
+
+    return None
+
+
+def iter_entries_from_url(url):
+    """
+    Stream Wiktionary JSONL from a remote URL and yield (pos, lemma, info)
+    for every noun/verb entry.
+    """
     with requests.get(url, stream=True) as r:
         r.raise_for_status()  # fail fast if bad URL
 
@@ -22,39 +184,155 @@ def load_nouns_and_verbs_from_url(url):
             except json.JSONDecodeError:
                 continue
 
-            pos = entry.get("pos", "").lower()
-            lemma = entry.get("word")
+            extracted = extract_entry(entry)
+            if extracted is not None:
+                yield extracted
 
-            if not lemma or not pos:
+
+def iter_entries_from_path(path):
+    """
+    Same as iter_entries_from_url, but reads a local JSONL file.
+    """
+    with open(path, encoding="utf-8") as f:
+        for raw_line in f:
+            if not raw_line.strip():
+                continue
+
+            try:
+                entry = json.loads(raw_line)
+            except json.JSONDecodeError:
                 continue
 
-            # --------------------
-            # NOUN EXTRACTION LOGIC
-            # --------------------
-            if pos == "noun":
-                gender = entry.get("gender")
-                plural = entry.get("plural")
-                definition = entry.get("definition")
-                example = entry.get("example")
-
-                noun_info[lemma] = {
-                    "gender": gender,
-                    "plural": plural,
-                    "definition": definition,
-                    "example": example,
-                }
-
-            # --------------------
-            # VERB EXTRACTION LOGIC
-            # --------------------
-            elif pos == "verb":
-                # You may expand this later to include conjugations
-                definition = entry.get("definition")
-                example = entry.get("example")
-
-                verb_info[lemma] = {
-                    "definition": definition,
-                    "example": example,
-                }
+            extracted = extract_entry(entry)
+            if extracted is not None:
+                yield extracted
+
+
+def load_nouns_and_verbs_from_url(url):
+    """
+    Stream Wiktionary JSONL from a remote URL (HuggingFace)
+    and extract noun and verb info just like the local loader.
+    """
+    noun_info = {}
+    verb_info = {}
+
+    for pos, lemma, info in iter_entries_from_url(url):
+        if pos == "noun":
+            noun_info[lemma] = info
+        else:
+            verb_info[lemma] = info
+
+    return noun_info, verb_info
+
+
+def _chunk_offsets(path, chunk_bytes):
+    """
+    Split the file into [start, end) byte ranges of roughly chunk_bytes,
+    with every boundary moved forward to the next line start.
+    """
+    size = os.path.getsize(path)
+    offsets = [0]
+
+    with open(path, "rb") as f:
+        while offsets[-1] < size:
+            f.seek(offsets[-1] + chunk_bytes)
+            f.readline()  # finish the line we landed in
+            offsets.append(min(f.tell(), size))
+
+    return list(zip(offsets[:-1], offsets[1:]))
+
+
+def _parse_chunk(path, start, end):
+    """
+    Worker: parse the lines in one byte range.
+    Returns (noun_info, verb_info, line_count).
+    """
+    noun_info = {}
+    verb_info = {}
+    lines = 0
+
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    for raw_line in data.splitlines():
+        lines += 1
+        if not raw_line.strip():
+            continue
+
+        try:
+            entry = _loads(raw_line)
+        except ValueError:
+            continue
+
+        extracted = extract_entry(entry)
+        if extracted is None:
+            continue
+
+        pos, lemma, info = extracted
+        if pos == "noun":
+            noun_info[lemma] = info
+        else:
+            verb_info[lemma] = info
+
+    return noun_info, verb_info, lines
+
+
+def load_nouns_and_verbs(path, workers=None, chunk_bytes=CHUNK_BYTES, progress=None):
+    """
+    Load noun and verb info from a local kaikki JSONL file.
+
+    The file is split into byte-range chunks that are parsed in parallel
+    across a process pool. Chunks are merged in file order, so a lemma that
+    appears several times keeps its last entry, same as the URL loader.
+
+    progress, if given, is called as progress(bytes_done, total_bytes, lines_done)
+    after each chunk finishes.
+    """
+    path = str(path)
+    total_bytes = os.path.getsize(path)
+    ranges = _chunk_offsets(path, chunk_bytes)
+    workers = workers or os.cpu_count() or 1
+
+    noun_info = {}
+    verb_info = {}
+    bytes_done = 0
+    lines_done = 0
+
+    def report(start, end, lines):
+        nonlocal bytes_done, lines_done
+        bytes_done += end - start
+        lines_done += lines
+        if progress is not None:
+            progress(bytes_done, total_bytes, lines_done)
+
+    # Small files or a single worker: no point paying for a pool
+    if workers == 1 or len(ranges) <= 1:
+        for start, end in ranges:
+            nouns, verbs, lines = _parse_chunk(path, start, end)
+            noun_info.update(nouns)
+            verb_info.update(verbs)
+            report(start, end, lines)
+        return noun_info, verb_info
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+        futures = {
+            pool.submit(_parse_chunk, path, start, end): i
+            for i, (start, end) in enumerate(ranges)
+        }
+
+        # Merge strictly in chunk order; park results that finish early
+        finished = {}
+        next_to_merge = 0
+        for future in as_completed(futures):
+            i = futures[future]
+            finished[i] = future.result()
+            report(*ranges[i], finished[i][2])
+
+            while next_to_merge in finished:
+                nouns, verbs, _ = finished.pop(next_to_merge)
+                noun_info.update(nouns)
+                verb_info.update(verbs)
+                next_to_merge += 1
 
     return noun_info, verb_info
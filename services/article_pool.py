@@ -0,0 +1,151 @@
+# services/article_pool.py
+"""
+Pool of prefetched random German Wikipedia extracts for /api/random-german.
+
+A background task keeps a bounded queue topped up through a shared async
+HTTP client, so the endpoint only pops a ready text instead of waiting
+on Wikipedia:
+
+    pool = ArticlePool(http_client, RANDOM_ARTICLE_URL, size=10)
+    pool.start()                     # inside the running event loop
+    text = await pool.get()
+    await pool.stop()
+
+prepare, if given, is awaited with each cleaned text before it is queued,
+e.g. to run it through the flashcard pipeline so that the client's
+follow-up request is a response-cache hit.
+"""
+from typing import Awaitable, Callable, Dict, Optional
+import asyncio
+import logging
+import re
+
+from services.backoff import backoff_delays
+
+logger = logging.getLogger(__name__)
+
+_PARENS_EMPTY = re.compile(r"\s*\(\s*[;,]?\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def clean_extract(text: str) -> str:
+    """
+    Tidy a REST summary extract for the flashcard input box: collapse
+    whitespace and drop the empty parentheses left behind where the API
+    stripped pronunciation and date markup.
+    """
+    text = _PARENS_EMPTY.sub("", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+class ArticlePool:
+
+    def __init__(
+        self,
+        client,
+        url: str,
+        size: int = 10,
+        min_chars: int = 80,
+        prepare: Optional[Callable[[str], Awaitable[None]]] = None,
+        retry_delay: float = 1.0,
+        max_retry_delay: float = 30.0,
+    ):
+        self.client = client
+        self.url = url
+        self.size = size
+        self.min_chars = min_chars
+        self.prepare = prepare
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+
+        self._queue: Optional[asyncio.Queue] = None   # created in start(), inside the loop
+        self._task: Optional[asyncio.Task] = None
+        self.fetched = 0
+        self.rejected = 0
+        self.failed = 0
+        self.served = 0
+        self.empty = 0
+
+    async def fetch_one(self) -> Optional[str]:
+        """
+        One random extract, cleaned, or None if it is too short to make
+        useful flashcards. Raises if the upstream call fails.
+        """
+        r = await self.client.get(self.url)
+        if r.status_code != 200:
+            raise RuntimeError(f"{self.url} answered {r.status_code}")
+        text = clean_extract(r.json().get("extract") or "")
+        self.fetched += 1
+        if len(text) < self.min_chars:
+            self.rejected += 1
+            return None
+        return text
+
+    async def _refill(self) -> None:
+        delays = None
+        while True:
+            try:
+                text = await self.fetch_one()
+                if text is not None and self.prepare is not None:
+                    await self.prepare(text)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Upstream trouble: back off (with jitter), growing up to max_retry_delay
+                self.failed += 1
+                if delays is None:
+                    delays = backoff_delays(32, self.retry_delay, self.max_retry_delay)
+                delay = next(delays, self.max_retry_delay)
+                logger.warning("Random article prefetch failed, retrying in %.1fs... %s", delay, e)
+                await asyncio.sleep(delay)
+                continue
+
+            delays = None
+            if text is not None:
+                # Blocks while the queue is full
+                await self._queue.put(text)
+
+    def start(self) -> "ArticlePool":
+        if self._task is None:
+            self._queue = asyncio.Queue(maxsize=self.size)
+            self._task = asyncio.get_running_loop().create_task(self._refill())
+        return self
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def pop(self) -> Optional[str]:
+        """A prefetched text, or None if the pool is empty. Never waits."""
+        if self._queue is None:
+            return None
+        try:
+            text = self._queue.get_nowait()
+        except asyncio.QueueEmpty:
+            self.empty += 1
+            return None
+        self.served += 1
+        return text
+
+    async def get(self) -> Optional[str]:
+        """A prefetched text if there is one, otherwise fetch one directly."""
+        text = self.pop()
+        if text is None:
+            text = await self.fetch_one()
+        return text
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "ready": self._queue.qsize() if self._queue is not None else 0,
+            "size": self.size,
+            "fetched": self.fetched,
+            "rejected": self.rejected,
+            "failed": self.failed,
+            "served": self.served,
+            "empty": self.empty,
+        }
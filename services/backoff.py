@@ -0,0 +1,54 @@
+# services/backoff.py
+
+from typing import Awaitable, Callable, Iterator, TypeVar
+import asyncio
+import logging
+import random
+import time
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+def backoff_delays(retries: int, base_delay: float = 0.5, max_delay: float = 8.0) -> Iterator[float]:
+    """
+    Exponential backoff with full jitter: the n-th delay is drawn uniformly
+    from [0, min(max_delay, base_delay * 2**n)], so retrying clients spread
+    out instead of hitting the API in lockstep.
+    """
+    for attempt in range(retries):
+        yield random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+def call_with_backoff(
+    fn: Callable[[], T],
+    retries: int = 4,
+    base_delay: float = 0.5,
+    max_delay: float = 8.0,
+) -> T:
+    """Call fn(), retrying up to `retries` times with jittered backoff."""
+    for delay in backoff_delays(retries, base_delay, max_delay):
+        try:
+            return fn()
+        except Exception as e:
+            logger.warning("Call failed, retrying in %.2fs... %s", delay, e)
+            time.sleep(delay)
+    # Last attempt: let the exception propagate
+    return fn()
+
+
+async def acall_with_backoff(
+    fn: Callable[[], Awaitable[T]],
+    retries: int = 4,
+    base_delay: float = 0.5,
+    max_delay: float = 8.0,
+) -> T:
+    """Async version of call_with_backoff; fn must return a fresh awaitable each call."""
+    for delay in backoff_delays(retries, base_delay, max_delay):
+        try:
+            return await fn()
+        except Exception as e:
+            logger.warning("Call failed, retrying in %.2fs... %s", delay, e)
+            await asyncio.sleep(delay)
+    return await fn()
@@ -0,0 +1,75 @@
+# services/fake_article_server.py
+"""
+Local stand-in for the Wikipedia REST random/summary endpoint, for tests.
+Every GET answers with a distinct German extract after `delay` seconds;
+set `status` to make it fail instead.
+
+    server = FakeArticleServer().start()
+    pool = ArticlePool(httpx.AsyncClient(), server.url + "/page/random/summary")
+    ...
+    server.stop()
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+
+
+class FakeArticleServer:
+
+    def __init__(self, delay: float = 0.0, host: str = "127.0.0.1", port: int = 0):
+        self.delay = delay
+        self.status = 200
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeArticleServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    @staticmethod
+    def fake_extract(n: int) -> str:
+        return (
+            f"Artikel {n} ( ) handelt von einer kleinen Stadt.  Die Stadt liegt an einem Fluss "
+            f"und hat einen alten Bahnhof. Viele Menschen besuchen sie im Sommer."
+        )
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with server._lock:
+                    server.requests += 1
+                    n = server.requests
+                time.sleep(server.delay)
+
+                if server.status != 200:
+                    payload = {"title": "Too Many Requests"}
+                else:
+                    payload = {"title": f"Artikel {n}", "extract": server.fake_extract(n)}
+
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(server.status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass  # keep test output quiet
+
+        return Handler
@@ -0,0 +1,111 @@
+# services/fake_translation_server.py
+"""
+Local stand-in for the Google Translation v2 REST endpoint, for tests and
+benchmarks. Each request sleeps for `delay` seconds before answering, which
+makes the cost of sequential vs concurrent batches easy to see.
+
+    server = FakeTranslationServer(delay=0.2).start()
+    client = server.client()          # translate_v2.Client pointed at it
+    ...
+    server.stop()
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+
+
+class FakeTranslationServer:
+
+    def __init__(self, delay: float = 0.1, host: str = "127.0.0.1", port: int = 0):
+        self.delay = delay
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        # Requests containing any of these texts answer 500 right away
+        self.fail_texts = set()
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeTranslationServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def client(self):
+        """A google translate_v2.Client that talks to this server."""
+        from google.auth.credentials import AnonymousCredentials
+        from google.cloud import translate_v2 as translate
+
+        return translate.Client(
+            credentials=AnonymousCredentials(),
+            client_options={"api_endpoint": self.url},
+        )
+
+    @staticmethod
+    def fake_translation(text: str, target: str) -> str:
+        return f"{text} [{target}]"
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+
+                texts = body.get("q", [])
+                if isinstance(texts, str):
+                    texts = [texts]
+                if server.fail_texts.intersection(texts):
+                    with server._lock:
+                        server.requests += 1
+                    self.send_error(500, "Injected failure")
+                    return
+
+                with server._lock:
+                    server.requests += 1
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                try:
+                    time.sleep(server.delay)
+                finally:
+                    with server._lock:
+                        server.in_flight -= 1
+
+                target = body.get("target", "")
+                payload = {"data": {"translations": [
+                    {"translatedText": server.fake_translation(t, target)} for t in texts
+                ]}}
+
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass  # keep test output quiet
+
+        return Handler
+
+
+if __name__ == "__main__":
+    server = FakeTranslationServer(delay=0.2).start()
+    print("Fake translation server listening on", server.url)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
@@ -33,3 +33,18 @@ class Translator(ABC):
                             Example: { 'Haus': 'house', 'laufen': 'to run' }
         """
         pass
+
+
+class AsyncTranslator(ABC):
+    """
+    Async version of the Translator contract, for callers running on an event loop.
+    Same inputs and outputs as Translator.translate, but awaitable.
+    """
+
+    @abstractmethod
+    async def translate(self, words: List[str], study_lang: str, native_lang: str) -> Dict[str, str]:
+        """
+        Translate a list of words from the language you're studying into your native language.
+        See Translator.translate for parameters and return value.
+        """
+        pass
@@ -0,0 +1,95 @@
+# services/translator_chain.py
+
+from typing import Dict, List, Tuple, Union
+import asyncio
+import threading
+
+from services.translator import Translator, AsyncTranslator
+from adapters.cache_sqlite import TranslationCache, Key
+from core.metrics import TRANSLATION_TIER_SECONDS
+
+
+class CachedTranslator(Translator):
+    """
+    Cache-only tier: answers whatever is already in the translation cache
+    and never calls out anywhere.
+    """
+
+    def __init__(self, cache: TranslationCache):
+        self.cache = cache
+
+    def translate(self, words: List[str], study_lang: str, native_lang: str) -> Dict[str, str]:
+        keys = [Key(word, study_lang, native_lang) for word in words]
+        cached = self.cache.get_many(keys)
+        return {key.source_text: value for key, value in cached.items()}
+
+
+class ChainTranslator(Translator):
+    """
+    Tries each tier in order (e.g. cache -> offline dictionary -> Google)
+    and only passes the words still missing to the next one.
+    Tiers with a supports(study_lang, native_lang) method are skipped for
+    language pairs they don't cover.
+
+    translate() needs synchronous tiers. atranslate() accepts both: async
+    tiers are awaited, sync ones run in a worker thread.
+
+    stats() reports how many words each tier resolved.
+    """
+
+    def __init__(self, tiers: List[Tuple[str, Union[Translator, AsyncTranslator]]]):
+        self.tiers = tiers
+        self._lock = threading.Lock()
+        self.resolved: Dict[str, int] = {name: 0 for name, _ in tiers}
+        self.unresolved = 0
+
+    def _active_tiers(self, study_lang: str, native_lang: str):
+        for name, tier in self.tiers:
+            supports = getattr(tier, "supports", None)
+            if supports is None or supports(study_lang, native_lang):
+                yield name, tier
+
+    def _record(self, name: str, found: Dict[str, str], translations: Dict[str, str], remaining: List[str]) -> List[str]:
+        translations.update(found)
+        with self._lock:
+            self.resolved[name] += len(found)
+        return [word for word in remaining if word not in found]
+
+    def _finish(self, words: List[str], translations: Dict[str, str], remaining: List[str]) -> Dict[str, str]:
+        with self._lock:
+            self.unresolved += len(remaining)
+        # Keep the caller's word order
+        return {word: translations[word] for word in words if word in translations}
+
+    def translate(self, words: List[str], study_lang: str, native_lang: str) -> Dict[str, str]:
+        translations: Dict[str, str] = {}
+        remaining = list(words)
+
+        for name, tier in self._active_tiers(study_lang, native_lang):
+            if not remaining:
+                break
+            with TRANSLATION_TIER_SECONDS.time(tier=name):
+                found = tier.translate(remaining, study_lang=study_lang, native_lang=native_lang)
+            remaining = self._record(name, found, translations, remaining)
+
+        return self._finish(words, translations, remaining)
+
+    async def atranslate(self, words: List[str], study_lang: str, native_lang: str) -> Dict[str, str]:
+        translations: Dict[str, str] = {}
+        remaining = list(words)
+
+        for name, tier in self._active_tiers(study_lang, native_lang):
+            if not remaining:
+                break
+            with TRANSLATION_TIER_SECONDS.time(tier=name):
+                if isinstance(tier, AsyncTranslator):
+                    found = await tier.translate(remaining, study_lang=study_lang, native_lang=native_lang)
+                else:
+                    found = await asyncio.to_thread(tier.translate, remaining, study_lang, native_lang)
+            remaining = self._record(name, found, translations, remaining)
+
+        return self._finish(words, translations, remaining)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self.resolved, "unresolved": self.unresolved}
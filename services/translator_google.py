@@ -1,10 +1,18 @@
 # services/translator_google.py
 
-from typing import List, Dict
+from concurrent.futures import Future
+from typing import List, Dict, Tuple
+import logging
+import threading
+
 from services.translator import Translator
 from adapters.cache_sqlite import TranslationCache, Key
+from core.metrics import TRANSLATION_API_SECONDS
+from services.backoff import call_with_backoff
 from google.cloud import translate_v2 as translate
 
+logger = logging.getLogger(__name__)
+
 def split_into_batches(items, batch_size=50):
     """Yield slices of the list in chunks of batch_size."""
     for i in range(0, len(items), batch_size):
@@ -12,27 +20,43 @@ def split_into_batches(items, batch_size=50):
 
 class GoogleTranslator(Translator):
 
-    def __init__(self, cache: TranslationCache):
+    def __init__(self, cache: TranslationCache, client=None, retries: int = 4):
         # store the cache so translate() can use it
         self.cache = cache
-        self.client = translate.Client()
+        # client can be injected (e.g. one pointed at a fake server in tests)
+        self.client = client or translate.Client()
+        self.retries = retries
+
+        # Single-flight: lemmas currently being fetched from the API, so
+        # concurrent requests for the same Key wait instead of re-requesting.
+        self._inflight: Dict[Key, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self.coalesced = 0       # lookups answered by another request's API call
+        self.api_words = 0       # words actually sent to the API
+        self.api_batches = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._inflight_lock:
+            return {
+                "coalesced": self.coalesced,
+                "api_words": self.api_words,
+                "api_batches": self.api_batches,
+                "in_flight": len(self._inflight),
+            }
 
     def translate(self, words: List[str], study_lang: str, native_lang: str) -> Dict[str, str]:
         translations: Dict[str, str] = {}
         to_translate: List[str] = []
 
-        # First pass: check cache
-        for word in words:
-            key = Key(
-                source_text=word,
-                study_lang=study_lang,
-                native_lang=native_lang
-            )
+        # First pass: check cache (one query for all words)
+        keys = [Key(source_text=word, study_lang=study_lang, native_lang=native_lang) for word in words]
+        cached = self.cache.get_many(keys)
 
-            cached_value = self.cache.get(key)
+        for word, key in zip(words, keys):
+            cached_value = cached.get(key)
 
             if cached_value is not None:
-                print(f"[CACHE HIT] {word} -> {cached_value}")
+                logger.debug("cache hit: %s -> %s", word, cached_value)
                 translations[word] = cached_value
             else:
                 to_translate.append(word)
@@ -41,40 +65,85 @@ class GoogleTranslator(Translator):
         if not to_translate:
             return translations
 
-        # Batching
-        for batch in split_into_batches(to_translate, batch_size=50):
-            try:
-                # First API attempt
-                api_results = self.client.translate(
-                    batch,
-                    source_language=study_lang,
-                    target_language=native_lang,
-                    format_="text",
-                )
-            except Exception as e:
-                print(f"[WARNING] Batch failed, retrying once... {e}")
-                # Retry once
-                api_results = self.client.translate(
-                    batch,
-                    source_language=study_lang,
-                    target_language=native_lang,
-                    format_="text",
-                )
-
-            # Process batch results
-            for word, res in zip(batch, api_results):
-                translated_text = res["translatedText"]
-
-                key = Key(
-                    source_text=word,
-                    study_lang=study_lang,
-                    native_lang=native_lang
-                )
-
-                # Save to cache
-                self.cache.put(key, translated_text)
-
-                # Save to output
-                translations[word] = translated_text
+        # Claim the misses nobody is fetching yet; wait on the rest
+        owned: List[Tuple[str, Key, Future]] = []
+        waiting: List[Tuple[str, Future]] = []
+        with self._inflight_lock:
+            for word in to_translate:
+                key = Key(source_text=word, study_lang=study_lang, native_lang=native_lang)
+                future = self._inflight.get(key)
+                if future is not None:
+                    waiting.append((word, future))
+                    self.coalesced += 1
+                else:
+                    future = Future()
+                    self._inflight[key] = future
+                    owned.append((word, key, future))
+
+        try:
+            # A request may have finished (and cached) these between our
+            # cache check and claiming them; don't pay the API for those.
+            if owned:
+                cached = self.cache.get_many([key for _, key, _ in owned])
+                still_owned = []
+                for word, key, future in owned:
+                    if key in cached:
+                        translations[word] = cached[key]
+                        future.set_result(cached[key])
+                    else:
+                        still_owned.append((word, key, future))
+                owned_to_fetch = still_owned
+            else:
+                owned_to_fetch = []
+
+            # Batching
+            for batch_entries in split_into_batches(owned_to_fetch, batch_size=50):
+                batch = [word for word, _, _ in batch_entries]
+
+                # Retries with exponential backoff + jitter
+                with TRANSLATION_API_SECONDS.time():
+                    api_results = call_with_backoff(
+                        lambda: self.client.translate(
+                            batch,
+                            source_language=study_lang,
+                            target_language=native_lang,
+                            format_="text",
+                        ),
+                        retries=self.retries,
+                    )
+                with self._inflight_lock:
+                    self.api_words += len(batch)
+                    self.api_batches += 1
+
+                # Process batch results
+                new_entries = []
+                for (word, key, future), res in zip(batch_entries, api_results):
+                    translated_text = res["translatedText"]
+                    new_entries.append((key, translated_text))
+
+                    # Save to output
+                    translations[word] = translated_text
+
+                # Save the whole batch to cache in one transaction,
+                # then release anyone waiting on these lemmas
+                self.cache.put_many(new_entries)
+                for (word, key, future), (_, translated_text) in zip(batch_entries, new_entries):
+                    future.set_result(translated_text)
+
+        except BaseException as e:
+            # Waiters see the same failure instead of hanging
+            for _, _, future in owned:
+                if not future.done():
+                    future.set_exception(e)
+            raise
+
+        finally:
+            with self._inflight_lock:
+                for _, key, _ in owned:
+                    self._inflight.pop(key, None)
+
+        # Lemmas another request was already fetching
+        for word, future in waiting:
+            translations[word] = future.result()
 
         return translations
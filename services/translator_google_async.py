@@ -0,0 +1,175 @@
+# services/translator_google_async.py
+
+from typing import List, Dict
+import asyncio
+
+from services.translator import AsyncTranslator
+from services.translator_google import split_into_batches
+from services.backoff import acall_with_backoff
+from adapters.cache_sqlite import TranslationCache, Key
+from core.metrics import TRANSLATION_API_SECONDS
+from google.cloud import translate_v2 as translate
+
+
+class AsyncGoogleTranslator(AsyncTranslator):
+    """
+    Async Google translator: cache misses are split into batches that are
+    sent concurrently, at most max_concurrency at a time across all requests.
+    Concurrent requests for the same lemma share one API call.
+
+    The google-cloud client is blocking, so each batch call runs in a worker
+    thread; the event loop itself never blocks on the network.
+
+    check_cache=False skips looking words up in the cache (results are
+    still stored there), for use behind a chain tier that just did.
+    """
+
+    def __init__(
+        self,
+        cache: TranslationCache,
+        client=None,
+        max_concurrency: int = 4,
+        batch_size: int = 50,
+        retries: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        check_cache: bool = True,
+    ):
+        self.cache = cache
+        self.check_cache = check_cache
+        self.client = client or translate.Client()
+        self.max_concurrency = max_concurrency
+        self.batch_size = batch_size
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self._semaphore = None   # created on first use, inside the event loop
+        self._inflight: Dict[Key, asyncio.Future] = {}
+        self.coalesced = 0
+        self.api_words = 0
+        self.api_batches = 0
+
+    def _lookup_cached(self, words, study_lang, native_lang):
+        translations: Dict[str, str] = {}
+        to_translate: List[str] = []
+        keys = [Key(word, study_lang, native_lang) for word in words]
+        cached = self.cache.get_many(keys)
+        for word, key in zip(words, keys):
+            cached_value = cached.get(key)
+            if cached_value is not None:
+                translations[word] = cached_value
+            else:
+                to_translate.append(word)
+        return translations, to_translate
+
+    def _store(self, pairs, study_lang, native_lang):
+        self.cache.put_many(
+            (Key(word, study_lang, native_lang), translated_text) for word, translated_text in pairs
+        )
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "coalesced": self.coalesced,
+            "api_words": self.api_words,
+            "api_batches": self.api_batches,
+            "in_flight": len(self._inflight),
+        }
+
+    async def translate(self, words: List[str], study_lang: str, native_lang: str) -> Dict[str, str]:
+        if self.check_cache:
+            # SQLite is blocking too; keep it off the event loop
+            translations, to_translate = await asyncio.to_thread(
+                self._lookup_cached, words, study_lang, native_lang
+            )
+        else:
+            translations, to_translate = {}, list(words)
+        if not to_translate:
+            return translations
+
+        # Single-flight, as in GoogleTranslator: claim lemmas nobody is
+        # fetching yet and await the ones another request already is.
+        # Everything here runs on one event loop, so no lock is needed.
+        loop = asyncio.get_running_loop()
+        owned: Dict[str, asyncio.Future] = {}
+        waiting: Dict[str, asyncio.Future] = {}
+        for word in to_translate:
+            key = Key(word, study_lang, native_lang)
+            future = self._inflight.get(key)
+            if future is not None:
+                waiting[word] = future
+                self.coalesced += 1
+            else:
+                future = loop.create_future()
+                self._inflight[key] = future
+                owned[word] = future
+
+        try:
+            # Another request may have cached these since our lookup
+            if owned and self.check_cache:
+                recheck, _ = await asyncio.to_thread(self._lookup_cached, list(owned), study_lang, native_lang)
+                for word, translated_text in recheck.items():
+                    translations[word] = translated_text
+                    owned[word].set_result(translated_text)
+
+            # The semaphore is shared by all requests, so max_concurrency is
+            # a per-translator limit on calls to the API.
+            if self._semaphore is None:
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def translate_batch(batch):
+                async with self._semaphore:
+                    # Timed once a slot is free, so queueing isn't counted as API latency
+                    with TRANSLATION_API_SECONDS.time():
+                        api_results = await acall_with_backoff(
+                            lambda: asyncio.to_thread(
+                                self.client.translate,
+                                batch,
+                                source_language=study_lang,
+                                target_language=native_lang,
+                                format_="text",
+                            ),
+                            retries=self.retries,
+                            base_delay=self.base_delay,
+                            max_delay=self.max_delay,
+                        )
+                self.api_words += len(batch)
+                self.api_batches += 1
+                pairs = [(word, res["translatedText"]) for word, res in zip(batch, api_results)]
+                await asyncio.to_thread(self._store, pairs, study_lang, native_lang)
+                # Release waiters batch by batch
+                for word, translated_text in pairs:
+                    if not owned[word].done():
+                        owned[word].set_result(translated_text)
+                return pairs
+
+            to_fetch = [word for word, future in owned.items() if not future.done()]
+            batches = list(split_into_batches(to_fetch, batch_size=self.batch_size))
+            tasks = [asyncio.ensure_future(translate_batch(b)) for b in batches]
+            try:
+                results = await asyncio.gather(*tasks)
+            except BaseException:
+                # gather() leaves the other batches running: stop them before
+                # their words are failed and released below
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+            for batch_pairs in results:
+                translations.update(batch_pairs)
+
+        except BaseException as e:
+            for future in owned.values():
+                if not future.done():
+                    future.set_exception(e)
+                    future.exception()  # mark retrieved: waiters may not exist
+            raise
+
+        finally:
+            for word in owned:
+                self._inflight.pop(Key(word, study_lang, native_lang), None)
+
+        for word, future in waiting.items():
+            translations[word] = await future
+
+        return translations
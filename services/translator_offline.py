@@ -0,0 +1,66 @@
+# services/translator_offline.py
+
+from typing import Dict, List, Mapping, Optional
+
+from services.translator import Translator
+
+
+def first_gloss(definition, max_length: int = 60) -> Optional[str]:
+    """
+    Turn a Wiktionary definition field into a short flashcard gloss:
+    first sense only, first clause only. Long, descriptive definitions
+    return None so a real translator handles them instead.
+    """
+    if isinstance(definition, list):
+        definition = next((d for d in definition if isinstance(d, str) and d.strip()), None)
+    if not isinstance(definition, str):
+        return None
+
+    gloss = definition.split(";")[0].strip().rstrip(".")
+    if not gloss or len(gloss) > max_length:
+        return None
+    return gloss
+
+
+class OfflineDictionaryTranslator(Translator):
+    """
+    Translates German lemmas using the English glosses already in the
+    Wiktionary data: the `definition` field core.wiktionary_loader extracts,
+    i.e. the first gloss of the first non-form-of sense in kaikki entries.
+    No network, no quota. Words without a usable gloss are left out of the
+    result, so a chain can pass them on to the next translator.
+    """
+
+    study_lang = "de"
+    native_lang = "en"
+
+    def __init__(
+        self,
+        noun_info: Mapping[str, Dict],
+        verb_info: Mapping[str, Dict],
+        max_length: int = 60,
+    ):
+        self.noun_info = noun_info
+        self.verb_info = verb_info
+        self.max_length = max_length
+
+    def supports(self, study_lang: str, native_lang: str) -> bool:
+        return study_lang == self.study_lang and native_lang == self.native_lang
+
+    def translate(self, words: List[str], study_lang: str, native_lang: str) -> Dict[str, str]:
+        if not self.supports(study_lang, native_lang):
+            raise ValueError(
+                f"Offline dictionary only covers {self.study_lang}->{self.native_lang}, "
+                f"not {study_lang}->{native_lang}"
+            )
+
+        translations: Dict[str, str] = {}
+        for word in words:
+            # Lower-case lemmas are more often verbs ("essen"), so try those first
+            info = self.verb_info.get(word) or self.noun_info.get(word)
+            if not info:
+                continue
+            gloss = first_gloss(info.get("definition"), self.max_length)
+            if gloss:
+                translations[word] = gloss
+        return translations
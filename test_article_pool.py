@@ -0,0 +1,84 @@
+import asyncio
+
+import httpx
+
+from services.article_pool import ArticlePool, clean_extract
+from services.fake_article_server import FakeArticleServer
+
+
+async def wait_for(condition, timeout=5.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+def test_clean_extract():
+    assert clean_extract("Berlin ( ) ist die\n Hauptstadt  (; ) Deutschlands. ") == \
+        "Berlin ist die Hauptstadt Deutschlands."
+
+
+def test_pool_prefetches_and_pops_without_waiting():
+    server = FakeArticleServer(delay=0.05).start()
+    prepared = []
+
+    async def prepare(text):
+        prepared.append(text)
+
+    async def run():
+        async with httpx.AsyncClient() as client:
+            pool = ArticlePool(client, server.url + "/page/random/summary", size=3, prepare=prepare).start()
+            await wait_for(lambda: pool.stats()["ready"] == 3)
+
+            # Served straight from the queue, already cleaned and prepared
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            text = pool.pop()
+            assert loop.time() - start < 0.01
+            assert text.startswith("Artikel 1 handelt") and text in prepared
+
+            # The refiller tops the queue back up; it never grows past size
+            await wait_for(lambda: pool.stats()["ready"] == 3)
+            await asyncio.sleep(0.2)
+            assert pool.stats()["ready"] == 3
+            await pool.stop()
+
+            # Empty pool: get() fetches directly
+            while pool.pop() is not None:
+                pass
+            assert (await pool.get()).startswith("Artikel")
+            assert pool.stats()["empty"] >= 1
+
+    try:
+        asyncio.run(run())
+    finally:
+        server.stop()
+
+
+def test_pool_backs_off_while_upstream_fails():
+    server = FakeArticleServer().start()
+    server.status = 429
+
+    async def run():
+        async with httpx.AsyncClient() as client:
+            pool = ArticlePool(client, server.url, size=2, retry_delay=0.05, max_retry_delay=0.1).start()
+            await asyncio.sleep(0.3)
+            assert pool.stats()["failed"] >= 1 and pool.pop() is None
+            # Backoff keeps it from hammering the upstream
+            assert server.requests < 20
+
+            server.status = 200
+            await wait_for(lambda: pool.stats()["ready"] == 2)
+            await pool.stop()
+
+    try:
+        asyncio.run(run())
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    test_clean_extract()
+    test_pool_prefetches_and_pops_without_waiting()
+    test_pool_backs_off_while_upstream_fails()
+    print("ok")
@@ -0,0 +1,76 @@
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from adapters.cache_sqlite import TranslationCache, Key
+
+N_READERS = 16
+N_WRITERS = 16
+OPS_PER_THREAD = 200
+LEMMAS_PER_OP = 20
+
+
+def test_parallel_readers_and_writers():
+    db_path = str(Path(tempfile.mkdtemp()) / "translations.db")
+    cache = TranslationCache(db_path)
+    errors = []
+    start_gate = threading.Barrier(N_READERS + N_WRITERS)
+
+    def writer(w):
+        try:
+            start_gate.wait()
+            for op in range(OPS_PER_THREAD):
+                cache.put_many(
+                    (Key(f"w{w}-{op}-{i}", "de", "en"), f"t{w}-{op}-{i}")
+                    for i in range(LEMMAS_PER_OP)
+                )
+        except Exception as e:
+            errors.append(e)
+
+    def reader(r):
+        try:
+            start_gate.wait()
+            for op in range(OPS_PER_THREAD):
+                w = (r + op) % N_WRITERS
+                keys = [Key(f"w{w}-{op}-{i}", "de", "en") for i in range(LEMMAS_PER_OP)]
+                found = cache.get_many(keys)
+                # Whatever is visible must be a complete, correct value
+                for key, value in found.items():
+                    assert value == "t" + key.source_text[1:], value
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(N_WRITERS)]
+    threads += [threading.Thread(target=reader, args=(i,)) for i in range(N_READERS)]
+
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    total_ops = (N_READERS + N_WRITERS) * OPS_PER_THREAD
+    print(f"{N_READERS} readers + {N_WRITERS} writers: {total_ops / elapsed:,.0f} ops/sec "
+          f"({total_ops * LEMMAS_PER_OP / elapsed:,.0f} lemmas/sec)")
+
+    assert not errors, errors[:3]
+
+    # Every write landed
+    sample = [Key(f"w{w}-{OPS_PER_THREAD - 1}-0", "de", "en") for w in range(N_WRITERS)]
+    assert len(cache.get_many(sample)) == N_WRITERS
+    cache.close()
+
+
+def test_wal_mode_enabled():
+    cache = TranslationCache(str(Path(tempfile.mkdtemp()) / "translations.db"))
+    mode = cache._connection().execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal", mode
+    cache.close()
+
+
+if __name__ == "__main__":
+    test_parallel_readers_and_writers()
+    test_wal_mode_enabled()
+    print("All cache concurrency tests passed")
@@ -0,0 +1,187 @@
+import sqlite3
+import tempfile
+from pathlib import Path
+
+from adapters.cache_memory import MemoryCache
+from adapters.cache_sqlite import TranslationCache, Key
+from adapters.cache_tiered import TieredTranslationCache
+
+
+class FakeClock:
+    """Injected in place of time.monotonic; only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class SpySQLiteCache(TranslationCache):
+    """Records touch_many calls, so batching is visible."""
+
+    def __init__(self, db_path):
+        super().__init__(db_path)
+        self.touches = []
+
+    def touch_many(self, keys):
+        keys = set(keys)
+        if keys:
+            self.touches.append(keys)
+        super().touch_many(keys)
+
+
+def key(word):
+    return Key(word, "de", "en")
+
+
+def fresh_db_path():
+    return str(Path(tempfile.mkdtemp()) / "translations.db")
+
+
+def set_last_accessed(db_path, modifier, words=None):
+    with sqlite3.connect(db_path) as conn:
+        if words is None:
+            conn.execute("UPDATE translations SET last_accessed = datetime('now', ?)", (modifier,))
+        else:
+            conn.executemany(
+                "UPDATE translations SET last_accessed = datetime('now', ?) WHERE source_text = ?",
+                [(modifier, w) for w in words],
+            )
+
+
+def test_memory_entries_expire_after_ttl():
+    clock = FakeClock()
+    memory = MemoryCache(ttl_seconds=60, clock=clock)
+    memory.put(key("haus"), "house")
+
+    clock.advance(59)
+    assert memory.get(key("haus")) == "house"
+    clock.advance(1)
+    assert memory.get(key("haus")) is None
+
+    stats = memory.stats()
+    assert stats["expirations"] == 1 and stats["entries"] == 0 and stats["bytes"] == 0
+    assert stats["hits"] == 1 and stats["misses"] == 1
+
+
+def test_memory_size_cap_evicts_least_recently_used():
+    entry_size = MemoryCache._size(key("wort0"), "word0")
+    memory = MemoryCache(max_bytes=3 * entry_size, clock=FakeClock())
+
+    for i in range(3):
+        memory.put(key(f"wort{i}"), f"word{i}")
+    memory.get(key("wort0"))                 # wort1 is now least recently used
+    memory.put(key("wort3"), "word3")
+
+    assert memory.get(key("wort1")) is None
+    assert memory.get_many([key(f"wort{i}") for i in (0, 2, 3)]) == {
+        key("wort0"): "word0", key("wort2"): "word2", key("wort3"): "word3",
+    }
+    stats = memory.stats()
+    assert stats["evictions"] == 1 and stats["bytes"] <= 3 * entry_size
+
+
+def test_sqlite_hits_are_promoted_and_touches_batched():
+    clock = FakeClock()
+    sqlite = SpySQLiteCache(fresh_db_path())
+    sqlite.put_many([(key("haus"), "house"), (key("hund"), "dog")])
+    tiered = TieredTranslationCache(sqlite, MemoryCache(clock=clock), touch_interval=60, clock=clock)
+
+    assert tiered.get_many([key("haus"), key("hund"), key("katze")]) == {key("haus"): "house", key("hund"): "dog"}
+    assert tiered.stats()["sqlite"]["hits"] == 2 and tiered.stats()["sqlite"]["misses"] == 1
+    assert tiered.memory.stats()["entries"] == 2
+
+    # Served from memory now: SQLite isn't asked again
+    assert tiered.get(key("haus")) == "house"
+    assert tiered.stats()["sqlite"]["hits"] == 2
+
+    # Access times are buffered until touch_interval has passed, then written at once
+    assert sqlite.touches == []
+    clock.advance(60)
+    tiered.get(key("hund"))
+    assert sqlite.touches == [{key("haus"), key("hund")}]
+
+    tiered.get(key("haus"))
+    tiered.flush()
+    assert sqlite.touches[-1] == {key("haus")}
+
+
+def test_last_accessed_is_added_to_old_databases():
+    db_path = fresh_db_path()
+    # Schema from before last_accessed existed
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("""
+            CREATE TABLE translations (
+                source_text   TEXT NOT NULL,
+                study_lang    TEXT NOT NULL,
+                native_lang   TEXT NOT NULL,
+                translated_text TEXT NOT NULL,
+                created_at    TEXT DEFAULT (datetime('now')),
+                PRIMARY KEY (source_text, study_lang, native_lang)
+            )
+        """)
+        conn.execute(
+            "INSERT INTO translations VALUES ('haus', 'de', 'en', 'house', '2023-01-02 03:04:05')"
+        )
+
+    cache = TranslationCache(db_path)
+    assert cache.get(key("haus")) == "house"
+    with sqlite3.connect(db_path) as conn:
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(translations)")}
+        last_accessed = conn.execute("SELECT last_accessed FROM translations").fetchone()[0]
+    assert "last_accessed" in columns
+    assert last_accessed == "2023-01-02 03:04:05"
+
+    # Opening it again doesn't try to migrate twice
+    cache.close()
+    assert TranslationCache(db_path).get(key("haus")) == "house"
+
+
+def test_evict_by_age_then_row_budget():
+    db_path = fresh_db_path()
+    cache = TranslationCache(db_path)
+    cache.put_many((key(f"wort{i}"), f"word{i}") for i in range(10))
+    set_last_accessed(db_path, "-100 days", ["wort0", "wort1"])
+    # wort2 .. wort5 are older than the rest, but recent enough to survive the age limit
+    set_last_accessed(db_path, "-2 days", ["wort2", "wort3", "wort4", "wort5"])
+
+    assert cache.evict(max_age_days=30) == 2
+    assert cache.count() == 8
+    assert cache.evict(max_rows=4) == 4
+    assert set(cache.get_many(key(f"wort{i}") for i in range(10))) == {key(f"wort{i}") for i in range(6, 10)}
+    assert cache.evict() == 0
+
+
+def test_tiered_evict_keeps_recently_read_entries():
+    clock = FakeClock()
+    db_path = fresh_db_path()
+    sqlite = TranslationCache(db_path)
+    tiered = TieredTranslationCache(
+        sqlite, MemoryCache(clock=clock), sqlite_max_age_days=30, evict_every=3, clock=clock,
+    )
+    tiered.put_many([(key("haus"), "house"), (key("hund"), "dog")])
+    set_last_accessed(db_path, "-100 days")
+
+    # A hit whose access time is still only buffered
+    assert tiered.get(key("haus")) == "house"
+
+    # The third write reaches evict_every: pending touches are flushed first
+    tiered.put(key("katze"), "cat")
+    assert sqlite.count() == 2
+    assert sqlite.get(key("hund")) is None
+    assert sqlite.get(key("haus")) == "house"
+    assert tiered.stats()["sqlite"]["evicted"] == 1
+
+
+if __name__ == "__main__":
+    test_memory_entries_expire_after_ttl()
+    test_memory_size_cap_evicts_least_recently_used()
+    test_sqlite_hits_are_promoted_and_touches_batched()
+    test_last_accessed_is_added_to_old_databases()
+    test_evict_by_age_then_row_budget()
+    test_tiered_evict_keeps_recently_read_entries()
+    print("All cache tier tests passed")
@@ -0,0 +1,81 @@
+import pickle
+import tempfile
+import threading
+from pathlib import Path
+
+from core.cefr_index import CEFRIndex, load_cefr_index
+
+LEVELS = {"haus": "A1", "tür": "A1", "wohnung": "A1", "reise": "A1", "flug": "B1", "kinderzimmer": "A1", "ei": "A1"}
+
+
+def test_compounds_get_the_hardest_component_level():
+    index = CEFRIndex(LEVELS)
+
+    assert index.decompose("haustür") == ["haus", "tür"]
+    assert index.get("haustür") == "A1"
+    # Linking element between the components
+    assert index.decompose("wohnungstür") == ["wohnung", "tür"]
+    assert index.get("reiseflug") == "B1"
+
+
+def test_listed_and_unknown_lemmas():
+    index = CEFRIndex(LEVELS)
+
+    # Listed lemmas are never split
+    assert index.decompose("kinderzimmer") is None
+    assert index.get("kinderzimmer") == "A1"
+    # A single component is not a compound; short components are ignored
+    assert index.get("hausx", "B2+ / Unknown") == "B2+ / Unknown"
+    assert index.get("eihaus") is None
+    assert "haustür" in index and len(index) == len(LEVELS)
+
+
+def test_snapshot_round_trip():
+    tmp = Path(tempfile.mkdtemp())
+    csv_path = tmp / "GermanCEFRVocabA1.csv"
+    csv_path.write_text("Word,Lower,Level\nHaus,haus,A1\nTür,tür,A1\n", encoding="utf-8")
+    snapshot = tmp / "cefr_index.pickle"
+
+    built = load_cefr_index([csv_path], snapshot)
+    assert snapshot.exists()
+    loaded = load_cefr_index([csv_path], snapshot)
+
+    assert loaded.levels == built.levels
+    assert loaded.get("haustür") == "A1"
+
+
+def test_unreadable_snapshot_is_rebuilt():
+    tmp = Path(tempfile.mkdtemp())
+    csv_path = tmp / "GermanCEFRVocabA1.csv"
+    csv_path.write_text("Word,Lower,Level\nHaus,haus,A1\nTür,tür,A1\n", encoding="utf-8")
+    snapshot = tmp / "cefr_index.pickle"
+
+    # Valid pickles of the wrong shape fail with errors other than UnpicklingError
+    for junk in (pickle.dumps(["not", "a", "snapshot"]), b"\x80\x05garbage"):
+        snapshot.write_bytes(junk)
+        assert load_cefr_index([csv_path], snapshot).get("haustür") == "A1"
+        assert CEFRIndex.load(snapshot).levels == {"haus": "A1", "tür": "A1"}
+
+
+def test_concurrent_saves_leave_a_valid_snapshot():
+    tmp = Path(tempfile.mkdtemp())
+    snapshot = tmp / "cefr_index.pickle"
+    index = CEFRIndex({f"wort{i}": "A1" for i in range(20000)})
+
+    threads = [threading.Thread(target=index.save, args=(snapshot,)) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(CEFRIndex.load(snapshot)) == 20000
+    assert [p.name for p in tmp.iterdir()] == ["cefr_index.pickle"]
+
+
+if __name__ == "__main__":
+    test_compounds_get_the_hardest_component_level()
+    test_listed_and_unknown_lemmas()
+    test_snapshot_round_trip()
+    test_unreadable_snapshot_is_rebuilt()
+    test_concurrent_saves_leave_a_valid_snapshot()
+    print("ok")
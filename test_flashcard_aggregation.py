@@ -0,0 +1,45 @@
+from core.flashcard_generator import generate_flashcards, generate_lemma_flashcards
+from core.flashcard_model import LemmaFlashcard
+
+TOKENS = [
+    ("Haus", "Haus", "NOUN", "Das Haus ist groß."),
+    ("Häuser", "Haus", "NOUN", "Die Häuser sind alt."),
+    ("läuft", "laufen", "VERB", "Der Hund läuft."),
+    ("Haus", "Haus", "NOUN", "Das Haus ist groß."),
+    ("Haus", "Haus", "NOUN", "Im Haus ist es warm."),
+    ("Haus", "Haus", "NOUN", "Ein Haus am See."),
+    ("schnell", "schnell", "ADJ", "Er ist schnell."),
+]
+WORD_DATA = [{"word": w, "lemma": l, "pos_tag": p, "sentence": s} for w, l, p, s in TOKENS]
+TRANSLATIONS = {"haus": "house", "laufen": "to run"}
+NOUN_INFO = {"haus": {"article": "das", "plural": "häuser"}}
+VERB_INFO = {"laufen": {"3sg": "läuft"}}
+
+
+def test_one_card_per_lemma_and_pos():
+    cards = generate_lemma_flashcards(WORD_DATA, TRANSLATIONS, {"haus": "A1"}, NOUN_INFO, VERB_INFO, max_examples=2)
+
+    # Untranslated lemmas are skipped, order is first appearance
+    assert [(c.lemma, c.pos) for c in cards] == [("haus", "NOUN"), ("laufen", "VERB")]
+
+    haus = cards[0]
+    assert haus.occurrences == 5
+    assert haus.forms == ["Haus", "Häuser"]
+    assert haus.examples == ["Das Haus ist groß.", "Die Häuser sind alt."]
+    assert haus.display_word == "das Haus"
+    assert haus.cefr == "A1"
+
+
+def test_token_mode_is_unchanged():
+    cards = generate_flashcards(WORD_DATA, TRANSLATIONS, {}, NOUN_INFO, VERB_INFO)
+
+    assert len(cards) == 6
+    assert not any(isinstance(c, LemmaFlashcard) for c in cards)
+    # Token-mode cards keep their original keys: no aggregate fields, not even as null
+    assert not {"occurrences", "forms", "examples"} & set(cards[0].to_dict())
+
+
+if __name__ == "__main__":
+    test_one_card_per_lemma_and_pos()
+    test_token_mode_is_unchanged()
+    print("ok")
@@ -0,0 +1,59 @@
+import json
+
+from core import flashcard_json
+from core.flashcard_generator import generate_lemma_flashcards
+from core.flashcard_model import Flashcard
+
+NOUN = Flashcard(
+    word="Größe", lemma="größe", pos="NOUN", translation="size",
+    example_sentence="Die Größe des Raums überrascht „alle“.",
+    article="die", plural="Größen", display_word="die Größe",
+)
+# cefr, conjugations and display_details stay None
+VERB = Flashcard(
+    word="läuft", lemma="laufen", pos="VERB", translation="to run",
+    conjugations={"3sg": "läuft", "past": None},
+)
+AGGREGATE = generate_lemma_flashcards(
+    [{"word": "Tür", "lemma": "Tür", "pos_tag": "NOUN", "sentence": "Die Tür ist zu."}],
+    {"tür": "door"}, {}, {}, {},
+)
+PAYLOAD = {"flashcards": [NOUN, VERB, *AGGREGATE], "note": "Grüße"}
+
+
+def stdlib_dumps(obj, omit_none):
+    # Same module with the optional dependency switched off
+    saved = flashcard_json.orjson
+    flashcard_json.orjson = None
+    try:
+        return flashcard_json.dumps(obj, omit_none=omit_none)
+    finally:
+        flashcard_json.orjson = saved
+
+
+def test_backends_produce_the_same_bytes():
+    if flashcard_json.orjson is None:
+        print("orjson not installed, only the stdlib backend is in use")
+        return
+
+    for omit_none in (False, True):
+        assert flashcard_json.dumps(PAYLOAD, omit_none=omit_none) == stdlib_dumps(PAYLOAD, omit_none)
+
+
+def test_stdlib_output():
+    body = stdlib_dumps(PAYLOAD, omit_none=False).decode("utf-8")
+    # Non-ASCII text is written as UTF-8, not \u escapes; None is null
+    assert '"word":"Größe"' in body and "\\u" not in body
+    assert '"cefr":null' in body and '"past":null' in body
+
+    noun, verb, aggregate = json.loads(stdlib_dumps(PAYLOAD, omit_none=True))["flashcards"]
+    assert "cefr" not in noun and "display_details" not in noun
+    assert aggregate["occurrences"] == 1 and aggregate["forms"] == ["Tür"]
+    # Only card fields are dropped, not None values nested inside them
+    assert verb["conjugations"] == {"3sg": "läuft", "past": None}
+
+
+if __name__ == "__main__":
+    test_backends_produce_the_same_bytes()
+    test_stdlib_output()
+    print("All flashcard JSON tests passed")
@@ -0,0 +1,97 @@
+import spacy
+from spacy.language import Language
+
+from core import pipeline
+from core.incremental_pipeline import IncrementalPipeline
+
+TEXT = "Das Haus ist groß. Der Hund läuft schnell. Das Haus ist groß."
+
+
+@Language.component("stub_tagger")
+def stub_tagger(doc):
+    # Stand-in for the trained tagger: every alphabetic non-stop word is a noun
+    for token in doc:
+        if token.is_alpha and not token.is_stop:
+            token.pos_ = "NOUN"
+            token.lemma_ = token.text.lower()
+    return doc
+
+
+class CountingModel:
+    """Wraps a blank pipeline and records what it was asked to parse."""
+
+    def __init__(self):
+        self.nlp = spacy.blank("de")
+        self.nlp.add_pipe("sentencizer")
+        self.nlp.add_pipe("stub_tagger")
+        self.parsed = []
+
+    def add_pipe(self, name, first=False):
+        pass
+
+    def __call__(self, text):
+        self.parsed.append(text)
+        return self.nlp(text)
+
+    def pipe(self, texts):
+        texts = list(texts)
+        self.parsed.extend(texts)
+        return self.nlp.pipe(texts)
+
+
+def with_counting_models(test):
+    def run():
+        models = {}
+
+        def loader(name, exclude):
+            return models.setdefault(tuple(exclude), CountingModel())
+
+        original = pipeline.engines._loader
+        pipeline.engines._loader = loader
+        for profile in pipeline.PIPELINE_PROFILES:
+            pipeline.engines.evict("de", profile)
+        try:
+            test(lambda profile: pipeline.get_nlp(profile))
+        finally:
+            pipeline.engines._loader = original
+            for profile in pipeline.PIPELINE_PROFILES:
+                pipeline.engines.evict("de", profile)
+    run.__name__ = test.__name__
+    return run
+
+
+@with_counting_models
+def test_accurate_parses_whole_documents(get_model):
+    incremental = IncrementalPipeline()
+    table = incremental.process_table(TEXT, "accurate")
+
+    # One parse of the full text, same table as german_nlp_table; the cache isn't used
+    assert get_model("accurate").parsed == [TEXT]
+    assert table.vocab == pipeline.german_nlp_table(TEXT, "accurate").vocab == ["haus", "hund", "läuft", "schnell"]
+    assert incremental.stats() == {"hits": 0, "misses": 0, "sentences": 0}
+
+    tables = incremental.process_tables([TEXT, "Der Hund."], "accurate")
+    assert get_model("accurate").parsed[-2:] == [TEXT, "Der Hund."]
+    assert [t.vocab for t in tables] == [table.vocab, ["hund"]]
+
+
+@with_counting_models
+def test_fast_parses_only_new_sentences(get_model):
+    incremental = IncrementalPipeline()
+    first = incremental.process_table(TEXT, "fast")
+    assert get_model("fast").parsed == ["Das Haus ist groß.", "Der Hund läuft schnell."]
+    assert first.vocab == ["haus", "hund", "läuft", "schnell"]
+
+    incremental.process_table("Der Hund läuft schnell. Die Katze schläft.", "fast")
+    assert get_model("fast").parsed[-1] == "Die Katze schläft."
+    assert incremental.stats()["hits"] == 2
+
+    tables = incremental.process_tables(["Das Haus ist groß.", "Die Maus."], "fast")
+    assert get_model("fast").parsed[-1] == "Die Maus."
+    assert [t.vocab for t in tables] == [["haus"], ["maus"]]
+
+
+if __name__ == "__main__":
+    test_accurate_parses_whole_documents()
+    test_fast_parses_only_new_sentences()
+    print("All incremental pipeline tests passed")
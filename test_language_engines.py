@@ -0,0 +1,149 @@
+import threading
+import time
+
+from core.language_engines import LanguageEngineRegistry
+
+PROFILES = {
+    "accurate": {"exclude": [], "sentencizer": False},
+    "fast": {"exclude": ["ner", "parser"], "sentencizer": True},
+}
+MODELS = {"de": "de_model", "fr": "fr_model", "es": "es_model"}
+MB = 1024 * 1024
+
+
+class FakeModel:
+    def __init__(self, name, exclude):
+        self.name = name
+        self.exclude = exclude
+        self.pipes = []
+
+    def add_pipe(self, name, first=False):
+        self.pipes.insert(0, name) if first else self.pipes.append(name)
+
+
+def make_registry(budget_mb=None):
+    loaded = []
+
+    def loader(name, exclude):
+        loaded.append(name)
+        return FakeModel(name, exclude)
+
+    registry = LanguageEngineRegistry(
+        PROFILES,
+        models=MODELS,
+        memory_budget_bytes=budget_mb * MB if budget_mb else None,
+        loader=loader,
+        size_of=lambda model, name: 100 * MB,
+    )
+    return registry, loaded
+
+
+def test_models_load_once_per_language_and_profile():
+    registry, loaded = make_registry()
+
+    de = registry.get("de", "accurate")
+    assert registry.get("de", "accurate") is de
+    fast = registry.get("de", "fast")
+
+    assert loaded == ["de_model", "de_model"]
+    assert fast.exclude == ["ner", "parser"] and fast.pipes == ["sentencizer"]
+    for lang, profile in [("xx", "accurate"), ("de", "turbo")]:
+        try:
+            registry.get(lang, profile)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"expected ValueError for {lang}/{profile}")
+
+
+def test_least_recently_used_models_are_evicted_over_budget():
+    registry, loaded = make_registry(budget_mb=250)
+
+    registry.get("de", "accurate")
+    registry.get("fr", "accurate")
+    registry.get("de", "accurate")        # de is now most recently used
+    registry.get("es", "accurate")        # 300 MB > 250 MB: fr goes
+
+    stats = registry.stats()
+    assert [e["study_lang"] for e in stats["engines"]] == ["de", "es"]
+    assert stats["resident_bytes"] == 200 * MB and stats["evictions"] == 1
+
+    # Evicted models are reloaded on demand
+    registry.get("fr", "accurate")
+    assert loaded == ["de_model", "fr_model", "es_model", "fr_model"]
+
+
+def test_a_model_larger_than_the_budget_still_loads():
+    registry, _ = make_registry(budget_mb=50)
+
+    assert registry.get("de", "accurate").name == "de_model"
+    assert [e["study_lang"] for e in registry.stats()["engines"]] == ["de"]
+
+
+def test_loaded_models_are_served_while_another_loads():
+    fr_loading = threading.Event()
+    release_fr = threading.Event()
+    loaded = []
+
+    def loader(name, exclude):
+        loaded.append(name)
+        if name == "fr_model":
+            fr_loading.set()
+            release_fr.wait(5)
+        return FakeModel(name, exclude)
+
+    registry = LanguageEngineRegistry(PROFILES, models=MODELS, loader=loader, size_of=lambda m, n: MB)
+    de = registry.get("de", "accurate")
+
+    fr_results = []
+    threads = [
+        threading.Thread(target=lambda: fr_results.append(registry.get("fr", "accurate")))
+        for _ in range(3)
+    ]
+    for t in threads:
+        t.start()
+    assert fr_loading.wait(5)
+
+    # The French load is still running; German doesn't wait for it
+    start = time.perf_counter()
+    assert registry.get("de", "accurate") is de
+    assert time.perf_counter() - start < 0.5
+
+    release_fr.set()
+    for t in threads:
+        t.join()
+
+    # Three concurrent callers, one load, the same model for all
+    assert loaded == ["de_model", "fr_model"]
+    assert len(fr_results) == 3 and all(m is fr_results[0] for m in fr_results)
+    assert registry.stats()["engines"][-1]["uses"] == 3
+
+
+def test_a_failed_load_is_retried_on_the_next_call():
+    calls = []
+
+    def loader(name, exclude):
+        calls.append(name)
+        if len(calls) == 1:
+            raise OSError("model not installed")
+        return FakeModel(name, exclude)
+
+    registry = LanguageEngineRegistry(PROFILES, models=MODELS, loader=loader, size_of=lambda m, n: MB)
+    try:
+        registry.get("de", "accurate")
+    except OSError:
+        pass
+    else:
+        raise AssertionError("expected OSError")
+
+    assert registry.get("de", "accurate").name == "de_model"
+    assert calls == ["de_model", "de_model"]
+
+
+if __name__ == "__main__":
+    test_models_load_once_per_language_and_profile()
+    test_least_recently_used_models_are_evicted_over_budget()
+    test_a_model_larger_than_the_budget_still_loads()
+    test_loaded_models_are_served_while_another_loads()
+    test_a_failed_load_is_retried_on_the_next_call()
+    print("All language engine tests passed")
@@ -0,0 +1,48 @@
+from core.metrics import MetricsRegistry
+
+
+def test_histogram_and_counter_text_format():
+    registry = MetricsRegistry()
+    stages = registry.histogram("stage_seconds", "Time per stage.", labelnames=("stage",), buckets=(0.1, 1.0))
+    requests = registry.counter("requests_total", "Requests.", labelnames=("endpoint",))
+
+    stages.observe(0.05, stage="nlp")
+    stages.observe(0.5, stage="nlp")
+    stages.observe(5.0, stage="nlp")
+    with stages.time(stage="serialization"):
+        pass
+    requests.inc(endpoint="flashcards")
+    requests.inc(2, endpoint="flashcards")
+
+    lines = registry.render().splitlines()
+    assert "# TYPE stage_seconds histogram" in lines
+    # Buckets are cumulative and end with +Inf
+    assert 'stage_seconds_bucket{stage="nlp",le="0.1"} 1' in lines
+    assert 'stage_seconds_bucket{stage="nlp",le="1.0"} 2' in lines
+    assert 'stage_seconds_bucket{stage="nlp",le="+Inf"} 3' in lines
+    assert 'stage_seconds_sum{stage="nlp"} 5.55' in lines
+    assert 'stage_seconds_count{stage="nlp"} 3' in lines
+    assert 'stage_seconds_count{stage="serialization"} 1' in lines
+    assert 'requests_total{endpoint="flashcards"} 3' in lines
+
+
+def test_collectors_are_read_on_render():
+    registry = MetricsRegistry()
+    hits = {"response": 0}
+    registry.add_collector(lambda: [
+        ("cache_hits_total", "counter", "Cache hits.", [({"cache": k}, v) for k, v in hits.items()]),
+    ])
+
+    hits["response"] = 7
+    assert 'cache_hits_total{cache="response"} 7' in registry.render().splitlines()
+
+    def broken():
+        raise RuntimeError("not loaded")
+    registry.add_collector(broken)
+    assert 'cache_hits_total{cache="response"} 7' in registry.render().splitlines()
+
+
+if __name__ == "__main__":
+    test_histogram_and_counter_text_format()
+    test_collectors_are_read_on_render()
+    print("ok")
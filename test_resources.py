@@ -0,0 +1,92 @@
+from core.resources import FAILED, READY, ResourceRegistry
+
+
+class FakeClock:
+    """Injected in place of time.monotonic; only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class FlakyLoader:
+    """Fails the first `failures` calls, then returns "model"."""
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise OSError(f"model missing (attempt {self.calls})")
+        return "model"
+
+
+def get_error(registry, name):
+    try:
+        registry.get(name)
+    except OSError as e:
+        return e
+    raise AssertionError("expected get() to raise")
+
+
+def test_failed_load_is_not_retried_during_cooldown():
+    clock = FakeClock()
+    loader = FlakyLoader(failures=1)
+    registry = ResourceRegistry(retry_after=10, clock=clock)
+    registry.register("nlp", loader)
+
+    first = get_error(registry, "nlp")
+    # Later callers get the stored error without touching the loader
+    clock.advance(9)
+    assert get_error(registry, "nlp") is first
+    assert loader.calls == 1
+
+    status = registry.status()["nlp"]
+    assert status["state"] == FAILED and status["retry_in"] == 1
+    assert status["error"] == "OSError: model missing (attempt 1)"
+
+    clock.advance(1)
+    assert registry.get("nlp") == "model"
+    assert loader.calls == 2
+    assert registry.status()["nlp"]["state"] == READY and registry.status()["nlp"]["retry_in"] is None
+
+
+def test_cooldown_doubles_up_to_the_limit():
+    clock = FakeClock()
+    loader = FlakyLoader(failures=10)
+    registry = ResourceRegistry(retry_after=10, max_retry_after=30, clock=clock)
+    registry.register("nlp", loader)
+
+    waits = []
+    for _ in range(4):
+        get_error(registry, "nlp")
+        waits.append(registry.status()["nlp"]["retry_in"])
+        clock.advance(waits[-1])
+
+    assert waits == [10, 20, 30, 30]
+    assert loader.calls == 4
+
+
+def test_warm_up_records_the_failure_and_get_reports_it():
+    clock = FakeClock()
+    registry = ResourceRegistry(clock=clock)
+    registry.register("nlp", FlakyLoader(failures=1))
+    registry.register("cefr", lambda: {"haus": "A1"})
+
+    registry.warm_up()
+    assert registry.is_loaded("cefr") and not registry.is_ready()
+    assert "attempt 1" in str(get_error(registry, "nlp"))
+
+
+if __name__ == "__main__":
+    test_failed_load_is_not_retried_during_cooldown()
+    test_cooldown_doubles_up_to_the_limit()
+    test_warm_up_records_the_failure_and_get_reports_it()
+    print("All resource registry tests passed")
@@ -0,0 +1,90 @@
+from adapters.cache_response import ResponseCache, response_key
+
+TEXT = "Das Haus ist groß. Der Hund läuft."
+
+
+def test_hits_and_misses():
+    cache = ResponseCache()
+    key = response_key(TEXT, "de", "en", "v1")
+
+    assert cache.get(key) is None
+    cache.put(key, b'{"flashcards": []}')
+    assert cache.get(key) == b'{"flashcards": []}'
+
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1 and stats["hit_rate"] == 0.5
+    assert stats["entries"] == 1 and stats["bytes"] == len(b'{"flashcards": []}')
+
+    cache.clear()
+    assert cache.get(key) is None and cache.stats()["bytes"] == 0
+
+
+def test_entry_limit_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=2)
+    cache.put("a", b"1")
+    cache.put("b", b"2")
+    cache.get("a")                  # b is now least recently used
+    cache.put("c", b"3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1" and cache.get("c") == b"3"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_byte_limit():
+    cache = ResponseCache(max_bytes=10)
+    cache.put("a", b"12345")
+    cache.put("b", b"12345")
+    cache.put("c", b"123")          # 13 bytes: a goes
+
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] == 8
+
+    # Bigger than the whole budget: not stored, nothing evicted for it
+    cache.put("huge", b"x" * 11)
+    assert cache.get("huge") is None
+    assert cache.get("b") == b"12345" and cache.get("c") == b"123"
+
+    # Replacing an entry accounts for the old body
+    cache.put("b", b"1")
+    assert cache.stats()["bytes"] == 4
+
+
+def test_peek_is_not_counted():
+    cache = ResponseCache(max_entries=2)
+    assert cache.peek("a") is None
+    cache.put("a", b"1")
+    cache.put("b", b"2")
+    assert cache.peek("a") == b"1"
+    assert cache.stats()["hits"] == 0 and cache.stats()["misses"] == 0
+
+    # Nor does it refresh the entry: a is still the one evicted
+    cache.put("c", b"3")
+    assert cache.peek("a") is None
+
+
+def test_key_covers_version_and_options():
+    base = response_key(TEXT, "de", "en", "v1", omit_none=False, aggregate=False)
+
+    assert base == response_key(TEXT, "de", "en", "v1", aggregate=False, omit_none=False)
+    assert base != response_key(TEXT, "de", "en", "v2", omit_none=False, aggregate=False)
+    assert base != response_key(TEXT, "de", "en", "v1", omit_none=True, aggregate=False)
+    assert base != response_key(TEXT, "de", "en", "v1", omit_none=False, aggregate=True)
+    assert base != response_key(TEXT, "de", "fr", "v1", omit_none=False, aggregate=False)
+
+
+def test_key_is_exact_text():
+    # Cards quote the text back, so differently formatted input is a different response
+    assert response_key(TEXT, "de", "en", "v1") != response_key(TEXT.replace(" ", "\n", 1), "de", "en", "v1")
+    # NFC vs NFD spelling of "Tür"
+    assert response_key("T\u00fcr", "de", "en", "v1") != response_key("Tu\u0308r", "de", "en", "v1")
+
+
+if __name__ == "__main__":
+    test_hits_and_misses()
+    test_entry_limit_evicts_least_recently_used()
+    test_byte_limit()
+    test_peek_is_not_counted()
+    test_key_covers_version_and_options()
+    test_key_is_exact_text()
+    print("All response cache tests passed")
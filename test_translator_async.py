@@ -0,0 +1,136 @@
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from adapters.cache_sqlite import TranslationCache
+from services.backoff import call_with_backoff
+from services.fake_translation_server import FakeTranslationServer
+from services.translator_google import GoogleTranslator
+from services.translator_google_async import AsyncGoogleTranslator
+from services.translator_chain import ChainTranslator, CachedTranslator
+
+WORDS = [f"wort{i}" for i in range(500)]   # 10 batches of 50
+
+
+def fresh_cache():
+    return TranslationCache(str(Path(tempfile.mkdtemp()) / "translations.db"))
+
+
+def test_async_batches_run_concurrently():
+    server = FakeTranslationServer(delay=0.2).start()
+    try:
+        client = server.client()
+
+        start = time.perf_counter()
+        sync_result = GoogleTranslator(fresh_cache(), client=client).translate(WORDS, "de", "en")
+        sync_time = time.perf_counter() - start
+
+        translator = AsyncGoogleTranslator(fresh_cache(), client=client, max_concurrency=5)
+        server.max_in_flight = 0
+        start = time.perf_counter()
+        async_result = asyncio.run(translator.translate(WORDS, "de", "en"))
+        async_time = time.perf_counter() - start
+
+        print(f"sync: {sync_time:.2f}s  async: {async_time:.2f}s  speedup: {sync_time / async_time:.1f}x")
+        assert async_result == sync_result
+        assert async_result["wort7"] == FakeTranslationServer.fake_translation("wort7", "en")
+        assert server.max_in_flight <= 5
+        assert sync_time / async_time > 2
+    finally:
+        server.stop()
+
+
+def test_async_uses_cache():
+    server = FakeTranslationServer(delay=0.0).start()
+    try:
+        translator = AsyncGoogleTranslator(fresh_cache(), client=server.client())
+        asyncio.run(translator.translate(WORDS[:10], "de", "en"))
+        requests_before = server.requests
+        asyncio.run(translator.translate(WORDS[:10], "de", "en"))
+        assert server.requests == requests_before
+    finally:
+        server.stop()
+
+
+def test_failed_batch_cancels_its_siblings():
+    server = FakeTranslationServer(delay=0.3).start()
+    server.fail_texts = {"wort0"}   # the first of 10 batches fails at once
+    try:
+        translator = AsyncGoogleTranslator(fresh_cache(), client=server.client(), max_concurrency=5, retries=0)
+        loop_errors = []
+
+        async def run():
+            asyncio.get_running_loop().set_exception_handler(lambda loop, context: loop_errors.append(context))
+            try:
+                await translator.translate(WORDS, "de", "en")
+            except Exception as e:
+                failure = e
+            else:
+                raise AssertionError("expected the failed batch to propagate")
+            # Give any orphaned batch time to finish and misbehave
+            await asyncio.sleep(0.5)
+            return failure
+
+        failure = asyncio.run(run())
+        assert "500" in str(failure) or "Injected" in str(failure), failure
+        assert loop_errors == []
+        assert translator.stats()["in_flight"] == 0
+        # Batches still waiting for a slot never reached the server
+        assert server.requests <= 5
+
+        # The words are free again: a retry fetches them normally
+        server.fail_texts = set()
+        assert asyncio.run(translator.translate(WORDS[50:60], "de", "en"))["wort55"] == \
+            FakeTranslationServer.fake_translation("wort55", "en")
+    finally:
+        server.stop()
+
+
+def test_chain_looks_up_the_cache_once():
+    class CountingCache(TranslationCache):
+        lookups = 0
+
+        def get_many(self, keys):
+            self.lookups += 1
+            return super().get_many(keys)
+
+    server = FakeTranslationServer(delay=0.0).start()
+    try:
+        cache = CountingCache(str(Path(tempfile.mkdtemp()) / "translations.db"))
+        chain = ChainTranslator([
+            ("cache", CachedTranslator(cache)),
+            ("google", AsyncGoogleTranslator(cache, client=server.client(), check_cache=False)),
+        ])
+
+        asyncio.run(chain.atranslate(WORDS[:10], "de", "en"))
+        assert cache.lookups == 1
+        result = asyncio.run(chain.atranslate(WORDS[5:15], "de", "en"))
+        assert cache.lookups == 2
+
+        assert result["wort12"] == FakeTranslationServer.fake_translation("wort12", "en")
+        assert chain.stats() == {"cache": 5, "google": 15, "unresolved": 0}
+    finally:
+        server.stop()
+
+
+def test_backoff_retries_then_succeeds():
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise ConnectionError("boom")
+        return "ok"
+
+    assert call_with_backoff(flaky, retries=4, base_delay=0.01) == "ok"
+    assert len(calls) == 3
+
+
+if __name__ == "__main__":
+    test_async_batches_run_concurrently()
+    test_async_uses_cache()
+    test_failed_batch_cancels_its_siblings()
+    test_chain_looks_up_the_cache_once()
+    test_backoff_retries_then_succeeds()
+    print("All async translator tests passed")
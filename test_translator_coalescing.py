@@ -0,0 +1,132 @@
+import asyncio
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from adapters.cache_sqlite import TranslationCache
+from services.translator_google import GoogleTranslator
+from services.translator_google_async import AsyncGoogleTranslator
+
+WORDS = [f"wort{i}" for i in range(120)]
+
+
+class SlowFakeClient:
+    """Stands in for translate_v2.Client; every call takes `delay` seconds."""
+
+    def __init__(self, delay=0.3):
+        self.delay = delay
+        self.requested_words = []
+        self._lock = threading.Lock()
+
+    def translate(self, values, source_language, target_language, format_):
+        with self._lock:
+            self.requested_words.extend(values)
+        time.sleep(self.delay)
+        return [{"translatedText": f"{v}-{target_language}"} for v in values]
+
+
+def test_concurrent_requests_share_api_calls():
+    client = SlowFakeClient()
+    cache = TranslationCache(str(Path(tempfile.mkdtemp()) / "translations.db"))
+    translator = GoogleTranslator(cache, client=client)
+
+    results = []
+    start_gate = threading.Barrier(8)
+
+    def worker():
+        start_gate.wait()
+        results.append(translator.translate(WORDS, study_lang="de", native_lang="en"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    stats = translator.stats()
+    print("stats:", stats, "words sent to API:", len(client.requested_words))
+
+    # Each lemma went to the API exactly once, everyone got every translation
+    assert sorted(client.requested_words) == sorted(WORDS)
+    assert all(r == results[0] for r in results)
+    assert results[0]["wort5"] == "wort5-en"
+    assert stats["coalesced"] > 0
+    assert stats["in_flight"] == 0
+
+
+def test_failure_propagates_to_waiters():
+    class FailingClient(SlowFakeClient):
+        def translate(self, values, source_language, target_language, format_):
+            time.sleep(self.delay)
+            raise ConnectionError("API down")
+
+    cache = TranslationCache(str(Path(tempfile.mkdtemp()) / "translations.db"))
+    translator = GoogleTranslator(cache, client=FailingClient(delay=0.1), retries=0)
+    errors = []
+
+    def worker():
+        try:
+            translator.translate(WORDS[:5], study_lang="de", native_lang="en")
+        except ConnectionError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(errors) == 3
+    assert translator.stats()["in_flight"] == 0
+
+
+def test_async_concurrent_requests_share_api_calls():
+    client = SlowFakeClient()
+    cache = TranslationCache(str(Path(tempfile.mkdtemp()) / "translations.db"))
+    translator = AsyncGoogleTranslator(cache, client=client)
+
+    async def run():
+        # Overlapping word lists: every lemma is wanted by several requests
+        return await asyncio.gather(*(
+            translator.translate(WORDS[i * 10:], study_lang="de", native_lang="en") for i in range(8)
+        ))
+
+    results = asyncio.run(run())
+    stats = translator.stats()
+    print("async stats:", stats, "words sent to API:", len(client.requested_words))
+
+    assert sorted(client.requested_words) == sorted(WORDS)
+    for i, result in enumerate(results):
+        assert result == {w: f"{w}-en" for w in WORDS[i * 10:]}
+    assert stats["coalesced"] > 0
+    assert stats["in_flight"] == 0
+
+
+def test_async_failure_propagates_to_waiters():
+    class FailingClient(SlowFakeClient):
+        def translate(self, values, source_language, target_language, format_):
+            time.sleep(self.delay)
+            raise ConnectionError("API down")
+
+    cache = TranslationCache(str(Path(tempfile.mkdtemp()) / "translations.db"))
+    translator = AsyncGoogleTranslator(cache, client=FailingClient(delay=0.1), retries=0)
+
+    async def run():
+        return await asyncio.gather(
+            *(translator.translate(WORDS[:5], study_lang="de", native_lang="en") for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, ConnectionError) for r in results)
+    assert translator.stats()["coalesced"] > 0
+    assert translator.stats()["in_flight"] == 0
+
+
+if __name__ == "__main__":
+    test_concurrent_requests_share_api_calls()
+    test_failure_propagates_to_waiters()
+    test_async_concurrent_requests_share_api_calls()
+    test_async_failure_propagates_to_waiters()
+    print("All coalescing tests passed")
@@ -0,0 +1,96 @@
+from core.flashcard_generator import generate_flashcards
+from core.wiktionary_loader import extract_entry
+from services.translator_offline import OfflineDictionaryTranslator
+
+# Trimmed-down kaikki entries
+HAUS = {
+    "word": "Haus", "pos": "noun",
+    "head_templates": [{"name": "de-noun", "args": {"1": "n,es,^er"}}],
+    "forms": [
+        {"form": "Hauses", "tags": ["genitive"]},
+        {"form": "Häuser", "tags": ["plural"]},
+        {"form": "Häuschen", "tags": ["diminutive", "neuter"]},
+        {"form": "de-ndecl", "source": "declension", "tags": ["table-tags"]},
+        {"form": "Häusern", "source": "declension", "tags": ["dative", "plural"]},
+    ],
+    "senses": [{"glosses": ["house"], "examples": [{"text": "Das Haus ist groß."}]}],
+}
+MITTEILEN = {
+    "word": "mitteilen", "pos": "verb",
+    "forms": [
+        {"form": "mitteilt", "source": "conjugation", "tags": ["present", "singular", "third-person", "subordinate-clause"]},
+        {"form": "teilte mit", "source": "conjugation", "tags": ["first-person", "past", "singular"]},
+        {"form": "teilt mit", "tags": ["present", "singular", "third-person"]},
+        {"form": "teilte mit", "tags": ["past"]},
+        {"form": "mitgeteilt", "tags": ["participle", "past"]},
+        {"form": "haben", "tags": ["auxiliary"]},
+    ],
+    "senses": [{"glosses": ["to inform, communicate"]}],
+}
+
+
+def test_noun_article_plural_and_display():
+    pos, lemma, info = extract_entry(HAUS)
+
+    assert (pos, lemma) == ("noun", "haus")
+    assert info["gender"] == "neuter" and info["article"] == "das"
+    assert info["plural"] == "Häuser"
+    assert info["definition"] == "house"
+    assert info["example"] == "Das Haus ist groß."
+    assert (info["display_word"], info["display_details"]) == ("das Haus", "die Häuser")
+
+
+def test_verb_conjugations_and_display():
+    pos, lemma, info = extract_entry(MITTEILEN)
+
+    assert (pos, lemma) == ("verb", "mitteilen")
+    assert info["conjugations"] == {
+        "3sg": "teilt mit", "preterite": "teilte mit", "participle": "mitgeteilt", "auxiliary": "haben",
+    }
+    assert info["display_word"] == "mit·teilen"
+    assert info["display_details"] == "3sg: teilt mit\nPräteritum: teilte mit\nPartizip II: mitgeteilt"
+
+
+def test_cards_use_precomputed_display():
+    _, _, noun = extract_entry(HAUS)
+    _, _, verb = extract_entry(MITTEILEN)
+    noun["display_word"] = "precomputed"
+
+    word_data = [
+        {"word": "Haus", "lemma": "Haus", "pos_tag": "NOUN", "sentence": None},
+        {"word": "teilt", "lemma": "mitteilen", "pos_tag": "VERB", "sentence": None},
+    ]
+    haus, mitteilen = generate_flashcards(
+        word_data, {"haus": "house", "mitteilen": "to inform"}, {},
+        {"haus": noun}, {"mitteilen": verb},
+    )
+
+    assert haus.display_word == "precomputed" and haus.article == "das"
+    assert mitteilen.conjugations["participle"] == "mitgeteilt"
+    assert mitteilen.display_word == "mit·teilen"
+
+
+def test_offline_translator_uses_sense_glosses():
+    # kaikki entries have no top-level "definition"; glosses live in senses
+    haeuser = {
+        "word": "Häuser", "pos": "noun",
+        "senses": [{"glosses": ["nominative plural of Haus"], "tags": ["form-of", "plural"],
+                    "form_of": [{"word": "Haus"}]}],
+    }
+    nouns = dict(extract_entry(e)[1:] for e in (HAUS, haeuser))
+    verbs = dict([extract_entry(MITTEILEN)[1:]])
+    assert nouns["häuser"]["definition"] is None
+
+    translator = OfflineDictionaryTranslator(nouns, verbs)
+    assert translator.translate(["haus", "mitteilen", "häuser", "katze"], "de", "en") == {
+        "haus": "house",
+        "mitteilen": "to inform, communicate",
+    }
+
+
+if __name__ == "__main__":
+    test_noun_article_plural_and_display()
+    test_verb_conjugations_and_display()
+    test_cards_use_precomputed_display()
+    test_offline_translator_uses_sense_glosses()
+    print("ok")